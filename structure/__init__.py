@@ -1,11 +1,34 @@
 # Import all custom classes
 from . import exceptions
-from . import loaders
+from . import generators
+from . import instrumentation
 from . import models
+from . import repositories
+
+# Import necessary libraries
+import importlib
+
+# Subpackages imported on first access, as they import pandas (PEP 562)
+_LAZY_SUBPACKAGES = ('analytics', 'loaders', 'pipelines')
 
 # Define the __all__ variable to control what is imported when using 'from structure import *'
 __all__ = [
+    'analytics',
     'exceptions',
+    'generators',
+    'instrumentation',
     'loaders',
-    'models'
-]
\ No newline at end of file
+    'models',
+    'pipelines',
+    'repositories'
+]
+
+def __getattr__(name: str):
+    """Import a subpackage that needs pandas on first access."""
+    if name not in _LAZY_SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f'.{name}', __name__)
+
+def __dir__():
+    """List the subpackages, loaded or not."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,218 @@
+# Import custom classes
+from ..exceptions.DuplicateRecordError import DuplicateRecordError
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..loaders.SheetCache import SheetCache
+from ..loaders.SheetSchema import SALES_WORKBOOK_SCHEMAS
+from ..models.Price import Price
+from ..models.PriceArray import PriceArray
+from ..models import _columns
+
+# Import necessary libraries
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+# Define the SalesLedger class
+class SalesLedger:
+    """
+    Sales fact table joined to the Clients and Products dimension tables.
+
+    The references of every sale are resolved once with a hash join (one lookup per sale on
+    the index of client and product ids). Sales whose client or product is unknown are kept
+    aside as orphans, and aggregates are computed on the remaining sales with vectorized
+    group-bys over integer cents.
+    """
+    # Dimensions accepted by revenue_by
+    DIMENSIONS = ('state', 'category', 'client', 'product', 'month')
+
+    def __init__(self, sales: pd.DataFrame, clients: pd.DataFrame, products: pd.DataFrame):
+        """
+        Initializes a SalesLedger by joining the sales to their clients and products.
+
+        Identifiers may be given typed (as loaded with SALES_WORKBOOK_SCHEMAS) or as raw text ('C001').
+
+        Args:
+            sales (DataFrame): The Sales sheet.
+            clients (DataFrame): The Clients sheet.
+            products (DataFrame): The Products sheet.
+
+        Raises:
+            DuplicateRecordError: If two clients or two products share an id.
+            ValueError: If a sheet lacks a column used by the ledger.
+        """
+        SalesLedger.__require(sales, ('id_sale', 'sale_date', 'id_client', 'id_product', 'quantity', 'total_sales_value'))
+        SalesLedger.__require(clients, ('id_client', 'city', 'state'))
+        SalesLedger.__require(products, ('id_product', 'category', 'unit_price'))
+        self.__sales = sales
+        self.__clients = clients
+        self.__products = products
+        self.__client_ids = SalesLedger.__ids(sales['id_client'], 'C')
+        self.__product_ids = SalesLedger.__ids(sales['id_product'], 'P')
+        self.__client_rows = SalesLedger.__hash_join(self.__client_ids, clients['id_client'], 'C', 'client')
+        self.__product_rows = SalesLedger.__hash_join(self.__product_ids, products['id_product'], 'P', 'product')
+        self.__joined = (self.__client_rows >= 0) & (self.__product_rows >= 0)
+        self.__cents = SalesLedger.__to_cents(sales['total_sales_value'])
+
+    # ----- Methods -----
+
+    @classmethod
+    def from_workbook(cls, file_path: str, cache: Optional[SheetCache] = None) -> 'SalesLedger':
+        """
+        Loads the Sales, Clients and Products sheets of a workbook, typed by their schemas, and joins them.
+
+        Args:
+            file_path (str): Path to the Excel file.
+            cache (Optional[SheetCache]): Cache of parsed sheets.
+
+        Returns:
+            SalesLedger: The ledger of the workbook.
+
+        Raises:
+            InvalidPathError: If the workbook or a sheet cannot be loaded.
+            DuplicateRecordError: If two clients or two products share an id.
+        """
+        sheets = ExcelDataFrameLoader.load_workbook(file_path, ['Sales', 'Clients', 'Products'],
+                                                    cache=cache, schemas=SALES_WORKBOOK_SCHEMAS)
+        return cls(sheets['Sales'], sheets['Clients'], sheets['Products'])
+
+    def orphans(self) -> pd.DataFrame:
+        """
+        Reports the sales referencing a client or product that does not exist.
+
+        Returns:
+            DataFrame: One line per unresolved reference with the columns 'row', 'field', 'rule' and 'value'.
+        """
+        return _columns.report(self.__sales.index, [
+            ('id_client', 'orphan', self.__client_rows < 0, self.__sales['id_client']),
+            ('id_product', 'orphan', self.__product_rows < 0, self.__sales['id_product']),
+        ])
+
+    def total_mismatches(self, tolerance_cents: int = 0) -> pd.DataFrame:
+        """
+        Reports the joined sales whose total_sales_value differs from unit_price * quantity.
+
+        Both sides are compared in integer cents, so float representation errors do not count as mismatches.
+
+        Args:
+            tolerance_cents (int): Largest accepted difference in cents.
+
+        Returns:
+            DataFrame: One line per mismatch with the columns 'row', 'field', 'rule', 'value' and 'expected'.
+        """
+        expected = self.__expected_cents()
+        failed = self.__joined & ~(np.abs(self.__cents - expected) <= tolerance_cents)
+        report = _columns.report(self.__sales.index, [
+            ('total_sales_value', 'total_mismatch', failed, self.__sales['total_sales_value'])
+        ])
+        report['expected'] = expected[failed] / 100
+        return report
+
+    def total_revenue(self) -> Optional[Price]:
+        """
+        Gets the exact revenue of the joined sales.
+
+        Returns:
+            Optional[Price]: The sum of total_sales_value over the sales with a known client and product,
+                or None when there is none, as for an empty sheet or only orphan sales.
+
+        Raises:
+            InvalidPriceError: If the revenue of the joined sales is not positive.
+        """
+        if not self.__joined.any():
+            return None
+        return Price.from_minor_units(int(self.__cents[self.__joined].sum()))
+
+    def revenue_by(self, dimension: str) -> pd.DataFrame:
+        """
+        Aggregates the joined sales by a dimension.
+
+        Args:
+            dimension (str): One of 'state', 'category', 'client', 'product' or 'month' (of sale_date).
+
+        Returns:
+            DataFrame: Indexed by the dimension values in ascending order, with the columns 'sales',
+                'quantity', 'revenue_cents' (exact) and 'revenue' (in currency units).
+
+        Raises:
+            ValueError: If dimension is not one of DIMENSIONS.
+        """
+        if dimension not in SalesLedger.DIMENSIONS:
+            raise ValueError(f"dimension must be one of {SalesLedger.DIMENSIONS}.")
+        joined = self.__joined
+        facts = pd.DataFrame({
+            dimension: self.__keys(dimension, joined),
+            'quantity': self.__sales['quantity'].to_numpy(dtype=np.int64)[joined],
+            'revenue_cents': self.__cents[joined],
+        })
+        result = facts.groupby(dimension, observed=True, sort=True).agg(
+            sales=('revenue_cents', 'size'), quantity=('quantity', 'sum'), revenue_cents=('revenue_cents', 'sum'))
+        if dimension == 'month':
+            result.index = pd.DatetimeIndex(result.index.to_numpy().astype('datetime64[M]'), name='month')
+        result['revenue'] = result['revenue_cents'] / 100
+        return result
+
+    # ----- Private Methods -----
+
+    def __keys(self, dimension: str, rows):
+        """Return the value of a dimension for the selected sales."""
+        if dimension == 'state':
+            return self.__clients['state'].array.take(self.__client_rows[rows])
+        if dimension == 'category':
+            return self.__products['category'].array.take(self.__product_rows[rows])
+        if dimension == 'client':
+            return self.__client_ids[rows]
+        if dimension == 'product':
+            return self.__product_ids[rows]
+        # Months are grouped as integers (months since 1970), which is faster than grouping dates
+        return self.__sales['sale_date'].to_numpy(dtype='datetime64[ns]')[rows].astype('datetime64[M]').view(np.int64)
+
+    def __expected_cents(self):
+        """Return unit_price * quantity in cents for every sale, 0 when the product is unknown."""
+        unit_cents = SalesLedger.__to_cents(self.__products['unit_price'])
+        if len(unit_cents) == 0:
+            return np.zeros(len(self.__sales), dtype=np.int64)
+        expected = np.where(self.__product_rows >= 0, unit_cents[self.__product_rows], 0)
+        return expected * self.__sales['quantity'].to_numpy(dtype=np.int64)
+
+    @staticmethod
+    def __require(df: pd.DataFrame, columns: tuple):
+        """Raise ValueError when the DataFrame lacks one of the columns."""
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+    @staticmethod
+    def __ids(series: pd.Series, prefix: str):
+        """Return the identifiers of a column as int64, with -1 for malformed ones."""
+        ids, _ = _columns.parse_ids(series, prefix)
+        return ids.fillna(-1).to_numpy(dtype=np.int64)
+
+    @staticmethod
+    def __hash_join(reference_ids, keys: pd.Series, prefix: str, table: str):
+        """Return the row of the dimension table referenced by every fact id, or -1 when not found."""
+        key_ids = SalesLedger.__ids(keys, prefix)
+        rows = np.flatnonzero(key_ids >= 0)
+        index = pd.Index(key_ids[rows])
+        if not index.is_unique:
+            raise DuplicateRecordError(f"The {table} table has duplicate ids: {index[index.duplicated()].unique().tolist()}")
+        found = index.get_indexer(reference_ids)
+        return np.where(found >= 0, rows[np.maximum(found, 0)] if len(rows) else -1, -1)
+
+    @staticmethod
+    def __to_cents(series: pd.Series):
+        """Return a column of amounts as int64 cents, rounded as PriceArray.from_series does, with 0 for missing or infinite values."""
+        values = pd.to_numeric(series, errors='coerce')
+        if values.dtype.kind == 'f':
+            floats = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            values = pd.Series(np.where(np.isfinite(floats), floats, 0.0), index=values.index)
+        return PriceArray._to_cents(values.fillna(0))
+
+    # ----- Dunder Methods -----
+
+    def __len__(self) -> int:
+        """Return the number of sales, orphans included."""
+        return len(self.__sales)
+
+    def __repr__(self) -> str:
+        """Return the official string representation of the SalesLedger object."""
+        return f"SalesLedger({len(self)} sales, {int((~self.__joined).sum())} orphans)"
@@ -0,0 +1,7 @@
+# Import all analytics classes
+from .SalesLedger import SalesLedger
+
+# Define the __all__ variable to control what gets imported with 'from analytics import *'
+__all__ = [
+    'SalesLedger'
+]
@@ -0,0 +1 @@
+# Benchmarks are runnable modules, e.g. 'python -m structure.benchmarks.bulk_construction'
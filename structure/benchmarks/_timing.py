@@ -0,0 +1,19 @@
+# Import necessary libraries
+import gc
+import timeit
+import tracemalloc
+
+def timed(function, *args, repeat: int = 1) -> float:
+    """Call function with args repeat times and return the best wall time, with the gc paused as timeit does."""
+    return min(timeit.Timer(lambda: function(*args)).repeat(repeat=repeat, number=1))
+
+def peak_bytes(function, *args) -> int:
+    """Call function with args once and return the peak of memory traced by tracemalloc during the call."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
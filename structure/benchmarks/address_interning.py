@@ -0,0 +1,33 @@
+# Import custom classes
+from ..models.Address import Address
+
+# Import necessary libraries
+import time
+import tracemalloc
+
+def retained_bytes(build, pairs) -> int:
+    """Build one Address per pair and return the bytes held by the resulting list."""
+    tracemalloc.start()
+    addresses = [build(city, state) for city, state in pairs]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del addresses
+    return size
+
+def main(count: int = 1_000_000, distinct: int = 2_000):
+    """Compare building every Address with sharing interned instances of a few thousand distinct pairs."""
+    states = ['SP', 'RJ', 'MG', 'BA', 'PR', 'RS', 'PE', 'CE']
+    pairs = [(f'Cidade {i % distinct}', states[i % distinct % len(states)]) for i in range(count)]
+    cases = [('Address()', Address), ('Address.intern()', Address.intern)]
+    print(f"{'case':<18}{'addresses':>12}{'seconds':>10}{'bytes/address':>16}")
+    for case, build in cases:
+        # The time is measured outside tracemalloc, which slows allocations down
+        start = time.perf_counter()
+        [build(city, state) for city, state in pairs]
+        elapsed = time.perf_counter() - start
+        size = retained_bytes(build, pairs)
+        print(f"{case:<18}{count:>12}{elapsed:>10.3f}{size / count:>16.1f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# Import custom classes
+from ..models.Email import Email
+from ..models.Price import Price
+from ..models.Client import Client
+from ..models.Address import Address
+from ..models.Product import Product
+from ._timing import timed
+
+# Import necessary libraries
+import pandas as pd
+
+def build_clients_row_by_row(df: pd.DataFrame, valid_domains) -> int:
+    """Build one Client per row with the validating constructors and return how many were accepted."""
+    accepted = 0
+    for id_client, name, surname, email, city, state in zip(
+            df['id_client'], df['name'], df['surname'], df['email'], df['city'], df['state']):
+        try:
+            Client(int(id_client[1:]), name, surname, Email(email, valid_domains), Address(city, state))
+            accepted += 1
+        except Exception:
+            pass
+    return accepted
+
+def build_products_row_by_row(df: pd.DataFrame) -> int:
+    """Build one Product per row with the validating constructors and return how many were accepted."""
+    accepted = 0
+    for id_product, name, category, unit_price, stock in zip(
+            df['id_product'], df['name_product'], df['category'], df['unit_price'], df['stock']):
+        try:
+            Product(int(id_product[1:]), name, category, Price(str(unit_price)), int(stock))
+            accepted += 1
+        except Exception:
+            pass
+    return accepted
+
+def main(rows: int = 100_000):
+    """Compare row-by-row and column-wise construction of the Clients and Products sheets."""
+    clients = pd.DataFrame({
+        'id_client': [f'C{i:07d}' for i in range(1, rows + 1)],
+        'name': ['Ana', 'Bruno', 'Carla', 'Daniel'] * (rows // 4),
+        'surname': ['Silva', 'Costa', 'Melo', 'Almeida'] * (rows // 4),
+        'email': ['ana@email.com', 'bruno@email.com', 'carla@email.com', 'daniel@email.com'] * (rows // 4),
+        'city': ['São Paulo', 'Rio de Janeiro', 'Recife', 'Manaus'] * (rows // 4),
+        'state': ['SP', 'RJ', 'PE', 'AM'] * (rows // 4),
+    })
+    products = pd.DataFrame({
+        'id_product': [f'P{i:07d}' for i in range(1, rows + 1)],
+        'name_product': ['Smartphone Alpha', 'Notebook Pro', 'Fone Wave', 'Mouse Go'] * (rows // 4),
+        'category': ['Celulares', 'Notebooks', 'Acessórios', 'Periféricos'] * (rows // 4),
+        'unit_price': [2999.9, 7499.0, 349.5, 89.99] * (rows // 4),
+        'stock': [50, 25, 150, 0] * (rows // 4),
+    })
+    domains = ['email.com']
+    results = [
+        ('Client', timed(build_clients_row_by_row, clients, domains, repeat=3),
+         timed(lambda: Client.from_dataframe(clients, domains), repeat=3)),
+        ('Product', timed(build_products_row_by_row, products, repeat=3),
+         timed(lambda: Product.from_dataframe(products), repeat=3)),
+    ]
+    print(f"{'model':<10}{'rows':>10}{'row by row (s)':>18}{'from_dataframe (s)':>22}{'speedup':>10}")
+    for model, scalar, bulk in results:
+        print(f"{model:<10}{rows:>10}{scalar:>18.3f}{bulk:>22.3f}{scalar / bulk:>9.1f}x")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
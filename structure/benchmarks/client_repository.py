@@ -0,0 +1,46 @@
+# Import custom classes
+from ..models.Address import Address
+from ..models.Client import Client
+from ..models.Email import Email
+from ..models.EmailPolicy import DEFAULT_EMAIL_POLICY
+from ..repositories.ClientRepository import ClientRepository
+from ._timing import timed
+
+# Import necessary libraries
+import random
+
+def synthetic_clients(count: int, seed: int = 42) -> list:
+    """Build count valid clients spread over a few thousand cities."""
+    rng = random.Random(seed)
+    states = ['SP', 'RJ', 'MG', 'BA', 'PR', 'RS', 'PE', 'CE']
+    return [
+        Client._from_valid(i, 'Ana', 'Silva', Email._from_valid(f'client{i}@gmail.com', DEFAULT_EMAIL_POLICY),
+                           Address.intern(f'Cidade {rng.randrange(2_000)}', rng.choice(states)))
+        for i in range(1, count + 1)
+    ]
+
+def main(count: int = 1_000_000, lookups: int = 100_000, scans: int = 5):
+    """Compare repository lookups with linear scans over a list of count clients."""
+    clients = synthetic_clients(count)
+    repository = ClientRepository()
+    rng = random.Random(7)
+    ids = [rng.randint(1, count) for _ in range(lookups)]
+    emails = [f'client{i}@gmail.com' for i in ids]
+    # Linear scans are timed on a few lookups and reported per lookup
+    scan_ids = ids[:scans]
+    results = [
+        ('add_many', 1, timed(repository.add_many, clients)),
+        ('get by id', lookups, timed(lambda: [repository.get(i) for i in ids])),
+        ('scan by id', scans, timed(lambda: [next(c for c in clients if c.id_client_int == i) for i in scan_ids])),
+        ('find_by_email', lookups, timed(lambda: [repository.find_by_email(e) for e in emails])),
+        ('find_by_state', 1, timed(repository.find_by_state, 'PE')),
+        ('scan by state', 1, timed(lambda: [c for c in clients if c.address.state == 'PE'])),
+        ('find_by_city', 1, timed(repository.find_by_city, 'Cidade 7')),
+    ]
+    print(f"{'operation':<16}{'calls':>10}{'seconds':>10}{'us/call':>14}")
+    for operation, calls, elapsed in results:
+        print(f"{operation:<16}{calls:>10}{elapsed:>10.3f}{elapsed / calls * 1e6:>14,.1f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
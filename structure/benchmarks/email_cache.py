@@ -0,0 +1,42 @@
+# Import custom classes
+from ..exceptions.InvalidEmailError import InvalidEmailError
+from ..models.Email import Email
+
+# Import necessary libraries
+import itertools
+import random
+import time
+
+def workload(count: int, distinct: int, invalid: float = 0.05, skew: float = 1.1, seed: int = 42) -> list:
+    """Draw count addresses among distinct ones with Zipf-like popularity, a share of them invalid."""
+    rng = random.Random(seed)
+    addresses = [f'client{i}@{"gmail.com" if rng.random() >= invalid else "unknown.com"}' for i in range(distinct)]
+    weights = list(itertools.accumulate(1 / (rank + 1) ** skew for rank in range(distinct)))
+    return rng.choices(addresses, cum_weights=weights, k=count)
+
+def validate(build, addresses: list) -> float:
+    """Build an Email of every address, skipping invalid ones, and return the elapsed time."""
+    start = time.perf_counter()
+    for address in addresses:
+        try:
+            build(address)
+        except InvalidEmailError:
+            pass
+    return time.perf_counter() - start
+
+def main(count: int = 1_000_000, distinct: int = 100_000, sizes=(65_536, 4_096)):
+    """Compare building every Email with Email.cached on a skewed workload, for several cache sizes."""
+    addresses = workload(count, distinct)
+    baseline = validate(Email, addresses)
+    print(f"{'case':<22}{'emails':>10}{'seconds':>10}{'speedup':>9}{'hit rate':>10}{'evictions':>11}")
+    print(f"{'Email()':<22}{count:>10}{baseline:>10.3f}{1:>9.2f}{'-':>10}{'-':>11}")
+    for maxsize in sizes:
+        Email.cache_clear(maxsize)
+        elapsed = validate(Email.cached, addresses)
+        info = Email.cache_info()
+        print(f"{f'Email.cached({maxsize})':<22}{count:>10}{elapsed:>10.3f}{baseline / elapsed:>9.2f}"
+              f"{info.hit_rate:>10.1%}{info.evictions:>11}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
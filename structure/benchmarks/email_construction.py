@@ -0,0 +1,28 @@
+# Import custom classes
+from ..models.Email import Email
+
+# Import necessary libraries
+import time
+
+def construct(count: int, valid_domains=None) -> float:
+    """Build count Email objects, reading their username and domain, and return the elapsed time."""
+    start = time.perf_counter()
+    for _ in range(count):
+        email = Email('ana.silva@gmail.com', valid_domains)
+        email.username
+        email.domain
+    return time.perf_counter() - start
+
+def main(count: int = 1_000_000):
+    """Measure Email construction with the default policy and with an interned custom domain list."""
+    results = [
+        ('default policy', construct(count)),
+        ('custom domains', construct(count, ['gmail.com', 'email.com'])),
+    ]
+    print(f"{'case':<16}{'emails':>12}{'seconds':>10}{'emails/s':>14}")
+    for case, elapsed in results:
+        print(f"{case:<16}{count:>12}{elapsed:>10.3f}{count / elapsed:>14,.0f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+# Import custom classes
+from ..instrumentation.Instrumentation import Instrumentation, stage
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..loaders.SheetSchema import SALES_WORKBOOK_SCHEMAS
+from ._timing import timed
+
+# Import necessary libraries
+import os
+
+# Sample workbook shipped with the project
+file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
+
+def empty_stages(count: int):
+    """Open and close count stages doing nothing."""
+    for _ in range(count):
+        with stage('parse', 'Sales'):
+            pass
+
+def load():
+    """Load every sheet of the sample workbook with its schema."""
+    ExcelDataFrameLoader.load_workbook(file_path, ['Clients', 'Products', 'Sales'], schemas=SALES_WORKBOOK_SCHEMAS)
+
+def enabled(function, *args, trace_memory: bool = False):
+    """Call function with args inside an instrumentation."""
+    with Instrumentation(trace_memory=trace_memory):
+        function(*args)
+
+def main(count: int = 1_000_000):
+    """Compare the cost of stages and of loading the sample workbook with instrumentation disabled and enabled."""
+    results = [
+        ('stage, disabled', count, timed(empty_stages, count, repeat=3)),
+        ('stage, enabled', count, timed(enabled, empty_stages, count, repeat=3)),
+        ('load, disabled', 1, timed(load, repeat=5)),
+        ('load, enabled', 1, timed(enabled, load, repeat=5)),
+        ('load, traced', 1, timed(lambda: enabled(load, trace_memory=True), repeat=5)),
+    ]
+    print(f"{'case':<18}{'calls':>10}{'seconds':>10}{'us/call':>14}")
+    for case, calls, elapsed in results:
+        print(f"{case:<18}{calls:>10}{elapsed:>10.3f}{elapsed / calls * 1e6:>14,.2f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
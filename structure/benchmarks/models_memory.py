@@ -0,0 +1,65 @@
+# Import custom classes
+from ..models.Email import Email
+from ..models.Price import Price
+from ..models.Client import Client
+from ..models.Address import Address
+from ..models.Product import Product
+
+# Import necessary libraries
+import tracemalloc
+
+# Reference class of each model, keeping its attributes in a __dict__ as the models did before
+# __slots__. One class per model, so every class shares the keys of its own instance dicts.
+_REFERENCES = {}
+
+def unslotted(instance, **extra):
+    """Copy the slot values of a model instance, plus extra attributes, into an instance of its reference class."""
+    model = type(instance)
+    if model not in _REFERENCES:
+        _REFERENCES[model] = type(f'Unslotted{model.__name__}', (), {})
+    reference = _REFERENCES[model]()
+    for cls in type(instance).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            attribute = f'_{cls.__name__}{name}' if name.startswith('__') else name
+            if hasattr(instance, attribute):
+                setattr(reference, attribute, getattr(instance, attribute))
+    for attribute, value in extra.items():
+        setattr(reference, attribute, value)
+    return reference
+
+def bytes_per_instance(build, count: int) -> float:
+    """Return the memory traced while building count instances, divided by count."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [build(i) for i in range(1, count + 1)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list itself holds one pointer per instance
+    return (after - before) / count - 8 if instances else 0.0
+
+def main(count: int = 100_000):
+    """Report the bytes held by one instance of each model, before and after __slots__, excluding the shared objects it references."""
+    # Values shared by every instance, so only the model objects themselves are measured
+    email = Email('ana.silva@gmail.com')
+    address = Address('São Paulo', 'SP')
+    price = Price('19.99')
+    # Builders of the slotted models and of their unslotted layout: the same attributes in a
+    # __dict__, with the prefixed id of Clients and Products stored next to the integer one
+    cases = [
+        ('Address', lambda i: Address('São Paulo', 'SP'), lambda i: unslotted(Address('São Paulo', 'SP'))),
+        ('Email', lambda i: Email('ana.silva@gmail.com'), lambda i: unslotted(Email('ana.silva@gmail.com'))),
+        ('Price', lambda i: Price('19.99'), lambda i: unslotted(Price('19.99'))),
+        ('Client', lambda i: Client(i, 'Ana', 'Silva', email, address),
+         lambda i: unslotted(Client(i, 'Ana', 'Silva', email, address), _Client__id_client_text=f'C{i}')),
+        ('Product', lambda i: Product(i, 'Smartphone Alpha', 'Celulares', price, 50),
+         lambda i: unslotted(Product(i, 'Smartphone Alpha', 'Celulares', price, 50), _Product__id_product_text=f'P{i}')),
+    ]
+    print(f"{'model':<10}{'unslotted (B)':>15}{'slotted (B)':>13}{'saved':>8}")
+    for model, build, reference in cases:
+        before = bytes_per_instance(reference, count)
+        after = bytes_per_instance(build, count)
+        print(f"{model:<10}{before:>15.1f}{after:>13.1f}{1 - after / before:>8.0%}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
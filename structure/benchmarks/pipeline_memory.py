@@ -0,0 +1,25 @@
+# Import custom classes
+from ..generators.WorkbookGenerator import WorkbookGenerator
+from ..pipelines.WorkbookPipeline import WorkbookPipeline
+from ._timing import peak_bytes, timed
+
+# Import necessary libraries
+import os
+import tempfile
+
+def main(sizes=(10_000, 50_000, 200_000), chunksize=10_000):
+    """Measure the time and peak memory of streaming workbooks of growing Sales sheets through the pipeline."""
+    generator = WorkbookGenerator(clients=10_000, products=1_000, invalid={'pattern': 0.02, 'orphan': 0.01})
+    print(f"{'sales':>10}{'seconds':>10}{'rows/s':>12}{'peak MB':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        pipeline = WorkbookPipeline(os.path.join(directory, 'output'), 'jsonl', chunksize)
+        for sales in sizes:
+            path = os.path.join(directory, f'sales_{sales}.xlsx')
+            generator.write(path, sales)
+            elapsed = timed(pipeline.process, path)
+            peak = peak_bytes(pipeline.process, path)
+            print(f"{sales:>10}{elapsed:>10.2f}{sales / elapsed:>12,.0f}{peak / 2 ** 20:>10.1f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+# Import custom classes
+from ..models.Price import Price
+from ..models.PriceArray import PriceArray
+from ._timing import timed
+
+# Import necessary libraries
+import random
+
+def sample(count: int, seed: int = 42) -> list:
+    """Build count prices between 0.01 and 10000.00 with a fixed seed."""
+    rng = random.Random(seed)
+    return [Price(f'{rng.randint(1, 1_000_000) / 100:.2f}') for _ in range(count)]
+
+def total(prices: list) -> Price:
+    """Add every price one by one, as a running sale total does."""
+    result = prices[0]
+    for price in prices[1:]:
+        result = result + price
+    return result
+
+def main(count: int = 1_000_000):
+    """Measure summing, sorting and hashing count Price objects, and the same on a PriceArray."""
+    prices = sample(count)
+    array = PriceArray.from_prices(prices)
+    results = [
+        ('sum', timed(total, prices)),
+        ('sort', timed(sorted, prices)),
+        ('set', timed(set, prices)),
+        ('array sum', timed(array.sum)),
+        ('array sort', timed(array.argsort)),
+    ]
+    print(f"{'operation':<12}{'prices':>12}{'seconds':>10}")
+    for operation, elapsed in results:
+        print(f"{operation:<12}{count:>12}{elapsed:>10.3f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
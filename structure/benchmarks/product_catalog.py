@@ -0,0 +1,41 @@
+# Import custom classes
+from ..models.Price import Price
+from ..models.Product import Product
+from ..repositories.ProductCatalog import ProductCatalog
+from ._timing import timed
+
+# Import necessary libraries
+import random
+
+def synthetic_products(count: int, categories: int = 20, seed: int = 42) -> list:
+    """Build count valid products spread over a few categories."""
+    rng = random.Random(seed)
+    return [
+        Product._from_valid(i, f'Produto {i}', f'Categoria {rng.randrange(categories)}',
+                            Price._from_units(rng.randint(100, 1_000_000), -2), rng.randint(0, 50))
+        for i in range(1, count + 1)
+    ]
+
+def main(count: int = 1_000_000, queries: int = 1_000):
+    """Compare catalog range and cheapest-N queries with linear scans over count products."""
+    products = synthetic_products(count)
+    catalog = ProductCatalog()
+    low, high = Price('100.00'), Price('101.00')
+    scan_range = lambda: [p for p in products if p.category == 'Categoria 3' and low <= p.price <= high]
+    scan_cheapest = lambda: sorted((p for p in products if p.category == 'Categoria 3'),
+                                   key=lambda p: (p.price, p.id_product_int))[:10]
+    results = [
+        ('add_many', 1, timed(catalog.add_many, products)),
+        ('price_range', queries, timed(lambda: [catalog.price_range('Categoria 3', low, high) for _ in range(queries)])),
+        ('scan range', 1, timed(scan_range)),
+        ('cheapest 10', queries, timed(lambda: [catalog.cheapest('Categoria 3', 10) for _ in range(queries)])),
+        ('scan cheapest', 1, timed(scan_cheapest)),
+        ('update_price', queries, timed(lambda: [catalog.update_price(i, Price('55.55')) for i in range(1, queries + 1)])),
+    ]
+    print(f"{'operation':<16}{'calls':>10}{'seconds':>10}{'us/call':>14}")
+    for operation, calls, elapsed in results:
+        print(f"{operation:<16}{calls:>10}{elapsed:>10.3f}{elapsed / calls * 1e6:>14,.1f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# Import custom classes
+from ..analytics.SalesLedger import SalesLedger
+from ._timing import timed
+
+# Import necessary libraries
+import numpy as np
+import pandas as pd
+import time
+
+def synthetic_tables(sales: int, clients: int = 100_000, products: int = 10_000, seed: int = 42):
+    """Build typed Sales, Clients and Products tables as loaded with SALES_WORKBOOK_SCHEMAS."""
+    rng = np.random.default_rng(seed)
+    states = ['SP', 'RJ', 'MG', 'BA', 'PR', 'RS', 'PE', 'CE']
+    categories = ['Celulares', 'Notebooks', 'Acessórios', 'Televisores', 'Periféricos']
+    df_clients = pd.DataFrame({
+        'id_client': np.arange(1, clients + 1, dtype=np.int32),
+        'city': pd.Categorical(rng.integers(0, 2_000, clients).astype(str)),
+        'state': pd.Categorical(rng.choice(states, clients)),
+    })
+    unit_cents = rng.integers(100, 1_000_000, products)
+    df_products = pd.DataFrame({
+        'id_product': np.arange(1, products + 1, dtype=np.int32),
+        'category': pd.Categorical(rng.choice(categories, products)),
+        'unit_price': unit_cents / 100,
+    })
+    id_product = rng.integers(1, products + 1, sales).astype(np.int32)
+    quantity = rng.integers(1, 5, sales).astype(np.int32)
+    df_sales = pd.DataFrame({
+        'id_sale': np.arange(1, sales + 1, dtype=np.int32),
+        'sale_date': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 365, sales), unit='D'),
+        'id_client': rng.integers(1, clients + 1, sales).astype(np.int32),
+        'id_product': id_product,
+        'quantity': quantity,
+        'total_sales_value': unit_cents[id_product - 1] * quantity / 100,
+    })
+    return df_sales, df_clients, df_products
+
+def main(count: int = 10_000_000):
+    """Measure joining, validating and aggregating count sales."""
+    tables = synthetic_tables(count)
+    start = time.perf_counter()
+    ledger = SalesLedger(*tables)
+    results = [('join', time.perf_counter() - start),
+               ('orphans', timed(ledger.orphans)),
+               ('total_mismatches', timed(ledger.total_mismatches))]
+    results += [(f'revenue_by {dimension}', timed(ledger.revenue_by, dimension)) for dimension in SalesLedger.DIMENSIONS]
+    print(f"{'operation':<22}{'sales':>12}{'seconds':>10}")
+    for operation, elapsed in results:
+        print(f"{operation:<22}{count:>12}{elapsed:>10.3f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+# Import custom classes
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..loaders.SheetSchema import SALES_SCHEMA
+from ..models.Address import Address
+from ..models.Client import Client
+from ..models.Email import Email
+from ..models.Price import Price
+from ..models.PriceArray import PriceArray
+from ..models.Product import Product
+from ..generators.WorkbookGenerator import WorkbookGenerator
+from ._timing import peak_bytes, timed
+
+# Import necessary libraries
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, NamedTuple, Optional
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import numpy as np
+import openpyxl
+import pandas as pd
+
+# Sizes of the synthetic Sales sheets loaded by the suite
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+# Number of objects built or validated by the model cases
+MODEL_COUNT = 100_000
+# Relative slowdown (or memory growth) above which a case is flagged as a regression
+DEFAULT_THRESHOLD = 0.10
+# Directory where the synthetic workbooks are kept between runs
+WORKBOOK_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'processed', 'benchmarks')
+
+class Case(NamedTuple):
+    """A measured operation: count items processed by one call of run, with its peak memory when traced."""
+    name: str
+    count: int
+    run: Callable
+    memory: bool = False
+    repeat: Optional[int] = None
+
+# ----- Synthetic data -----
+
+def synthetic_workbook(rows: int, seed: int = 42, directory: str = WORKBOOK_DIR) -> str:
+    """Write a sales workbook whose Sales sheet has rows rows, reusing the file of a previous run."""
+    path = os.path.join(directory, f'workbook_{rows}_{seed}.xlsx')
+    if not os.path.exists(path):
+        WorkbookGenerator(seed=seed).write(path, rows)
+    return path
+
+# ----- Cases -----
+
+def model_cases(count: int = MODEL_COUNT, seed: int = 42) -> List[Case]:
+    """Build the construction, validation and Price arithmetic cases on count objects."""
+    rng = random.Random(seed)
+    email = Email('ana.silva@gmail.com')
+    address = Address('São Paulo', 'SP')
+    price = Price('19.99')
+    # About one client in ten has a malformed email, so the validation cases reject some rows
+    sheets = WorkbookGenerator(clients=count, products=count, seed=seed, invalid={'pattern': 0.1}).dataframes(0)
+    clients, products = sheets['Clients'], sheets['Products']
+    addresses = [f'ana.silva{i}@{"gmail.com" if i % 10 else "gmail"}' for i in range(count)]
+    amounts = [f'{rng.randint(1, 1_000_000) / 100:.2f}' for _ in range(count)]
+    prices = [Price(amount) for amount in amounts]
+    array = PriceArray.from_prices(prices)
+
+    def running_total():
+        result = prices[0]
+        for item in prices[1:]:
+            result = result + item
+        return result
+
+    return [
+        Case('construct Address', count, lambda: [Address('São Paulo', 'SP') for _ in range(count)]),
+        Case('construct Email', count, lambda: [Email('ana.silva@gmail.com') for _ in range(count)]),
+        Case('construct Price', count, lambda: [Price(amount) for amount in amounts]),
+        Case('construct Client', count, lambda: [Client(i, 'Ana', 'Silva', email, address) for i in range(1, count + 1)]),
+        Case('construct Product', count,
+             lambda: [Product(i, 'Smartphone Alpha', 'Celulares', price, 50) for i in range(1, count + 1)]),
+        Case('Client.from_dataframe', count, lambda: Client.from_dataframe(clients), memory=True),
+        Case('Product.from_dataframe', count, lambda: Product.from_dataframe(products), memory=True),
+        Case('Email.validate', count, lambda: [Email.validate(value) for value in addresses]),
+        Case('Email.validate_series', count, lambda: Email.validate_series(clients['email'])),
+        Case('Price add', count, running_total),
+        Case('Price sort', count, lambda: sorted(prices)),
+        Case('PriceArray.from_prices', count, lambda: PriceArray.from_prices(prices)),
+        Case('PriceArray.sum', count, array.sum),
+    ]
+
+def load_cases(sizes=DEFAULT_SIZES, seed: int = 42) -> List[Case]:
+    """Build the load_data cases on the Sales sheet of a synthetic workbook of each size."""
+    cases = []
+    for rows in sizes:
+        path = synthetic_workbook(rows, seed)
+        # A single run of the largest sheets, whose duration dwarfs their noise
+        repeat = 1 if rows >= 1_000_000 else None
+        cases += [
+            Case(f'load_data {rows}', rows, lambda path=path: ExcelDataFrameLoader.load_data(path, 'Sales'),
+                 memory=True, repeat=repeat),
+            Case(f'load_data schema {rows}', rows,
+                 lambda path=path: ExcelDataFrameLoader.load_data(path, 'Sales', schema=SALES_SCHEMA),
+                 memory=True, repeat=repeat),
+        ]
+    return cases
+
+# ----- Running and comparing -----
+
+def run(cases: List[Case], repeat: int = 3) -> Dict[str, dict]:
+    """
+    Measure every case: best wall time of repeat runs, throughput and, for traced cases, peak memory.
+
+    Memory is traced on a separate run, since tracemalloc slows allocations down.
+    """
+    results = {}
+    for case in cases:
+        seconds = timed(case.run, repeat=case.repeat or repeat)
+        result = {'count': case.count, 'seconds': seconds, 'per_second': case.count / seconds if seconds else None}
+        if case.memory:
+            result['peak_bytes'] = peak_bytes(case.run)
+        results[case.name] = result
+        print(f"{case.name:<28}{case.count:>10}{seconds:>10.3f}{result['per_second']:>14,.0f}", file=sys.stderr)
+    return results
+
+def environment(seed: int, repeat: int) -> dict:
+    """Describe the machine and library versions the results were measured with."""
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'openpyxl': openpyxl.__version__,
+        'seed': seed,
+        'repeat': repeat,
+    }
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float = DEFAULT_THRESHOLD) -> List[dict]:
+    """
+    Compare results with a baseline of the same format.
+
+    Args:
+        results (dict): Mapping of case names to their measures, as returned by run.
+        baseline (dict): Measures of a previous run.
+        threshold (float): Relative increase of seconds or peak_bytes above which a case regressed.
+
+    Returns:
+        list: One dict per measure of a case present in both runs, with the keys 'case', 'metric',
+            'baseline', 'current', 'change' (relative) and 'regression'.
+    """
+    rows = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            if metric in current and previous.get(metric):
+                change = current[metric] / previous[metric] - 1
+                rows.append({'case': name, 'metric': metric, 'baseline': previous[metric], 'current': current[metric],
+                             'change': change, 'regression': change > threshold})
+    return rows
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite, write its results as JSON and, with --baseline, exit with 1 when a case regressed."""
+    parser = argparse.ArgumentParser(prog='python -m structure.benchmarks.suite',
+                                     description='Measure model construction, validation, Price arithmetic and loading.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='rows of the loaded Sales sheets')
+    parser.add_argument('--count', type=int, default=MODEL_COUNT, help='objects per model case')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per case, the best one is kept')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', help='regular expression selecting the cases to run')
+    parser.add_argument('--output', help='JSON file receiving the results (default is standard output)')
+    parser.add_argument('--baseline', help='JSON file of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative increase flagged as a regression (default is 0.10)')
+    args = parser.parse_args(argv)
+
+    cases = model_cases(args.count, args.seed) + load_cases(args.sizes, args.seed)
+    if args.only:
+        cases = [case for case in cases if re.search(args.only, case.name)]
+    report = {'environment': environment(args.seed, args.repeat), 'results': run(cases, args.repeat)}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)['results']
+    rows = compare(report['results'], baseline, args.threshold)
+    print(f"{'case':<28}{'metric':<12}{'baseline':>14}{'current':>14}{'change':>9}", file=sys.stderr)
+    for row in rows:
+        flag = '  REGRESSION' if row['regression'] else ''
+        print(f"{row['case']:<28}{row['metric']:<12}{row['baseline']:>14.4g}{row['current']:>14.4g}"
+              f"{row['change']:>+9.1%}{flag}", file=sys.stderr)
+    return 1 if any(row['regression'] for row in rows) else 0
+
+# Execute the benchmark
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+# Import custom classes
+from ..models.Email import Email
+from ..models.Client import Client
+from ..models.Address import Address
+from ._timing import timed
+
+# Import necessary libraries
+import random
+import pandas as pd
+
+def dirty_clients(count: int, bad_fraction: float = 0.3, seed: int = 42) -> pd.DataFrame:
+    """Build a Clients sheet where bad_fraction of the rows break one or more rules."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(1, count + 1):
+        row = {'id_client': f'C{i:06d}', 'name': 'Ana', 'surname': 'Silva',
+               'email': f'ana{i}@gmail.com', 'city': 'Recife', 'state': 'PE'}
+        if rng.random() < bad_fraction:
+            for field, value in rng.sample([('id_client', 'X1'), ('name', ' '), ('email', 'ana@email.com'),
+                                            ('state', 'ZZ')], rng.randint(1, 3)):
+                row[field] = value
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+def first_error_with_exceptions(records: list) -> int:
+    """Build every record with the raising setters, keeping only the first error of each row."""
+    errors = 0
+    for record in records:
+        try:
+            id_client = record['id_client']
+            if not (id_client[:1] == 'C' and id_client[1:].isdigit()):
+                raise ValueError(id_client)
+            Client(int(id_client[1:]), record['name'], record['surname'], Email(record['email']),
+                   Address(record['city'], record['state']))
+        except Exception:
+            errors += 1
+    return errors
+
+def every_error_with_validate(records: list) -> int:
+    """Validate every record without raising, collecting every violation."""
+    return sum(len(Client.validate(record)) for record in records)
+
+def main(count: int = 100_000):
+    """Compare exception-based validation with Client.validate and Client.validate_dataframe on a dirty sheet."""
+    df = dirty_clients(count)
+    records = df.to_dict('records')
+    results = [
+        ('setters + except', timed(first_error_with_exceptions, records)),
+        ('Client.validate', timed(every_error_with_validate, records)),
+        ('validate_dataframe', timed(Client.validate_dataframe, df)),
+    ]
+    print(f"{'case':<20}{'rows':>10}{'seconds':>10}{'rows/s':>14}")
+    for case, elapsed in results:
+        print(f"{case:<20}{count:>10}{elapsed:>10.3f}{count / elapsed:>14,.0f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
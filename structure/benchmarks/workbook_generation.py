@@ -0,0 +1,22 @@
+# Import custom classes
+from ..generators.WorkbookGenerator import WorkbookGenerator
+from ._timing import peak_bytes, timed
+
+# Import necessary libraries
+import os
+import tempfile
+
+def main(sizes=(10_000, 100_000, 1_000_000)):
+    """Measure the time and peak memory of writing workbooks of growing Sales sheets."""
+    generator = WorkbookGenerator(clients=10_000, products=1_000, invalid={'pattern': 0.02, 'orphan': 0.01})
+    print(f"{'sales':>10}{'seconds':>10}{'rows/s':>12}{'peak MB':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'sales.xlsx')
+        for sales in sizes:
+            elapsed = timed(generator.write, path, sales)
+            peak = peak_bytes(generator.write, path, sales)
+            print(f"{sales:>10}{elapsed:>10.2f}{sales / elapsed:>12,.0f}{peak / 2 ** 20:>10.1f}")
+
+# Execute the benchmark
+if __name__ == '__main__':
+    main()
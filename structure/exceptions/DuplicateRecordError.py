@@ -0,0 +1,4 @@
+# Error: Record breaks a uniqueness constraint
+class DuplicateRecordError(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
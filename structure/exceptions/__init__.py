@@ -1,4 +1,5 @@
 # All custom exceptions classes
+from .DuplicateRecordError import DuplicateRecordError
 from .InvalidCategoryError import InvalidCategoryError
 from .InvalidQuantityError import InvalidQuantityError
 from .InvalidAddressError import InvalidAddressError
@@ -12,6 +13,7 @@ from .InvalidIdError import InvalidIdError
 
 # Define the __all__ variable to control what gets imported with 'from exceptions import *'
 __all__ = [
+    'DuplicateRecordError',
     'InvalidCategoryError',
     'InvalidQuantityError',
     'InvalidAddressError',
@@ -0,0 +1,378 @@
+# Import necessary libraries
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple
+import os
+import random
+import unicodedata
+
+# Define the WorkbookGenerator class
+class WorkbookGenerator:
+    """
+    Writes synthetic sales workbooks with the sheets and columns of sales_relatory.xlsx, at any size.
+
+    Clients live in real Brazilian cities weighted by population, products belong to the
+    categories of the sample workbook with their price ranges, and sales follow a Zipf-like
+    popularity of clients and products. A fraction of the rows of each sheet can be made to
+    break a validation rule on purpose, and the same seed always writes the same workbook.
+
+    Workbooks are written with openpyxl in write-only mode: rows are streamed to the file,
+    so memory does not grow with the number of sales.
+    """
+    # Columns of each sheet, in the order of the sample workbook
+    HEADERS: Dict[str, Tuple[str, ...]] = {
+        'Sales': ('id_sale', 'sale_date', 'id_client', 'id_product', 'quantity', 'total_sales_value'),
+        'Clients': ('id_client', 'name', 'surname', 'email', 'city', 'state'),
+        'Products': ('id_product', 'name_product', 'category', 'unit_price', 'stock'),
+    }
+    # Rules that rows of each sheet can break, with the codes of the validation reports
+    RULES: Dict[str, Tuple[str, ...]] = {
+        'Sales': ('format', 'orphan', 'total_mismatch'),
+        'Clients': ('format', 'non_empty_string', 'pattern', 'valid_state'),
+        'Products': ('format', 'non_empty_string', 'numeric', 'positive', 'integer', 'non_negative'),
+    }
+    # Cities with their state and population in thousands, used as sampling weights
+    CITIES: Tuple[Tuple[str, str, int], ...] = (
+        ('São Paulo', 'SP', 11451), ('Rio de Janeiro', 'RJ', 6211), ('Fortaleza', 'CE', 2428),
+        ('Salvador', 'BA', 2418), ('Belo Horizonte', 'MG', 2315), ('Manaus', 'AM', 2063), ('Curitiba', 'PR', 1773), ('Recife', 'PE', 1488), ('Goiânia', 'GO', 1437),
+        ('Porto Alegre', 'RS', 1332), ('Belém', 'PA', 1303), ('Guarulhos', 'SP', 1291), ('Campinas', 'SP', 1139),
+        ('São Luís', 'MA', 1037), ('Maceió', 'AL', 957), ('Campo Grande', 'MS', 898), ('São Gonçalo', 'RJ', 896),
+        ('Teresina', 'PI', 866), ('João Pessoa', 'PB', 833), ('São Bernardo do Campo', 'SP', 810),
+        ('Duque de Caxias', 'RJ', 808), ('Nova Iguaçu', 'RJ', 785), ('Natal', 'RN', 751), ('Santo André', 'SP', 748),
+        ('Osasco', 'SP', 728), ('Uberlândia', 'MG', 713), ('Sorocaba', 'SP', 723), ('Ribeirão Preto', 'SP', 698),
+        ('Jaboatão dos Guararapes', 'PE', 643), ('Contagem', 'MG', 621), ('Aracaju', 'SE', 602),
+        ('Feira de Santana', 'BA', 616), ('Cuiabá', 'MT', 650), ('Joinville', 'SC', 616), ('Londrina', 'PR', 555),
+        ('Juiz de Fora', 'MG', 540), ('Florianópolis', 'SC', 537), ('Niterói', 'RJ', 481), ('Porto Velho', 'RO', 460),
+        ('Vitória', 'ES', 322), ('Macapá', 'AP', 442), ('Rio Branco', 'AC', 364), ('Boa Vista', 'RR', 413),
+        ('Palmas', 'TO', 302), ('Caxias do Sul', 'RS', 463), ('Santos', 'SP', 418), ('Campina Grande', 'PB', 419),
+    )
+    # Categories with the product kinds they hold and their price range
+    CATEGORIES: Dict[str, Tuple[Tuple[str, ...], float, float]] = {
+        'Acessórios': (('Capa', 'Carregador', 'Cabo USB-C', 'Suporte'), 29.9, 1200.0),
+        'Armazenamento': (('SSD', 'HD Externo', 'Pendrive', 'Cartão de Memória'), 49.9, 2000.0),
+        'Casa Inteligente': (('Lâmpada Inteligente', 'Tomada Inteligente', 'Assistente de Voz'), 59.9, 1500.0),
+        'Celulares': (('Smartphone',), 899.0, 9500.0),
+        'Componentes de PC': (('Placa de Vídeo', 'Processador', 'Memória RAM', 'Placa-mãe'), 199.9, 8000.0),
+        'Câmeras': (('Câmera', 'Lente', 'Câmera de Ação'), 899.0, 15000.0),
+        'Drones': (('Drone',), 1200.0, 11000.0),
+        'Impressoras': (('Impressora', 'Multifuncional'), 299.0, 2300.0),
+        'Notebooks': (('Notebook', 'Ultrabook'), 2500.0, 17000.0),
+        'Periféricos': (('Teclado Mecânico', 'Mouse', 'Webcam', 'Monitor'), 79.9, 2800.0),
+        'Realidade Virtual': (('Óculos VR', 'Controle VR'), 1500.0, 7000.0),
+        'Redes': (('Roteador', 'Repetidor Wi-Fi', 'Switch'), 99.9, 1800.0),
+        'Tablets': (('Tablet',), 799.0, 5700.0),
+        'Televisores': (('Smart TV', 'Soundbar'), 1200.0, 14500.0),
+        'Wearables': (('Smartwatch', 'Pulseira Fitness'), 199.0, 4000.0),
+        'Áudio': (('Fone de Ouvido', 'Caixa de Som', 'Headset'), 149.9, 4200.0),
+    }
+    BRANDS = ('Alpha', 'Beta', 'Quantum', 'Aero', 'Pinnacle', 'Orion', 'Volt', 'Apex', 'Fusion', 'Titan', 'Wave', 'Nova')
+    MODELS = ('', ' Pro', ' Max', ' Gamer', ' Air', ' 4K', ' Studio', ' RGB', ' Lite', ' Ultra')
+    FIRST_NAMES = ('Ana', 'Bruno', 'Carla', 'Daniel', 'Eduarda', 'Felipe', 'Gabriela', 'Henrique', 'Isabela', 'João',
+                   'Larissa', 'Lucas', 'Mariana', 'Mateus', 'Natália', 'Otávio', 'Patrícia', 'Rafael', 'Sofia', 'Thiago',
+                   'Vitória', 'Gustavo', 'Beatriz', 'Pedro', 'Camila', 'Leonardo', 'Júlia', 'Rodrigo', 'Letícia', 'André')
+    SURNAMES = ('Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira', 'Alves', 'Pereira', 'Lima', 'Gomes',
+                'Costa', 'Ribeiro', 'Martins', 'Carvalho', 'Almeida', 'Lopes', 'Soares', 'Fernandes', 'Vieira', 'Barbosa',
+                'Rocha', 'Dias', 'Nascimento', 'Andrade', 'Moreira', 'Nunes', 'Marques', 'Machado', 'Mendes', 'Melo')
+    DOMAINS = ('gmail.com', 'outlook.com', 'hotmail.com')
+    # Number of rows drawn at once from the random generator
+    CHUNK = 10_000
+
+    def __init__(self, clients: int = 1_000, products: int = 200, seed: int = 42,
+                 invalid: Optional[Dict[str, float]] = None, skew: float = 1.0):
+        """
+        Initializes a WorkbookGenerator.
+
+        Args:
+            clients (int): Number of rows of the Clients sheet.
+            products (int): Number of rows of the Products sheet.
+            seed (int): Seed of every random choice.
+            invalid (Optional[Dict[str, float]]): Fraction of the rows breaking each rule, applied to every
+                sheet listed in RULES for that rule (default is no invalid row). A row breaks at most one rule.
+            skew (float): Exponent of the Zipf-like popularity of clients and products (0 is uniform).
+
+        Raises:
+            ValueError: If a count is not positive, skew is negative, a rule is unknown, a fraction is
+                outside [0, 1] or the fractions of a sheet add up to more than 1.
+        """
+        if not isinstance(clients, int) or not isinstance(products, int) or clients <= 0 or products <= 0:
+            raise ValueError("clients and products must be positive integers.")
+        if skew < 0:
+            raise ValueError("skew must not be negative.")
+        invalid = dict(invalid or {})
+        known = {rule for rules in WorkbookGenerator.RULES.values() for rule in rules}
+        unknown = set(invalid) - known
+        if unknown:
+            raise ValueError(f"Unknown rules: {sorted(unknown)}. Valid rules are {sorted(known)}.")
+        if not all(0 <= fraction <= 1 for fraction in invalid.values()):
+            raise ValueError("Every fraction of invalid rows must be between 0 and 1.")
+        for sheet, rules in WorkbookGenerator.RULES.items():
+            if sum(invalid.get(rule, 0) for rule in rules) > 1:
+                raise ValueError(f"The fractions of invalid rows of the {sheet} sheet add up to more than 1.")
+        self.__clients = clients
+        self.__products = products
+        self.__seed = seed
+        self.__invalid = invalid
+        self.__skew = skew
+
+    # ----- Properties -----
+
+    @property
+    def clients(self) -> int:
+        """
+        Gets the number of rows of the Clients sheet.
+
+        Returns:
+            int: The number of clients.
+        """
+        return self.__clients
+
+    @property
+    def products(self) -> int:
+        """
+        Gets the number of rows of the Products sheet.
+
+        Returns:
+            int: The number of products.
+        """
+        return self.__products
+
+    @property
+    def seed(self) -> int:
+        """
+        Gets the seed of the random choices.
+
+        Returns:
+            int: The seed.
+        """
+        return self.__seed
+
+    @property
+    def invalid(self) -> Dict[str, float]:
+        """
+        Gets the fraction of the rows breaking each rule.
+
+        Returns:
+            dict: A copy of the fractions, by rule.
+        """
+        return dict(self.__invalid)
+
+    @property
+    def skew(self) -> float:
+        """
+        Gets the exponent of the popularity of clients and products.
+
+        Returns:
+            float: The skew.
+        """
+        return self.__skew
+
+    # ----- Methods -----
+
+    def client_rows(self) -> Iterator[tuple]:
+        """
+        Generates the rows of the Clients sheet.
+
+        Returns:
+            Iterator[tuple]: One tuple per client, in the order of HEADERS['Clients'].
+        """
+        return (row for row, _ in self.__rows('Clients', self.__clients))
+
+    def product_rows(self) -> Iterator[tuple]:
+        """
+        Generates the rows of the Products sheet.
+
+        Returns:
+            Iterator[tuple]: One tuple per product, in the order of HEADERS['Products'].
+        """
+        return (row for row, _ in self.__rows('Products', self.__products))
+
+    def sales_rows(self, count: int) -> Iterator[tuple]:
+        """
+        Generates the rows of the Sales sheet.
+
+        Sales reference the generated clients and products, whether or not those rows are valid,
+        and their total is the unit price of the product (before any corruption) times the quantity.
+
+        Args:
+            count (int): Number of sales.
+
+        Returns:
+            Iterator[tuple]: One tuple per sale, in the order of HEADERS['Sales'].
+        """
+        return (row for row, _ in self.__rows('Sales', count))
+
+    def dataframes(self, sales: int) -> Dict[str, 'pd.DataFrame']:
+        """
+        Builds the three sheets as DataFrames, as pandas reads them from a written workbook.
+
+        Args:
+            sales (int): Number of sales.
+
+        Returns:
+            dict: Mapping of 'Sales', 'Clients' and 'Products' to their DataFrame.
+        """
+        import pandas as pd
+        counts = {'Sales': sales, 'Clients': self.__clients, 'Products': self.__products}
+        return {sheet: pd.DataFrame([row for row, _ in self.__rows(sheet, counts[sheet])], columns=list(header))
+                for sheet, header in WorkbookGenerator.HEADERS.items()}
+
+    def write(self, file_path: str, sales: int) -> Dict[str, Dict[str, int]]:
+        """
+        Writes a workbook with the Sales, Clients and Products sheets.
+
+        The workbook is written to a temporary file renamed at the end, so an interrupted run never
+        leaves a truncated workbook at file_path.
+
+        Args:
+            file_path (str): Path of the '.xlsx' file to write. Its directory is created if missing.
+            sales (int): Number of rows of the Sales sheet.
+
+        Returns:
+            dict: Number of rows breaking each rule, by sheet, e.g. {'Clients': {'pattern': 12}, ...}.
+
+        Raises:
+            ValueError: If sales is negative or file_path does not end with '.xlsx'.
+        """
+        import openpyxl
+        if not isinstance(sales, int) or sales < 0:
+            raise ValueError("sales must be a non-negative integer.")
+        if not isinstance(file_path, str) or not file_path.endswith('.xlsx'):
+            raise ValueError("File path must be a string ending with '.xlsx'")
+        directory = os.path.dirname(os.path.abspath(file_path))
+        os.makedirs(directory, exist_ok=True)
+        counts = {'Sales': sales, 'Clients': self.__clients, 'Products': self.__products}
+        broken = {sheet: {} for sheet in WorkbookGenerator.HEADERS}
+        workbook = openpyxl.Workbook(write_only=True)
+        for sheet, header in WorkbookGenerator.HEADERS.items():
+            worksheet = workbook.create_sheet(sheet)
+            worksheet.append(header)
+            for row, rule in self.__rows(sheet, counts[sheet]):
+                worksheet.append(row)
+                if rule is not None:
+                    broken[sheet][rule] = broken[sheet].get(rule, 0) + 1
+        temporary = file_path + '.tmp'
+        try:
+            workbook.save(temporary)
+            os.replace(temporary, file_path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        return broken
+
+    # ----- Private Methods -----
+
+    def __random(self, stream: str) -> random.Random:
+        """Return a generator seeded by the seed and a stream name, so every sheet has its own sequence."""
+        return random.Random(f'{self.__seed}:{stream}')
+
+    def __rows(self, sheet: str, count: int) -> Iterator[Tuple[tuple, Optional[str]]]:
+        """Generate the rows of a sheet with the rule each of them breaks, or None."""
+        rules = [rule for rule in WorkbookGenerator.RULES[sheet] if self.__invalid.get(rule, 0) > 0]
+        bounds = list(accumulate(self.__invalid[rule] for rule in rules))
+        corrupter = self.__random(f'{sheet}:invalid')
+        rows = {'Sales': self.__sales, 'Clients': self.__clients_sheet, 'Products': self.__products_sheet}[sheet](count)
+        for number, row in enumerate(rows, start=1):
+            position = bisect_right(bounds, corrupter.random()) if rules else len(rules)
+            if position == len(rules):
+                yield row, None
+            else:
+                yield self.__corrupt(sheet, rules[position], list(row), number, corrupter), rules[position]
+
+    def __clients_sheet(self, count: int) -> Iterator[tuple]:
+        """Generate count valid client rows."""
+        rng = self.__random('Clients')
+        cities = list(accumulate(population for _, _, population in WorkbookGenerator.CITIES))
+        for start in range(1, count + 1, WorkbookGenerator.CHUNK):
+            size = min(WorkbookGenerator.CHUNK, count + 1 - start)
+            places = rng.choices(WorkbookGenerator.CITIES, cum_weights=cities, k=size)
+            for number, (city, state, _) in enumerate(places, start=start):
+                name = rng.choice(WorkbookGenerator.FIRST_NAMES)
+                surname = rng.choice(WorkbookGenerator.SURNAMES)
+                local = WorkbookGenerator.__ascii(f'{name}.{surname}{number}').lower()
+                yield (f'C{number:03d}', name, surname, f'{local}@{rng.choice(WorkbookGenerator.DOMAINS)}', city, state)
+
+    def __products_sheet(self, count: int) -> Iterator[tuple]:
+        """Generate count valid product rows."""
+        rng = self.__random('Products')
+        categories = list(WorkbookGenerator.CATEGORIES.items())
+        for number in range(1, count + 1):
+            category, (kinds, low, high) = rng.choice(categories)
+            name = f'{rng.choice(kinds)} {rng.choice(WorkbookGenerator.BRANDS)}{rng.choice(WorkbookGenerator.MODELS)}'
+            # Prices are spread evenly on a logarithmic scale, so cheap items are as common as expensive ones
+            price = round(low * (high / low) ** rng.random(), 2)
+            stock = 0 if rng.random() < 0.1 else rng.randint(1, 200)
+            yield (f'P{number:03d}', name, category, price, stock)
+
+    def __sales(self, count: int) -> Iterator[tuple]:
+        """Generate count valid sale rows referencing the generated clients and products."""
+        rng = self.__random('Sales')
+        prices = [row[3] for row in self.__products_sheet(self.__products)]
+        clients = self.__popularity(self.__clients, rng)
+        products = self.__popularity(self.__products, rng)
+        # Quantities of the sample workbook: mostly one or two units, rarely up to ten
+        quantities = list(range(1, 11))
+        quantity_weights = list(accumulate((41, 41, 5, 5, 5, 0.7, 0.6, 0.5, 0.5, 0.5)))
+        first_day = datetime(2025, 1, 1)
+        for start in range(1, count + 1, WorkbookGenerator.CHUNK):
+            size = min(WorkbookGenerator.CHUNK, count + 1 - start)
+            chosen_clients = rng.choices(clients[0], cum_weights=clients[1], k=size)
+            chosen_products = rng.choices(products[0], cum_weights=products[1], k=size)
+            chosen_quantities = rng.choices(quantities, cum_weights=quantity_weights, k=size)
+            for number, id_client, id_product, quantity in zip(
+                    range(start, start + size), chosen_clients, chosen_products, chosen_quantities):
+                yield (f'V{number:03d}', first_day + timedelta(days=rng.randrange(365)), f'C{id_client:03d}',
+                       f'P{id_product:03d}', quantity, round(prices[id_product - 1] * quantity, 2))
+
+    def __popularity(self, count: int, rng: random.Random) -> Tuple[List[int], List[float]]:
+        """Return ids 1..count with the cumulative Zipf-like weights of a random ranking of them."""
+        ids = list(range(1, count + 1))
+        ranks = ids[:]
+        rng.shuffle(ranks)
+        return ids, list(accumulate(rank ** -self.__skew for rank in ranks))
+
+    @staticmethod
+    def __corrupt(sheet: str, rule: str, row: list, number: int, rng: random.Random) -> tuple:
+        """Return a copy of a valid row changed to break one rule."""
+        blank = '   '
+        if rule == 'format':
+            # Keys stay unique, so the sheet can still be indexed by its key column
+            row[0] = f'{sheet[0]}-{number}'
+        elif sheet == 'Clients':
+            if rule == 'non_empty_string':
+                row[rng.choice((1, 2, 4))] = blank
+            elif rule == 'pattern':
+                local = row[3].split('@')[0]
+                row[3] = rng.choice((f'{local}@email', f'{local}.gmail.com', f'{local}@yahoo.com.br', f'{local} @gmail.com'))
+            elif rule == 'valid_state':
+                row[5] = rng.choice(('ZZ', 'XX', 'BR', 'São Paulo'))
+        elif sheet == 'Products':
+            if rule == 'non_empty_string':
+                row[rng.choice((1, 2))] = blank
+            elif rule == 'numeric':
+                row[3] = rng.choice(('N/A', 'R$ 10,00', 'grátis'))
+            elif rule == 'positive':
+                row[3] = rng.choice((0, -row[3]))
+            elif rule == 'integer':
+                row[4] = row[4] + 0.5
+            elif rule == 'non_negative':
+                row[4] = -rng.randint(1, 50)
+        elif rule == 'orphan':
+            # Ids beyond the generated ones never match a client or product
+            column, prefix = rng.choice(((2, 'C'), (3, 'P')))
+            row[column] = f'{prefix}{int(row[column][1:]) + 10 ** 9}'
+        elif rule == 'total_mismatch':
+            row[5] = round(row[5] + rng.randint(1, 1000) / 100, 2)
+        return tuple(row)
+
+    @staticmethod
+    def __ascii(text: str) -> str:
+        """Return text without its accents, as accepted in the local part of an email."""
+        return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+
+    # ----- Dunder Methods -----
+
+    def __repr__(self) -> str:
+        """Return the official string representation of the WorkbookGenerator object."""
+        return (f"WorkbookGenerator(clients={self.__clients}, products={self.__products}, seed={self.__seed}, "
+                f"invalid={self.__invalid!r}, skew={self.__skew})")
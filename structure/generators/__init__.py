@@ -0,0 +1,7 @@
+# Import all generator classes
+from .WorkbookGenerator import WorkbookGenerator
+
+# Define the __all__ variable to control what gets imported with 'from generators import *'
+__all__ = [
+    'WorkbookGenerator'
+]
@@ -0,0 +1,346 @@
+# Import necessary libraries
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+import functools
+import json
+import time
+import tracemalloc
+
+# Define the StageStats class
+@dataclass
+class StageStats:
+    """
+    Measures accumulated by every run of a stage on a sheet.
+
+    Attributes:
+        stage (str): Name of the stage ('open', 'parse', 'finalize', 'validate', 'construct'...).
+        sheet (Optional[str]): Sheet the stage worked on, None for workbook-wide stages.
+        calls (int): Number of runs of the stage.
+        wall_seconds (float): Total elapsed time.
+        cpu_seconds (float): Total CPU time of the process.
+        rows (int): Total rows processed.
+        peak_bytes (Optional[int]): Highest memory allocated by one run above what was allocated when it
+            began, None when memory is not traced.
+        failures (Dict[str, int]): Rows failing each rule, keyed by 'field.rule'.
+    """
+    stage: str
+    sheet: Optional[str] = None
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows: int = 0
+    peak_bytes: Optional[int] = None
+    failures: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        """
+        Gets the throughput of the stage.
+
+        Returns:
+            Optional[float]: Rows processed per second of wall time, None when no row was counted.
+        """
+        return self.rows / self.wall_seconds if self.rows and self.wall_seconds else None
+
+    def to_dict(self) -> dict:
+        """
+        Converts the measures to a JSON-serializable dict.
+
+        Returns:
+            dict: The attributes and rows_per_second.
+        """
+        return {'stage': self.stage, 'sheet': self.sheet, 'calls': self.calls, 'wall_seconds': self.wall_seconds,
+                'cpu_seconds': self.cpu_seconds, 'rows': self.rows, 'rows_per_second': self.rows_per_second,
+                'peak_bytes': self.peak_bytes, 'failures': dict(self.failures)}
+
+# Define the Instrumentation class
+class Instrumentation:
+    """
+    Collects per-stage timings, row rates, validation failures and memory peaks of a run.
+
+    Instrumentation is enabled for the code running inside 'with Instrumentation() as run:'.
+    The loaders and bulk constructors open stages with the module function stage(), which
+    returns a shared do-nothing stage when no instrumentation is enabled, so they cost a
+    single context variable lookup per call otherwise. Stages are aggregated by (stage, sheet).
+
+    Memory is only traced with trace_memory=True, as tracemalloc slows allocations down.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        Initializes an Instrumentation instance.
+
+        Args:
+            trace_memory (bool): Whether to trace the memory peak of every stage with tracemalloc.
+        """
+        self.__trace_memory = trace_memory
+        self.__stats: Dict[Tuple[str, Optional[str]], StageStats] = {}
+        # Open stages, innermost last, as [absolute peak so far, traced memory when it began]
+        self.__open: List[List[int]] = []
+        self.__tokens = []
+        self.__started_tracing = False
+        self.__wall = 0.0
+        self.__cpu = 0.0
+        self.__peak: Optional[int] = None
+        self.__clock: Optional[Tuple[float, float]] = None
+        self.__root: Optional[List[int]] = None
+
+    # ----- Properties -----
+
+    @property
+    def trace_memory(self) -> bool:
+        """
+        Gets whether memory peaks are traced.
+
+        Returns:
+            bool: True when tracemalloc is used.
+        """
+        return self.__trace_memory
+
+    @property
+    def stages(self) -> List[StageStats]:
+        """
+        Gets the measures of every stage, in the order the stages first ran.
+
+        Returns:
+            List[StageStats]: The measures of each (stage, sheet).
+        """
+        return list(self.__stats.values())
+
+    # ----- Methods -----
+
+    def stage(self, name: str, sheet: Optional[str] = None) -> '_Stage':
+        """
+        Opens a stage of this instrumentation, whether or not it is the enabled one.
+
+        Args:
+            name (str): Name of the stage.
+            sheet (Optional[str]): Sheet the stage works on.
+
+        Returns:
+            _Stage: Context manager measuring the stage.
+        """
+        key = (name, None if sheet is None else str(sheet))
+        stats = self.__stats.get(key)
+        if stats is None:
+            stats = self.__stats[key] = StageStats(*key)
+        return _Stage(self, stats)
+
+    def failures(self) -> Dict[str, Dict[str, int]]:
+        """
+        Gets the validation failures of the run.
+
+        Returns:
+            dict: Rows failing each 'field.rule', by sheet.
+        """
+        failures = {}
+        for stats in self.__stats.values():
+            if stats.failures:
+                sheet = failures.setdefault(stats.sheet or '', {})
+                for rule, count in stats.failures.items():
+                    sheet[rule] = sheet.get(rule, 0) + count
+        return failures
+
+    def report(self) -> dict:
+        """
+        Builds the report of the run.
+
+        Returns:
+            dict: 'wall_seconds', 'cpu_seconds' and 'peak_bytes' of the whole run, 'stages' (one dict
+                per StageStats) and 'failures' (by sheet and rule).
+        """
+        return {'wall_seconds': self.__wall, 'cpu_seconds': self.__cpu, 'peak_bytes': self.__peak,
+                'stages': [stats.to_dict() for stats in self.__stats.values()], 'failures': self.failures()}
+
+    def to_json(self, file_path: Optional[str] = None) -> str:
+        """
+        Serializes the report as JSON, optionally writing it to a file.
+
+        Args:
+            file_path (Optional[str]): Path of the file to write.
+
+        Returns:
+            str: The JSON report.
+        """
+        text = json.dumps(self.report(), indent=2, ensure_ascii=False)
+        if file_path is not None:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write(text)
+        return text
+
+    def table(self) -> str:
+        """
+        Formats the report as a human-readable table.
+
+        Returns:
+            str: One line per stage, followed by the validation failures.
+        """
+        lines = [f"{'stage':<12}{'sheet':<12}{'calls':>7}{'wall s':>10}{'cpu s':>10}{'rows':>11}{'rows/s':>12}{'peak MB':>9}"]
+        for stats in self.__stats.values():
+            rate = '-' if stats.rows_per_second is None else f'{stats.rows_per_second:,.0f}'
+            peak = '-' if stats.peak_bytes is None else f'{stats.peak_bytes / 2 ** 20:.1f}'
+            lines.append(f"{stats.stage:<12}{stats.sheet or '-':<12}{stats.calls:>7}{stats.wall_seconds:>10.3f}"
+                         f"{stats.cpu_seconds:>10.3f}{stats.rows or '-':>11}{rate:>12}{peak:>9}")
+        peak = '-' if self.__peak is None else f'{self.__peak / 2 ** 20:.1f}'
+        lines.append(f"{'total':<24}{'':>7}{self.__wall:>10.3f}{self.__cpu:>10.3f}{'':>11}{'':>12}{peak:>9}")
+        for sheet, rules in self.failures().items():
+            for rule, count in sorted(rules.items()):
+                lines.append(f"{'failures':<12}{sheet or '-':<12}{rule:<30}{count:>11}")
+        return '\n'.join(lines)
+
+    # ----- Private Methods -----
+
+    def _enter_stage(self) -> Optional[List[int]]:
+        """Start measuring the memory of a stage, returning its [peak, start] entry or None when not traced."""
+        if not self.__trace_memory or not tracemalloc.is_tracing():
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        if self.__open:
+            # Keep the peak reached so far by the enclosing stage before resetting it
+            self.__open[-1][0] = max(self.__open[-1][0], peak)
+        tracemalloc.reset_peak()
+        entry = [current, current]
+        self.__open.append(entry)
+        return entry
+
+    def _exit_stage(self, entry: Optional[List[int]]) -> Optional[int]:
+        """Stop measuring the memory of a stage, returning its peak above its start."""
+        if entry is None or not tracemalloc.is_tracing():
+            return None
+        peak = max(entry[0], tracemalloc.get_traced_memory()[1])
+        self.__open.remove(entry)
+        if self.__open:
+            self.__open[-1][0] = max(self.__open[-1][0], peak)
+        return peak - entry[1]
+
+    # ----- Dunder Methods -----
+
+    def __enter__(self) -> 'Instrumentation':
+        """Enable the instrumentation for the code of the block."""
+        self.__tokens.append(_active.set(self))
+        if self.__trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracing = True
+        self.__clock = (time.perf_counter(), time.process_time())
+        self.__root = self._enter_stage()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        """Disable the instrumentation and record the totals of the run, even when the block raised."""
+        wall, cpu = self.__clock
+        self.__wall += time.perf_counter() - wall
+        self.__cpu += time.process_time() - cpu
+        peak = self._exit_stage(self.__root)
+        if peak is not None:
+            self.__peak = max(self.__peak or 0, peak)
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
+        _active.reset(self.__tokens.pop())
+        return False
+
+    def __repr__(self) -> str:
+        """Return the official string representation of the Instrumentation object."""
+        return f"Instrumentation({len(self.__stats)} stages, trace_memory={self.__trace_memory})"
+
+# Define the _Stage class
+class _Stage:
+    """Context manager adding one run of a stage to its StageStats."""
+    __slots__ = ('__instrumentation', '__stats', '__clock', '__memory')
+    enabled = True
+
+    def __init__(self, instrumentation: Instrumentation, stats: StageStats):
+        self.__instrumentation = instrumentation
+        self.__stats = stats
+
+    def add_rows(self, rows: int):
+        """Count rows processed by the stage."""
+        self.__stats.rows += int(rows)
+
+    def add_failures(self, failures: Mapping[str, int]):
+        """Count rows failing each 'field.rule'."""
+        for rule, count in failures.items():
+            self.__stats.failures[rule] = self.__stats.failures.get(rule, 0) + int(count)
+
+    def __enter__(self) -> '_Stage':
+        self.__memory = self.__instrumentation._enter_stage()
+        self.__clock = (time.perf_counter(), time.process_time())
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        wall, cpu = self.__clock
+        stats = self.__stats
+        stats.wall_seconds += time.perf_counter() - wall
+        stats.cpu_seconds += time.process_time() - cpu
+        stats.calls += 1
+        peak = self.__instrumentation._exit_stage(self.__memory)
+        if peak is not None:
+            stats.peak_bytes = max(stats.peak_bytes or 0, peak)
+        return False
+
+# Define the _NullStage class
+class _NullStage:
+    """Stage returned when no instrumentation is enabled: every method does nothing."""
+    __slots__ = ()
+    enabled = False
+
+    def add_rows(self, rows: int):
+        pass
+
+    def add_failures(self, failures: Mapping[str, int]):
+        pass
+
+    def __enter__(self) -> '_NullStage':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        return False
+
+# Instrumentation enabled in the current context, if any
+_active: ContextVar[Optional[Instrumentation]] = ContextVar('instrumentation', default=None)
+_NULL_STAGE = _NullStage()
+
+def stage(name: str, sheet: Optional[str] = None):
+    """
+    Opens a stage of the enabled instrumentation.
+
+    Args:
+        name (str): Name of the stage.
+        sheet (Optional[str]): Sheet the stage works on.
+
+    Returns:
+        Context manager measuring the stage, or doing nothing when no instrumentation is enabled.
+        Its add_rows and add_failures methods count rows and validation failures, and its
+        enabled attribute tells whether counting is worth computing.
+    """
+    instrumentation = _active.get()
+    return _NULL_STAGE if instrumentation is None else instrumentation.stage(name, sheet)
+
+def instrumented(name: str, sheet: Optional[str] = None) -> Callable:
+    """
+    Decorates a function so that each call runs as a stage of the enabled instrumentation.
+
+    Args:
+        name (str): Name of the stage.
+        sheet (Optional[str]): Sheet the stage works on.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage(name, sheet):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def current() -> Optional[Instrumentation]:
+    """
+    Gets the instrumentation enabled in the current context.
+
+    Returns:
+        Optional[Instrumentation]: The enabled instrumentation, or None.
+    """
+    return _active.get()
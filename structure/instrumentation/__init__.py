@@ -0,0 +1,11 @@
+# Import all instrumentation classes and functions
+from .Instrumentation import Instrumentation, StageStats, current, instrumented, stage
+
+# Define the __all__ variable to control what gets imported with 'from instrumentation import *'
+__all__ = [
+    'Instrumentation',
+    'StageStats',
+    'current',
+    'instrumented',
+    'stage'
+]
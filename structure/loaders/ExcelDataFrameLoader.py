@@ -1,8 +1,12 @@
 # Import custom classes
 from ..exceptions.InvalidPathError import InvalidPathError
+from ..instrumentation.Instrumentation import stage
+from .SheetCache import SheetCache
+from .SheetSchema import SheetSchema
+from . import _streaming
 
 # Import necessary libraries
-from typing import List
+from typing import Dict, Iterator, List, Optional
 import pandas as pd
 import os
 
@@ -30,13 +34,41 @@ class ExcelDataFrameLoader:
             raise FileNotFoundError(f"The file {file_path} does not exist.")
 
     @staticmethod
-    def load_data(file_path, sheet_name=0) -> pd.DataFrame:
+    def __parse(source, sheet_name, schema: Optional[SheetSchema]) -> pd.DataFrame:
+        """
+        Parses one sheet, applying the schema while parsing when one is given.
+
+        Args:
+            source (str|ExcelFile): Path to the Excel file or an already open ExcelFile.
+            sheet_name (str|int): Name or index of the sheet to parse.
+            schema (Optional[SheetSchema]): Columns and types to load.
+
+        Returns:
+            DataFrame: DataFrame containing the parsed sheet.
+        """
+        # pandas parses the sheet XML and infers the dtypes in the same pass
+        with stage('parse', sheet_name) as parsing:
+            options = schema.read_options() if schema is not None else {}
+            df = pd.read_excel(source, sheet_name=sheet_name, **options)
+            parsing.add_rows(len(df))
+        if schema is None:
+            return df
+        with stage('finalize', sheet_name) as finalizing:
+            df = schema.finalize(df)
+            finalizing.add_rows(len(df))
+        return df
+
+    @staticmethod
+    def load_data(file_path, sheet_name=0, cache: Optional[SheetCache] = None,
+                  schema: Optional[SheetSchema] = None) -> pd.DataFrame:
         """
         Loads data from the specified sheet of the Excel file into a pandas DataFrame.
         
         Args:
             file_path (str): Path to the Excel file.
             sheet_name (str|int): Name or index of the sheet to load (default is the first sheet).
+            cache (Optional[SheetCache]): Cache of parsed sheets. A hit skips parsing the workbook.
+            schema (Optional[SheetSchema]): Columns and types to load (default lets pandas infer every column).
         
         Returns:
             DataFrame: DataFrame containing the data from the specified sheet.
@@ -46,11 +78,162 @@ class ExcelDataFrameLoader:
         """
         try:
             ExcelDataFrameLoader.__validate_file_path(file_path)
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+            variant = schema.key() if schema is not None else ''
+            if cache is not None:
+                with stage('cache', sheet_name):
+                    df = cache.get(file_path, sheet_name, variant)
+                if df is not None:
+                    return df
+            # Opening unzips the workbook and reads its shared strings before any sheet is parsed
+            with stage('open'):
+                excel = pd.ExcelFile(file_path)
+            with excel:
+                df = ExcelDataFrameLoader.__parse(excel, sheet_name, schema)
+            if cache is not None:
+                with stage('cache', sheet_name):
+                    cache.put(file_path, sheet_name, df, variant)
             return df
         except Exception as e:
             raise InvalidPathError(f"An error occurred while loading the data: {e}")
 
+    @staticmethod
+    def load_workbook(file_path, sheets: Optional[List[int | str]] = None, cache: Optional[SheetCache] = None,
+                      schemas: Optional[Dict[int | str, SheetSchema]] = None) -> Dict[int | str, pd.DataFrame]:
+        """
+        Loads several sheets of the Excel file opening the workbook only once.
+
+        The workbook is unzipped and its shared strings table is parsed a single time,
+        then every requested sheet is parsed from the same open file.
+
+        Args:
+            file_path (str): Path to the Excel file.
+            sheets (Optional[List[int|str]]): Names or indexes of the sheets to load (default is every sheet).
+            cache (Optional[SheetCache]): Cache of parsed sheets. The workbook is only opened when some
+                requested sheet is missing from the cache.
+            schemas (Optional[Dict[int|str, SheetSchema]]): Schema of each sheet. Sheets without schema are inferred.
+
+        Returns:
+            dict: Mapping of each requested sheet to its DataFrame.
+
+        Raises:
+            InvalidPathError: If occur any error, a new error will be triggered informing wich error occurs.
+        """
+        try:
+            ExcelDataFrameLoader.__validate_file_path(file_path)
+            schemas = schemas or {}
+            variants = {sheet: schema.key() for sheet, schema in schemas.items()}
+            loaded = {}
+            if cache is not None and sheets is not None:
+                for sheet in sheets:
+                    with stage('cache', sheet):
+                        df = cache.get(file_path, sheet, variants.get(sheet, ''))
+                    if df is not None:
+                        loaded[sheet] = df
+                # Every sheet was cached, so the workbook is not opened at all
+                if len(loaded) == len(sheets):
+                    return loaded
+            with stage('open'):
+                excel = pd.ExcelFile(file_path)
+            with excel:
+                # Load every sheet when none was requested
+                if sheets is None:
+                    sheets = excel.sheet_names
+                for sheet in sheets:
+                    if sheet not in loaded:
+                        loaded[sheet] = ExcelDataFrameLoader.__parse(excel, sheet, schemas.get(sheet))
+                        if cache is not None:
+                            with stage('cache', sheet):
+                                cache.put(file_path, sheet, loaded[sheet], variants.get(sheet, ''))
+            return {sheet: loaded[sheet] for sheet in sheets}
+        except Exception as e:
+            raise InvalidPathError(f"An error occurred while loading the data: {e}")
+
+    @staticmethod
+    def iter_chunks(file_path, sheet_name=0, chunksize: int = 10000,
+                    schema: Optional[SheetSchema] = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams the specified sheet of the Excel file as DataFrames of at most chunksize rows.
+
+        The workbook is opened in openpyxl read-only mode and its rows are parsed lazily, each
+        one dropped from the XML tree once read, so only one chunk is held in memory at a time,
+        whatever the size of the sheet. The first row is used as header and fully empty rows
+        are skipped.
+
+        Args:
+            file_path (str): Path to the Excel file.
+            sheet_name (str|int): Name or index of the sheet to stream (default is the first sheet).
+            chunksize (int): Maximum number of rows of each yielded DataFrame.
+            schema (Optional[SheetSchema]): Columns and types applied to every chunk.
+
+        Yields:
+            DataFrame: The next chunk of rows, indexed by its position in the sheet.
+
+        Raises:
+            InvalidPathError: If occur any error, a new error will be triggered informing wich error occurs.
+        """
+        try:
+            ExcelDataFrameLoader.__validate_file_path(file_path)
+            if not isinstance(chunksize, int) or chunksize <= 0:
+                raise ValueError("chunksize must be a positive integer.")
+            with stage('open'):
+                workbook = _streaming.open_workbook(file_path)
+            try:
+                # Select the sheet by index or by name
+                if isinstance(sheet_name, int):
+                    worksheet = workbook.worksheets[sheet_name]
+                else:
+                    worksheet = workbook[sheet_name]
+                rows = _streaming.iter_values(worksheet)
+                header = next(rows, None)
+                if header is None:
+                    return
+                columns = list(header)
+                start = 0
+                while True:
+                    # Rows are read outside of the yield, so the stage does not time the consumer
+                    with stage('parse', sheet_name) as parsing:
+                        chunk = []
+                        for row in rows:
+                            # Ignore fully empty rows
+                            if all(value is None for value in row):
+                                continue
+                            chunk.append(row)
+                            if len(chunk) == chunksize:
+                                break
+                        parsing.add_rows(len(chunk))
+                    if not chunk:
+                        return
+                    yield ExcelDataFrameLoader.__build_chunk(chunk, columns, start, schema, sheet_name)
+                    if len(chunk) < chunksize:
+                        return
+                    start += len(chunk)
+            finally:
+                workbook.close()
+        except Exception as e:
+            raise InvalidPathError(f"An error occurred while streaming the data: {e}")
+
+    @staticmethod
+    def __build_chunk(rows: List[tuple], columns: List[str], start: int, schema: Optional[SheetSchema],
+                      sheet_name=None) -> pd.DataFrame:
+        """
+        Builds the DataFrame of a streamed chunk.
+
+        Args:
+            rows (List[tuple]): Values of the rows in the chunk.
+            columns (List[str]): Header of the sheet.
+            start (int): Position of the first row in the sheet.
+            schema (Optional[SheetSchema]): Columns and types applied to the chunk.
+            sheet_name (str|int): Name or index of the sheet, for instrumentation.
+
+        Returns:
+            DataFrame: The chunk indexed by the position of its rows in the sheet.
+        """
+        with stage('finalize', sheet_name) as finalizing:
+            df = pd.DataFrame(rows, columns=columns, index=pd.RangeIndex(start, start + len(rows)))
+            df = schema.apply(df) if schema is not None else df
+            finalizing.add_rows(len(df))
+        return df
+
     @staticmethod
     def get_sheet_names(file_path) -> List[int | str]:
         """
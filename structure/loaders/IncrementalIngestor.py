@@ -0,0 +1,208 @@
+# Import custom classes
+from ..exceptions.DuplicateRecordError import DuplicateRecordError
+from ..instrumentation.Instrumentation import stage
+from ..models.Client import Client
+from ..models.Product import Product
+from .ExcelDataFrameLoader import ExcelDataFrameLoader
+from .SheetCache import SheetCache
+from .SheetSchema import SheetSchema
+
+# Import necessary libraries
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+import hashlib
+import os
+
+# Define the SheetChanges class
+@dataclass(frozen=True)
+class SheetChanges:
+    """
+    Rows of a sheet that changed since the previous ingestion.
+
+    Attributes:
+        sheet_name (str): Name of the sheet.
+        inserted (list): Keys of the rows that did not exist before.
+        updated (list): Keys of the rows whose content changed.
+        deleted (list): Keys of the rows that no longer exist.
+        unchanged (int): Number of rows with the same content as before.
+        objects (list): Domain objects rebuilt from the inserted and updated rows.
+        report (DataFrame): Validation report of the inserted and updated rows.
+    """
+    sheet_name: str
+    inserted: list
+    updated: list
+    deleted: list
+    unchanged: int
+    objects: list = field(default_factory=list)
+    report: Optional[pd.DataFrame] = None
+
+# Define the IncrementalIngestor class
+class IncrementalIngestor:
+    """
+    Ingests a workbook that is re-exported often, rebuilding only the rows that changed.
+
+    Every row of every sheet is fingerprinted with pandas.util.hash_pandas_object and the
+    fingerprints are stored by key (id_sale, id_client, id_product) in a state directory.
+    The next ingestion compares the new fingerprints with the stored ones and passes only the
+    inserted and updated rows to the bulk constructor of the sheet.
+    """
+    # Key column of each sheet of the sales workbook
+    KEYS: Dict[str, str] = {'Sales': 'id_sale', 'Clients': 'id_client', 'Products': 'id_product'}
+    # Bulk constructor of each sheet with a domain model
+    BUILDERS: Dict[str, Callable] = {'Clients': Client.from_dataframe, 'Products': Product.from_dataframe}
+
+    def __init__(self, state_dir: str, keys: Optional[Dict[str, str]] = None,
+                 builders: Optional[Dict[str, Callable]] = None):
+        """
+        Initializes an IncrementalIngestor instance.
+
+        Args:
+            state_dir (str): Directory where fingerprints are stored. It is created if missing.
+            keys (Optional[Dict[str, str]]): Key column of each sheet (default is KEYS).
+            builders (Optional[Dict[str, Callable]]): Function building (objects, report) from the
+                changed rows of each sheet (default is BUILDERS). Sheets without builder only report changes.
+        """
+        self.__state_dir = state_dir
+        self.__keys = dict(IncrementalIngestor.KEYS if keys is None else keys)
+        self.__builders = dict(IncrementalIngestor.BUILDERS if builders is None else builders)
+        os.makedirs(state_dir, exist_ok=True)
+
+    # ----- Properties -----
+
+    @property
+    def state_dir(self) -> str:
+        """
+        Gets the directory of the stored fingerprints.
+
+        Returns:
+            str: The state directory.
+        """
+        return self.__state_dir
+
+    # ----- Methods -----
+
+    def ingest(self, file_path: str, sheets: Optional[List[str]] = None, cache: Optional[SheetCache] = None,
+               schemas: Optional[Dict[str, SheetSchema]] = None) -> Dict[str, SheetChanges]:
+        """
+        Loads the sheets, computes what changed since the previous ingestion and rebuilds only those rows.
+
+        The fingerprints are stored only after every sheet was processed, so a failed ingestion
+        is repeated in full by the next one.
+
+        Args:
+            file_path (str): Path to the Excel file.
+            sheets (Optional[List[str]]): Sheets to ingest (default is every sheet with a key column).
+            cache (Optional[SheetCache]): Cache of parsed sheets.
+            schemas (Optional[Dict[str, SheetSchema]]): Schema of each sheet.
+
+        Returns:
+            dict: Mapping of each sheet to its SheetChanges.
+
+        Raises:
+            InvalidPathError: If the workbook or a sheet cannot be loaded.
+            DuplicateRecordError: If a key appears in more than one row of a sheet.
+            ValueError: If a sheet has no key column.
+        """
+        sheets = list(self.__keys) if sheets is None else sheets
+        loaded = ExcelDataFrameLoader.load_workbook(file_path, sheets, cache=cache, schemas=schemas)
+        changes = {}
+        fingerprints = {}
+        for sheet in sheets:
+            variant = schemas[sheet].key() if schemas and sheet in schemas else ''
+            changes[sheet], fingerprints[sheet] = self.__diff(file_path, sheet, loaded[sheet], variant)
+        for sheet, (variant, current) in fingerprints.items():
+            self.__store(file_path, sheet, variant, current)
+        return changes
+
+    def reset(self, file_path: Optional[str] = None):
+        """
+        Removes the stored fingerprints of a workbook, or of every workbook, forcing a full ingestion.
+
+        Args:
+            file_path (Optional[str]): Path to the Excel file.
+        """
+        prefix = '' if file_path is None else IncrementalIngestor.__path_key(file_path) + '-'
+        for name in os.listdir(self.__state_dir):
+            if name.startswith(prefix) and name.endswith('.pkl'):
+                os.remove(os.path.join(self.__state_dir, name))
+
+    @staticmethod
+    def summary(changes: Dict[str, SheetChanges]) -> pd.DataFrame:
+        """
+        Summarizes the changes of an ingestion.
+
+        Args:
+            changes (dict): Result of ingest.
+
+        Returns:
+            DataFrame: One line per sheet with the number of inserted, updated, deleted, unchanged and rejected rows.
+        """
+        return pd.DataFrame([{
+            'sheet': sheet.sheet_name,
+            'inserted': len(sheet.inserted),
+            'updated': len(sheet.updated),
+            'deleted': len(sheet.deleted),
+            'unchanged': sheet.unchanged,
+            'rejected': 0 if sheet.report is None else sheet.report['row'].nunique(),
+        } for sheet in changes.values()]).set_index('sheet')
+
+    # ----- Private Methods -----
+
+    def __diff(self, file_path: str, sheet: str, df: pd.DataFrame, variant: str):
+        """Return the SheetChanges of a sheet and its new (variant, fingerprints)."""
+        key = self.__keys.get(sheet)
+        if key is None or key not in df.columns:
+            raise ValueError(f"Sheet '{sheet}' has no key column.")
+        keys = df[key]
+        if keys.duplicated().any():
+            raise DuplicateRecordError(f"Sheet '{sheet}' has duplicate keys: {keys[keys.duplicated()].unique().tolist()}")
+        with stage('fingerprint', sheet) as fingerprinting:
+            current = pd.Series(pd.util.hash_pandas_object(df, index=False).to_numpy(), index=pd.Index(keys, name='key'))
+            previous = self.__load(file_path, sheet, variant)
+            # Positions of the keys in the stored fingerprints, -1 for new keys
+            positions = previous.index.get_indexer(current.index)
+            inserted = positions < 0
+            updated = ~inserted & (previous.to_numpy()[np.maximum(positions, 0)] != current.to_numpy()
+                                   if len(previous) else False)
+            deleted = previous.index.difference(current.index, sort=False)
+            fingerprinting.add_rows(len(df))
+        changed = df[inserted | updated]
+        objects, report = [], None
+        if sheet in self.__builders:
+            objects, report = self.__builders[sheet](changed)
+        changes = SheetChanges(sheet, keys[inserted].tolist(), keys[updated].tolist(), deleted.tolist(),
+                               int((~inserted & ~updated).sum()), objects, report)
+        return changes, (variant, current)
+
+    def __entry(self, file_path: str, sheet: str, variant: str) -> str:
+        """Return the path of the fingerprints of a sheet parsed with a schema variant."""
+        sheet_key = hashlib.sha256(repr(sheet).encode()).hexdigest()[:16]
+        variant_key = hashlib.sha256(variant.encode()).hexdigest()[:16]
+        return os.path.join(self.__state_dir, f'{IncrementalIngestor.__path_key(file_path)}-{sheet_key}-{variant_key}.pkl')
+
+    def __load(self, file_path: str, sheet: str, variant: str) -> pd.Series:
+        """Return the stored fingerprints of a sheet, empty when there are none."""
+        entry = self.__entry(file_path, sheet, variant)
+        try:
+            return pd.read_pickle(entry)
+        except Exception:
+            # A missing or corrupted state means every row is new
+            return pd.Series([], dtype='uint64', index=pd.Index([], name='key'))
+
+    def __store(self, file_path: str, sheet: str, variant: str, fingerprints: pd.Series):
+        """Atomically store the fingerprints of a sheet, dropping those of other schema variants."""
+        entry = self.__entry(file_path, sheet, variant)
+        prefix = os.path.basename(entry).rsplit('-', 1)[0] + '-'
+        for name in os.listdir(self.__state_dir):
+            if name.startswith(prefix) and name != os.path.basename(entry):
+                os.remove(os.path.join(self.__state_dir, name))
+        temporary = entry + '.tmp'
+        fingerprints.to_pickle(temporary, compression=None)
+        os.replace(temporary, entry)
+
+    @staticmethod
+    def __path_key(file_path: str) -> str:
+        """Return the key shared by every entry of a source file."""
+        return hashlib.sha256(os.path.abspath(file_path).encode()).hexdigest()[:16]
@@ -0,0 +1,176 @@
+# Import custom classes
+from ..exceptions.InvalidPathError import InvalidPathError
+from .ExcelDataFrameLoader import ExcelDataFrameLoader
+from .SheetCache import SheetCache
+from .SheetSchema import SheetSchema
+
+# Import necessary libraries
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+import pandas as pd
+import glob
+import os
+
+def _load_sheet(file_path: str, sheet_name, schema: Optional[SheetSchema]) -> pd.DataFrame:
+    """Parse one sheet inside a worker process."""
+    return ExcelDataFrameLoader.load_data(file_path, sheet_name, schema=schema)
+
+# Define the ParallelExcelLoader class
+class ParallelExcelLoader:
+    """
+    Loads sheets and whole workbooks in parallel, parsing each sheet in its own worker process.
+    """
+
+    def __init__(self, workers: Optional[int] = None, cache: Optional[SheetCache] = None):
+        """
+        Initializes a ParallelExcelLoader instance.
+
+        Args:
+            workers (Optional[int]): Number of worker processes (default is the number of CPUs).
+            cache (Optional[SheetCache]): Cache of parsed sheets, checked before dispatching work.
+
+        Raises:
+            ValueError: If workers is not a positive integer.
+        """
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.__cache = cache
+
+    # ----- Properties -----
+
+    @property
+    def workers(self) -> int:
+        """
+        Gets the number of worker processes.
+
+        Returns:
+            int: The number of workers.
+        """
+        return self.__workers
+
+    @workers.setter
+    def workers(self, workers: int):
+        """
+        Sets the number of worker processes.
+
+        Args:
+            workers (int): The new number of workers.
+
+        Raises:
+            ValueError: If workers is not a positive integer.
+        """
+        if not isinstance(workers, int) or isinstance(workers, bool) or workers <= 0:
+            raise ValueError("workers must be a positive integer.")
+        self.__workers = workers
+
+    # ----- Methods -----
+
+    def load_workbook(self, file_path: str, sheets: Optional[List[int | str]] = None,
+                      schemas: Optional[Dict[int | str, SheetSchema]] = None) -> Dict[int | str, pd.DataFrame]:
+        """
+        Loads several sheets of the Excel file in parallel.
+
+        Args:
+            file_path (str): Path to the Excel file.
+            sheets (Optional[List[int|str]]): Names or indexes of the sheets to load (default is every sheet).
+            schemas (Optional[Dict[int|str, SheetSchema]]): Schema of each sheet. Sheets without schema are inferred.
+
+        Returns:
+            dict: Mapping of each requested sheet to its DataFrame.
+
+        Raises:
+            InvalidPathError: If any sheet fails to load. The message names the failing sheet.
+        """
+        if sheets is None:
+            sheets = ExcelDataFrameLoader.get_sheet_names(file_path)
+        loaded = self.__load_tasks([(file_path, sheet) for sheet in sheets], schemas or {})
+        return {sheet: loaded[(file_path, sheet)] for sheet in sheets}
+
+    def load_many(self, source: str | Iterable[str], sheets: List[int | str],
+                  schemas: Optional[Dict[int | str, SheetSchema]] = None) -> Dict[int | str, pd.DataFrame]:
+        """
+        Loads the same sheets from several workbooks and concatenates them.
+
+        Every (workbook, sheet) pair is parsed in parallel, then the DataFrames of each sheet are
+        concatenated in the sorted order of the workbook paths.
+
+        Args:
+            source (str|Iterable[str]): Directory, glob pattern (e.g. 'data/raw/sales_relatory_*.xlsx') or list of paths.
+            sheets (List[int|str]): Names or indexes of the sheets to load from each workbook.
+            schemas (Optional[Dict[int|str, SheetSchema]]): Schema of each sheet. Sheets without schema are inferred.
+
+        Returns:
+            dict: Mapping of each requested sheet to the concatenated DataFrame.
+
+        Raises:
+            InvalidPathError: If no workbook is found or any sheet fails to load.
+        """
+        file_paths = self.resolve(source)
+        loaded = self.__load_tasks([(file_path, sheet) for file_path in file_paths for sheet in sheets], schemas or {})
+        return {
+            sheet: pd.concat([loaded[(file_path, sheet)] for file_path in file_paths], ignore_index=True)
+            for sheet in sheets
+        }
+
+    @staticmethod
+    def resolve(source: str | Iterable[str]) -> List[str]:
+        """
+        Resolves a directory, glob pattern or list of paths into a sorted list of workbooks.
+
+        Excel lock files (starting with '~$') are ignored.
+
+        Args:
+            source (str|Iterable[str]): Directory, glob pattern or list of paths.
+
+        Returns:
+            list: Sorted paths of the workbooks.
+
+        Raises:
+            InvalidPathError: If no workbook is found.
+        """
+        if isinstance(source, str):
+            pattern = os.path.join(source, '*.xlsx') if os.path.isdir(source) else source
+            file_paths = glob.glob(pattern)
+        else:
+            file_paths = list(source)
+        file_paths = sorted(path for path in file_paths if not os.path.basename(path).startswith('~$'))
+        if not file_paths:
+            raise InvalidPathError(f"No workbook found for {source}.")
+        return file_paths
+
+    # ----- Private Methods -----
+
+    def __load_tasks(self, tasks: List[tuple], schemas: Dict[int | str, SheetSchema]) -> Dict[tuple, pd.DataFrame]:
+        """Load (file_path, sheet) pairs, answering from the cache first and parsing the rest in the pool."""
+        variants = {sheet: schema.key() for sheet, schema in schemas.items()}
+        loaded = {}
+        pending = []
+        for file_path, sheet in tasks:
+            df = self.__cache.get(file_path, sheet, variants.get(sheet, '')) if self.__cache is not None else None
+            if df is not None:
+                loaded[(file_path, sheet)] = df
+            else:
+                pending.append((file_path, sheet))
+        if not pending:
+            return loaded
+        # A single worker or task does not pay the cost of starting processes
+        if self.__workers == 1 or len(pending) == 1:
+            results = [self.__run(_load_sheet, file_path, sheet, schemas.get(sheet)) for file_path, sheet in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.__workers, len(pending))) as executor:
+                futures = [executor.submit(_load_sheet, file_path, sheet, schemas.get(sheet)) for file_path, sheet in pending]
+                results = [self.__run(future.result) for future in futures]
+        for (file_path, sheet), result in zip(pending, results):
+            if isinstance(result, Exception):
+                raise InvalidPathError(f"An error occurred while loading sheet '{sheet}' of {file_path}: {result}")
+            loaded[(file_path, sheet)] = result
+            if self.__cache is not None:
+                self.__cache.put(file_path, sheet, result, variants.get(sheet, ''))
+        return loaded
+
+    @staticmethod
+    def __run(function, *args):
+        """Call a function returning its exception instead of raising it."""
+        try:
+            return function(*args)
+        except Exception as e:
+            return e
@@ -0,0 +1,247 @@
+# Import necessary libraries
+from typing import Dict, Optional
+import pandas as pd
+import hashlib
+import os
+
+# Optional dependency used for the columnar format
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Define the SheetCache class
+class SheetCache:
+    """
+    On-disk cache of parsed workbook sheets keyed by the fingerprint of the source file.
+
+    Sheets are stored as Parquet files when pyarrow is available and as pickles otherwise.
+    The fingerprint combines the absolute path, size, modification time and a SHA-256 of the
+    content, so any change to the workbook invalidates its entries.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initializes a SheetCache instance.
+
+        Args:
+            cache_dir (str): Directory where the parsed sheets are stored. It is created if missing.
+            max_bytes (int): Maximum total size of the cache before the least recently used entries are evicted.
+
+        Raises:
+            ValueError: If max_bytes is not a positive integer.
+        """
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        self.__cache_dir = cache_dir
+        self.__max_bytes = max_bytes
+        self.__digests: Dict[tuple, str] = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # ----- Properties -----
+
+    @property
+    def cache_dir(self) -> str:
+        """
+        Gets the cache directory.
+
+        Returns:
+            str: The directory where entries are stored.
+        """
+        return self.__cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Gets the size limit of the cache.
+
+        Returns:
+            int: The maximum total size in bytes.
+        """
+        return self.__max_bytes
+
+    @property
+    def hits(self) -> int:
+        """
+        Gets the number of lookups answered by the cache.
+
+        Returns:
+            int: The number of hits.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Gets the number of lookups not answered by the cache.
+
+        Returns:
+            int: The number of misses.
+        """
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """
+        Gets the number of entries removed to respect the size limit.
+
+        Returns:
+            int: The number of evictions.
+        """
+        return self.__evictions
+
+    # ----- Methods -----
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters and current size of the cache.
+
+        Returns:
+            dict: Hits, misses, evictions, number of entries and total size in bytes.
+        """
+        entries = self.__entries()
+        return {
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'evictions': self.__evictions,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries)
+        }
+
+    def fingerprint(self, file_path: str) -> str:
+        """
+        Computes the fingerprint of a source file.
+
+        The content hash is memoized per (path, size, mtime), so an unchanged file is read only once.
+
+        Args:
+            file_path (str): Path to the source file.
+
+        Returns:
+            str: Hexadecimal fingerprint of the file.
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        if key not in self.__digests:
+            content = hashlib.sha256()
+            with open(path, 'rb') as file:
+                for block in iter(lambda: file.read(1024 * 1024), b''):
+                    content.update(block)
+            self.__digests[key] = hashlib.sha256(f'{key}|{content.hexdigest()}'.encode()).hexdigest()
+        return self.__digests[key]
+
+    def get(self, file_path: str, sheet_name, variant: str = '') -> Optional[pd.DataFrame]:
+        """
+        Returns the cached DataFrame of a sheet if the source file did not change.
+
+        Args:
+            file_path (str): Path to the source workbook.
+            sheet_name (str|int): Name or index of the sheet.
+            variant (str): Extra key for different parsings of the same sheet.
+
+        Returns:
+            Optional[DataFrame]: The cached DataFrame, or None on a miss.
+        """
+        stem = self.__entry_stem(file_path, sheet_name, variant)
+        for extension, reader in (('.parquet', pd.read_parquet), ('.pkl', pd.read_pickle)):
+            entry = os.path.join(self.__cache_dir, stem + extension)
+            if os.path.exists(entry):
+                try:
+                    df = reader(entry)
+                except Exception:
+                    # A corrupted entry is treated as a miss and dropped
+                    self.__remove(entry)
+                    continue
+                # Touch the entry so eviction follows the least recently used order
+                os.utime(entry)
+                self.__hits += 1
+                return df
+        self.__misses += 1
+        return None
+
+    def put(self, file_path: str, sheet_name, df: pd.DataFrame, variant: str = ''):
+        """
+        Stores the DataFrame of a sheet, replacing entries of older versions of the source file.
+
+        Args:
+            file_path (str): Path to the source workbook.
+            sheet_name (str|int): Name or index of the sheet.
+            df (DataFrame): Parsed content of the sheet.
+            variant (str): Extra key for different parsings of the same sheet.
+        """
+        stem = self.__entry_stem(file_path, sheet_name, variant)
+        # Drop entries of the same sheet built from a previous version of the file
+        prefix = stem.rsplit('-', 1)[0] + '-'
+        for entry, _, _ in self.__entries():
+            name = os.path.basename(entry)
+            if name.startswith(prefix) and not name.startswith(stem):
+                self.__remove(entry)
+        entry = os.path.join(self.__cache_dir, stem)
+        temporary = entry + '.tmp'
+        # Prefer the columnar format and fall back to pickle when it is unavailable or unsupported
+        try:
+            if pyarrow is None:
+                raise ImportError("pyarrow is not installed.")
+            df.to_parquet(temporary)
+            entry += '.parquet'
+        except Exception:
+            df.to_pickle(temporary, compression=None)
+            entry += '.pkl'
+        os.replace(temporary, entry)
+        self.__evict()
+
+    def invalidate(self, file_path: Optional[str] = None):
+        """
+        Removes the entries of a source file, or every entry when no file is given.
+
+        Args:
+            file_path (Optional[str]): Path to the source workbook.
+        """
+        prefix = '' if file_path is None else self.__path_key(file_path) + '-'
+        for entry, _, _ in self.__entries():
+            if os.path.basename(entry).startswith(prefix):
+                self.__remove(entry)
+
+    # ----- Private Methods -----
+
+    @staticmethod
+    def __path_key(file_path: str) -> str:
+        """Return the key shared by every entry of a source file."""
+        return hashlib.sha256(os.path.abspath(file_path).encode()).hexdigest()[:16]
+
+    def __entry_stem(self, file_path: str, sheet_name, variant: str) -> str:
+        """Return the file name of an entry without its extension."""
+        sheet_key = hashlib.sha256(f'{sheet_name!r}|{variant}'.encode()).hexdigest()[:16]
+        return f'{self.__path_key(file_path)}-{sheet_key}-{self.fingerprint(file_path)[:32]}'
+
+    def __entries(self):
+        """Return the (path, size, mtime) of every entry in the cache directory."""
+        entries = []
+        for name in os.listdir(self.__cache_dir):
+            if name.endswith(('.parquet', '.pkl')):
+                path = os.path.join(self.__cache_dir, name)
+                stat = os.stat(path)
+                entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def __remove(self, entry: str):
+        """Delete an entry, ignoring entries already removed by another process."""
+        try:
+            os.remove(entry)
+        except FileNotFoundError:
+            pass
+
+    def __evict(self):
+        """Remove the least recently used entries until the cache fits its size limit."""
+        entries = sorted(self.__entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for entry, size, _ in entries:
+            if total <= self.__max_bytes:
+                break
+            self.__remove(entry)
+            self.__evictions += 1
+            total -= size
@@ -0,0 +1,172 @@
+# Import necessary libraries
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import pandas as pd
+
+# Nullable variant of each integer dtype, used when some identifier is missing
+_NULLABLE_DTYPES: Dict[str, str] = {
+    'int8': 'Int8', 'int16': 'Int16', 'int32': 'Int32', 'int64': 'Int64',
+    'uint8': 'UInt8', 'uint16': 'UInt16', 'uint32': 'UInt32', 'uint64': 'UInt64',
+}
+
+# Define the ColumnSchema class
+@dataclass(frozen=True)
+class ColumnSchema:
+    """
+    Declares how one column of a sheet is loaded.
+
+    Attributes:
+        name (str): Header of the column in the sheet.
+        dtype (str): Target dtype of the column ('object', 'int32', 'float64', 'datetime64[ns]', ...).
+        categorical (bool): Whether the column is stored as a pandas categorical (low-cardinality values).
+        required (bool): Whether loading fails when the column is missing from the sheet.
+        id_prefix (Optional[str]): Prefix of identifier values (e.g. 'C' for 'C001'), parsed into integers at load time.
+    """
+    name: str
+    dtype: str = 'object'
+    categorical: bool = False
+    required: bool = True
+    id_prefix: Optional[str] = None
+
+# Define the SheetSchema class
+@dataclass(frozen=True)
+class SheetSchema:
+    """
+    Declares the columns loaded from a sheet and their types.
+
+    Attributes:
+        sheet_name (str): Name of the sheet described by the schema.
+        columns (Tuple[ColumnSchema, ...]): Columns to load. Columns of the sheet not listed are skipped.
+    """
+    sheet_name: str
+    columns: Tuple[ColumnSchema, ...]
+
+    # ----- Methods -----
+
+    def read_options(self) -> dict:
+        """
+        Builds the keyword arguments that make pandas apply the schema while parsing.
+
+        Returns:
+            dict: The 'usecols', 'dtype' and 'converters' options for pandas.read_excel.
+        """
+        names = {column.name for column in self.columns}
+        dtype = {}
+        converters = {}
+        for column in self.columns:
+            if column.id_prefix is not None:
+                converters[column.name] = _IdParser(column.id_prefix)
+            elif column.categorical:
+                dtype[column.name] = 'category'
+            elif column.dtype != 'object' and not column.dtype.startswith('datetime'):
+                dtype[column.name] = column.dtype
+        return {'usecols': lambda name: name in names, 'dtype': dtype, 'converters': converters}
+
+    def finalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Completes a DataFrame parsed with read_options.
+
+        Checks that required columns are present and narrows the parsed identifiers to their
+        integer dtype, using the nullable variant when some identifier was malformed.
+
+        Args:
+            df (DataFrame): DataFrame parsed with the options of read_options.
+
+        Returns:
+            DataFrame: The same DataFrame with typed identifier columns.
+
+        Raises:
+            ValueError: If a required column is missing.
+        """
+        missing = [column.name for column in self.columns if column.required and column.name not in df.columns]
+        if missing:
+            raise ValueError(f"Sheet '{self.sheet_name}' is missing required columns: {missing}")
+        for column in self.columns:
+            if column.id_prefix is not None and column.name in df.columns:
+                values = df[column.name]
+                if values.notna().all():
+                    df[column.name] = values.astype(column.dtype)
+                else:
+                    dtype = pd.api.types.pandas_dtype(column.dtype)
+                    df[column.name] = values.astype(_NULLABLE_DTYPES.get(dtype.name, dtype))
+        return df
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the schema to an already loaded DataFrame, as used for streamed chunks.
+
+        Args:
+            df (DataFrame): DataFrame with the raw columns of the sheet.
+
+        Returns:
+            DataFrame: A DataFrame restricted to the schema columns with their declared types.
+
+        Raises:
+            ValueError: If a required column is missing.
+        """
+        options = self.read_options()
+        df = df[[name for name in df.columns if options['usecols'](name)]].copy()
+        for name, converter in options['converters'].items():
+            if name in df.columns:
+                df[name] = df[name].map(converter)
+        df = df.astype({name: dtype for name, dtype in options['dtype'].items() if name in df.columns})
+        for column in self.columns:
+            if column.dtype.startswith('datetime') and column.name in df.columns:
+                df[column.name] = pd.to_datetime(df[column.name])
+        return self.finalize(df)
+
+    def key(self) -> str:
+        """
+        Returns a stable text key of the schema, used to cache sheets loaded with it.
+
+        Returns:
+            str: The representation of the schema.
+        """
+        return repr(self)
+
+# Define the _IdParser class
+class _IdParser:
+    """
+    Converter turning prefixed identifiers ('C001') into integers, or None when malformed.
+    """
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def __call__(self, value):
+        if isinstance(value, str) and value.startswith(self.prefix) and value[len(self.prefix):].isdigit():
+            return int(value[len(self.prefix):])
+        return None
+
+# ----- Schemas of the sales workbook -----
+
+CLIENTS_SCHEMA = SheetSchema('Clients', (
+    ColumnSchema('id_client', 'int32', id_prefix='C'),
+    ColumnSchema('name'),
+    ColumnSchema('surname'),
+    ColumnSchema('email'),
+    ColumnSchema('city', categorical=True),
+    ColumnSchema('state', categorical=True),
+))
+
+PRODUCTS_SCHEMA = SheetSchema('Products', (
+    ColumnSchema('id_product', 'int32', id_prefix='P'),
+    ColumnSchema('name_product'),
+    ColumnSchema('category', categorical=True),
+    ColumnSchema('unit_price', 'float64'),
+    ColumnSchema('stock', 'int32'),
+))
+
+SALES_SCHEMA = SheetSchema('Sales', (
+    ColumnSchema('id_sale', 'int32', id_prefix='V'),
+    ColumnSchema('sale_date', 'datetime64[ns]'),
+    ColumnSchema('id_client', 'int32', id_prefix='C'),
+    ColumnSchema('id_product', 'int32', id_prefix='P'),
+    ColumnSchema('quantity', 'int32'),
+    ColumnSchema('total_sales_value', 'float64'),
+))
+
+# Schemas indexed by sheet name
+SALES_WORKBOOK_SCHEMAS: Dict[str, SheetSchema] = {
+    schema.sheet_name: schema for schema in (CLIENTS_SCHEMA, PRODUCTS_SCHEMA, SALES_SCHEMA)
+}
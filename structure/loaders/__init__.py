@@ -1,5 +1,51 @@
-# Import all custom loaders classes
-from .ExcelDataFrameLoader import ExcelDataFrameLoader, pd
+# Loaders depend on pandas and openpyxl, which take hundreds of milliseconds to import.
+# Their classes are imported on first access (PEP 562), so importing the package is free.
+
+# Import necessary libraries
+import importlib
+
+# Module defining each exported name
+_EXPORTS = {
+    'ExcelDataFrameLoader': '.ExcelDataFrameLoader',
+    'ParallelExcelLoader': '.ParallelExcelLoader',
+    'IncrementalIngestor': '.IncrementalIngestor',
+    'SheetChanges': '.IncrementalIngestor',
+    'SheetCache': '.SheetCache',
+    'ColumnSchema': '.SheetSchema',
+    'SheetSchema': '.SheetSchema',
+    'CLIENTS_SCHEMA': '.SheetSchema',
+    'PRODUCTS_SCHEMA': '.SheetSchema',
+    'SALES_SCHEMA': '.SheetSchema',
+    'SALES_WORKBOOK_SCHEMAS': '.SheetSchema',
+    'pd': 'pandas',
+}
 
 # Define the __all__ variable to control what is imported when using 'from loaders import *'
-__all__ = ['ExcelDataFrameLoader', 'pd']
\ No newline at end of file
+__all__ = [
+    'ExcelDataFrameLoader',
+    'ParallelExcelLoader',
+    'IncrementalIngestor',
+    'SheetChanges',
+    'SheetCache',
+    'ColumnSchema',
+    'SheetSchema',
+    'CLIENTS_SCHEMA',
+    'PRODUCTS_SCHEMA',
+    'SALES_SCHEMA',
+    'SALES_WORKBOOK_SCHEMAS',
+    'pd'
+]
+
+def __getattr__(name: str):
+    """Import an exported name on first access and keep it as a module attribute."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = module if name == 'pd' else getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """List the exported names with the attributes already loaded."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,126 @@
+# Constant-memory reading of read-only openpyxl workbooks.
+# openpyxl clears every row it parses but leaves it attached to the sheetData element, both when
+# it reads the rows of a sheet and when, on opening, it scans a sheet without a <dimension>
+# element for its size. The memory used then grows with the number of rows. These helpers reuse
+# the openpyxl parsers but detach every row once it is read.
+#
+# They rely on private openpyxl classes and attributes (ExcelReader.read_worksheets,
+# ReadOnlyWorksheet._get_size, _get_source and _shared_strings, WorkSheetParser.parse_row and
+# row_dimensions, Workbook._sheets, _date_formats and _timedelta_formats), which may change in
+# any release. They are only used with the versions listed in SUPPORTED_VERSIONS, checked by
+# ExcelDataFrameLoader_test; other versions fall back to the public read-only API, whose memory
+# grows with the sheet.
+
+# Import libs
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import iterparse
+import openpyxl
+
+try:
+    from openpyxl.reader.excel import ExcelReader
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+    from openpyxl.worksheet._reader import ROW_TAG, WorkSheetParser
+    from openpyxl.worksheet.dimensions import SheetDimension
+except ImportError:
+    ExcelReader = ReadOnlyWorksheet = object
+    ROW_TAG = WorkSheetParser = SheetDimension = None
+
+# openpyxl versions whose private API the helpers were checked against
+SUPPORTED_VERSIONS = ('3.1.5',)
+
+# Whether the installed openpyxl is one of them, so rows are streamed in constant memory
+PRIVATE_API = openpyxl.__version__ in SUPPORTED_VERSIONS and WorkSheetParser is not None
+
+# Tags of the elements giving the size of a sheet and holding its rows
+DIMENSION_TAG = '{%s}dimension' % SHEET_MAIN_NS
+SHEET_DATA_TAG = '{%s}sheetData' % SHEET_MAIN_NS
+
+class _Worksheet(ReadOnlyWorksheet):
+    """Read-only worksheet that reads its size from the elements before its rows only."""
+
+    def _get_size(self):
+        """Read the <dimension> element, stopping at the rows when the sheet has none."""
+        with self._get_source() as source:
+            for _, element in iterparse(source, events=('start',)):
+                if element.tag == DIMENSION_TAG:
+                    dimensions = SheetDimension.from_tree(element).boundaries
+                    if dimensions is not None:
+                        self._min_column, self._min_row, self._max_column, self._max_row = dimensions
+                    return
+                if element.tag == SHEET_DATA_TAG:
+                    return
+
+class _Reader(ExcelReader):
+    """Read-only workbook reader creating _Worksheet sheets."""
+
+    def read_worksheets(self):
+        """Add a _Worksheet for every worksheet of the workbook, and its chartsheets."""
+        for sheet, rel in self.parser.find_sheets():
+            if rel.target not in self.valid_files:
+                continue
+            if "chartsheet" in rel.Type:
+                self.read_chartsheet(sheet, rel)
+                continue
+            worksheet = _Worksheet(self.wb, sheet.name, rel.target, self.shared_strings)
+            worksheet.sheet_state = sheet.state
+            self.wb._sheets.append(worksheet)
+
+def open_workbook(file_path):
+    """
+    Open a workbook as openpyxl.load_workbook(file_path, read_only=True, data_only=True), without scanning the rows.
+
+    Args:
+        file_path (str): Path to the Excel file.
+
+    Returns:
+        Workbook: The read-only workbook, to be closed after use. With an openpyxl version that is
+            not supported, the workbook of openpyxl.load_workbook.
+    """
+    if not PRIVATE_API:
+        return openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    reader = _Reader(file_path, read_only=True, data_only=True)
+    reader.read()
+    return reader.wb
+
+def iter_values(worksheet):
+    """
+    Iterate over the values of the rows of a read-only worksheet, as iter_rows(values_only=True).
+
+    Args:
+        worksheet (ReadOnlyWorksheet): The sheet to read, from a workbook returned by open_workbook.
+
+    Yields:
+        tuple: The values of the next row, with an empty row for each row missing from the file.
+    """
+    if not isinstance(worksheet, _Worksheet):
+        yield from worksheet.iter_rows(values_only=True)
+        return
+    workbook = worksheet.parent
+    width = worksheet.max_column
+    with worksheet._get_source() as source:
+        parser = WorkSheetParser(source, worksheet._shared_strings, data_only=workbook.data_only,
+                                 epoch=workbook.epoch, date_formats=workbook._date_formats,
+                                 timedelta_formats=workbook._timedelta_formats)
+        sheet_data = None
+        counter = 1
+        for event, element in iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                if element.tag == SHEET_DATA_TAG:
+                    sheet_data = element
+                continue
+            if element.tag != ROW_TAG:
+                continue
+            index, cells = parser.parse_row(element)
+            # Detach this row and the ones before it, and forget their dimensions
+            sheet_data.clear()
+            parser.row_dimensions.clear()
+            for _ in range(counter, index):
+                yield (None,) * (width or 0)
+            if index < counter:
+                continue
+            counter = index + 1
+            values = [None] * (width or (cells[-1]['column'] if cells else 0))
+            for cell in cells:
+                if cell['column'] <= len(values):
+                    values[cell['column'] - 1] = cell['value']
+            yield tuple(values)
@@ -7,8 +7,17 @@ from .models import *
 # Import all custom loaders classes
 from .loaders import *
 
+# Import the instrumentation of the loaders and bulk constructors
+from .instrumentation import Instrumentation
+
+# Import the streaming pipeline
+from .pipelines import RecordWriter, WorkbookPipeline
+
 # Import all necessary libraries
+from typing import List, Optional
+import argparse
 import os
+import sys
 
 # ----- Starts logical -----
 
@@ -18,18 +27,47 @@ script_dir = os.path.dirname(__file__)
 # File path where worksheet are
 file_path = os.path.join(script_dir, 'data', 'raw', 'sales_relatory.xlsx')
 
+# Directory receiving the validated records and the rejected rows
+output_dir = os.path.join(script_dir, 'data', 'processed', 'output')
+
+# File receiving the per-stage timings of the last run
+report_path = os.path.join(script_dir, 'data', 'processed', 'reports', 'instrumentation.json')
+
 # Main function
-def main():
-    # Loader all sheets
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m structure.main',
+                                     description='Stream the Clients, Products and Sales sheets of sales workbooks '
+                                                 'through validation into CSV, JSON Lines or Parquet files.')
+    parser.add_argument('workbooks', nargs='*', default=[file_path],
+                        help='workbook paths, directories or glob patterns (default is the sample workbook)')
+    parser.add_argument('--output-dir', default=output_dir, help='directory receiving one subdirectory per workbook')
+    parser.add_argument('--format', choices=list(RecordWriter.FORMATS), default='csv', help='format of the output files')
+    parser.add_argument('--chunksize', type=int, default=10000, help='rows read and validated at once')
+    parser.add_argument('--workers', type=int, default=1, help='workbooks processed in parallel')
+    parser.add_argument('--domains', nargs='+', help='valid email domains (default is common providers; the sample workbook needs email.com)')
+    parser.add_argument('--trace-memory', action='store_true', help='report the memory peak of every stage')
+    parser.add_argument('--report', default=report_path, help='JSON file receiving the per-stage timings')
+    args = parser.parse_args(argv)
+
+    # Time every stage of the run, so a slow or failed run shows where the time went
+    run = Instrumentation(trace_memory=args.trace_memory)
     try:
-        df_clients = ExcelDataFrameLoader().load_data(file_path, 'Clients')
-        df_products = ExcelDataFrameLoader().load_data(file_path, 'Products')
-        df_sales = ExcelDataFrameLoader().load_data(file_path, 'Sales')
+        pipeline = WorkbookPipeline(args.output_dir, args.format, args.chunksize, args.workers, args.domains)
+        file_paths = sorted({path for source in args.workbooks for path in ParallelExcelLoader.resolve(source)})
+        with run:
+            results = pipeline.run(file_paths)
+        print(WorkbookPipeline.summary(results))
         print('All right!')
+        return 0
     except Exception as e:
-        print(f'There was an error for open the worksheet: {e}')
+        print(f'There was an error for process the workbooks: {e}', file=sys.stderr)
+        return 1
+    finally:
+        print(run.table())
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        run.to_json(args.report)
 
 # Execute main function
 if __name__ == '__main__':
     # Call the main function
-    main()
\ No newline at end of file
+    sys.exit(main())
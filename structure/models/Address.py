@@ -1,12 +1,52 @@
 # Import custom classes
+from .ValidationIssue import ValidationIssue
+from . import _rules
 from ..exceptions.InvalidCityError import InvalidCityError
 from ..exceptions.InvalidStateError import InvalidStateError
 
+# Import libs
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List
+
+# Brazilian state abbreviations and names (read-only, shared by every Address)
+BRAZILIAN_STATES = MappingProxyType({
+    'AC': 'Acre', 
+    'AL': 'Alagoas',
+    'AP': 'Amapá',
+    'AM': 'Amazonas',
+    'BA': 'Bahia',
+    'CE': 'Ceará',
+    'ES': 'Espiríto Santo',
+    'GO': 'Goiás',
+    'MA': 'Maranhão',
+    'MT': 'Mato Grosso',
+    'MS': 'Mato Grosso do Sul',
+    'MG': 'Minas Gerais',
+    'PA': 'Pará',
+    'PB': 'Paraíba',
+    'PR': 'Paraná',
+    'PE': 'Pernambuco',
+    'PI': 'Piauí',
+    'RJ': 'Rio de Janeiro',
+    'RN': 'Rio Grande do Norte',
+    'RS': 'Rio Grande do Sul',
+    'RO': 'Rondônia',
+    'RR': 'Roraima',
+    'SC': 'Santa Catarina',
+    'SP': 'São Paulo',
+    'SE': 'Sergipe',
+    'TO': 'Tocantins'
+})
+
 # Class implementation
 class Address:
     """
     Represents an address with city and state attributes.
+
+    Addresses returned by Address.intern are shared between callers and therefore immutable.
     """
+    __slots__ = ('__frozen', '__city', '__state')
 
     def __init__(self, city: str, state: str):
         """
@@ -19,34 +59,7 @@ class Address:
             InvalidCityError: If city is not a non-empty string.
             InvalidStateError: If state is not a valid Brazilian state abbreviation or not a non-empty string.
         """
-        self.__all_states = {
-            'AC': 'Acre', 
-            'AL': 'Alagoas',
-            'AP': 'Amapá',
-            'AM': 'Amazonas',
-            'BA': 'Bahia',
-            'CE': 'Ceará',
-            'ES': 'Espiríto Santo',
-            'GO': 'Goiás',
-            'MA': 'Maranhão',
-            'MT': 'Mato Grosso',
-            'MS': 'Mato Grosso do Sul',
-            'MG': 'Minas Gerais',
-            'PA': 'Pará',
-            'PB': 'Paraíba',
-            'PR': 'Paraná',
-            'PE': 'Pernambuco',
-            'PI': 'Piauí',
-            'RJ': 'Rio de Janeiro',
-            'RN': 'Rio Grande do Norte',
-            'RS': 'Rio Grande do Sul',
-            'RO': 'Rondônia',
-            'RR': 'Roraima',
-            'SC': 'Santa Catarina',
-            'SP': 'São Paulo',
-            'SE': 'Sergipe',
-            'TO': 'Tocantins'
-        }
+        self.__frozen = False
         self.city = city
         self.state = state
 
@@ -72,7 +85,10 @@ class Address:
 
         Raises:
             InvalidCityError: If city is not a non-empty string.
+            AttributeError: If the address is an interned, immutable instance.
         """
+        if self.__frozen:
+            raise AttributeError('Interned Address objects are immutable.')
         if not isinstance(city, str) or not city.strip():
             raise InvalidCityError('City must be a non-empty string.')
         self.__city = city
@@ -98,13 +114,91 @@ class Address:
         Raises:
             InvalidStateError: If state is not a valid Brazilian state abbreviation.
             InvalidStateError: If state is not a non-empty string.
+            AttributeError: If the address is an interned, immutable instance.
         """
+        if self.__frozen:
+            raise AttributeError('Interned Address objects are immutable.')
         if not isinstance(state, str) or not state.strip():
             raise InvalidStateError('State must be a non-empty string.')
-        if state.upper() not in self.__all_states.keys():
+        if state.upper() not in BRAZILIAN_STATES:
             raise InvalidStateError('State must be a valid Brazilian state abbreviation.')
         self.__state = state.upper()
 
+    # ----- Validation -----
+
+    @staticmethod
+    def validate(city, state) -> List[ValidationIssue]:
+        """
+        Check a city and a state against the rules of the setters without raising.
+
+        Args:
+            city (Any): The city to check.
+            state (Any): The state abbreviation to check.
+
+        Returns:
+            List[ValidationIssue]: Every broken rule ('non_empty_string' or 'valid_state'), empty when valid.
+        """
+        issues = []
+        if not _rules.filled(city):
+            issues.append(ValidationIssue('city', 'non_empty_string', city))
+        if not _rules.filled(state):
+            issues.append(ValidationIssue('state', 'non_empty_string', state))
+        elif state.upper() not in BRAZILIAN_STATES:
+            issues.append(ValidationIssue('state', 'valid_state', state))
+        return issues
+
+    # ----- Interning -----
+
+    @staticmethod
+    def intern(city: str, state: str) -> 'Address':
+        """
+        Get the shared, immutable Address of a (city, state) pair.
+
+        Instances are kept in a bounded cache of the most recently used pairs, so repeated
+        addresses of many clients point to the same object.
+
+        Args:
+            city (str): The name of the city.
+            state (str): The state abbreviation, in any case.
+
+        Returns:
+            Address: The interned Address.
+
+        Raises:
+            InvalidCityError: If city is not a non-empty string.
+            InvalidStateError: If state is not a valid Brazilian state abbreviation or not a non-empty string.
+        """
+        if not isinstance(city, str) or not isinstance(state, str):
+            # Unhashable or wrongly typed values raise the usual validation errors
+            return Address(city, state)
+        return _intern(city, state.upper())
+
+    @staticmethod
+    def intern_info():
+        """
+        Get the statistics of the interning cache.
+
+        Returns:
+            CacheInfo: Hits, misses, maximum size and current size of the cache.
+        """
+        return _intern.cache_info()
+
+    @classmethod
+    def _frozen(cls, city: str, state: str) -> 'Address':
+        """
+        Build a validated Address that rejects any later change.
+
+        Args:
+            city (str): The name of the city.
+            state (str): The state abbreviation.
+
+        Returns:
+            Address: The new immutable Address object.
+        """
+        obj = cls(city, state)
+        obj.__frozen = True
+        return obj
+
     # ----- Dunder Methods -----
 
     def __str__(self):
@@ -137,4 +231,22 @@ class Address:
         """
         if not isinstance(other, Address):
             return False
-        return self.city == other.city and self.state == other.state
\ No newline at end of file
+        return self.city == other.city and self.state == other.state
+
+    def __hash__(self):
+        """
+        Returns the hash of the Address, consistent with __eq__.
+
+        The hash follows the city and state, which a regular Address can still change through
+        its setters: do not set them while the address is in a set or a dict key, where it would
+        be left in the wrong bucket. Interned addresses cannot change.
+
+        Returns:
+            int: The hash of the (city, state) pair.
+        """
+        return hash((self.city, self.state))
+
+@lru_cache(maxsize=8192)
+def _intern(city: str, state: str) -> Address:
+    """Build, validate and freeze the single Address of a (city, upper-case state) pair."""
+    return Address._frozen(city, state)
@@ -0,0 +1,31 @@
+# Import libs
+from typing import NamedTuple
+
+# Class implementation
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a bounded cache of validated model objects, such as the one of Email.cached.
+
+    Attributes:
+        hits (int): Lookups answered by the cache.
+        misses (int): Lookups that had to validate the value.
+        evictions (int): Least recently used entries dropped to respect maxsize.
+        maxsize (int): Largest number of entries.
+        currsize (int): Current number of entries.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Gets the share of lookups answered by the cache.
+
+        Returns:
+            float: hits / (hits + misses), 0.0 before any lookup.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -1,16 +1,27 @@
 # Import custom classes
 from .Email import Email
-from .Address import Address
+from .EmailPolicy import EmailPolicy
+from .Address import Address, BRAZILIAN_STATES
+from .ValidationIssue import ValidationIssue
+from . import _columns, _rules
 from ..exceptions.InvalidIdError import InvalidIdError
+from ..instrumentation.Instrumentation import stage
 from ..exceptions.InvalidNameError import InvalidNameError
 from ..exceptions.InvalidEmailError import InvalidEmailError
 from ..exceptions.InvalidAddressError import InvalidAddressError
 
+# Import libs
+from typing import List, Mapping, Optional, Tuple
+
 # Class implementation
 class Client:
     """
     Represents a client with id, name, surname, and email.
+
+    The id is stored once as an integer; its 'C'-prefixed form is derived on access.
     """
+    __slots__ = ('__id_client', '__name', '__surname', '__email', '__address')
+
     def __init__(self, id_client: int, name: str, surname: str, email: Email, address: Address):
         """
         Initialize a Client instance with validated attributes.
@@ -29,7 +40,6 @@ class Client:
             InvalidAddressError: If address is not an Address object.
         """
         self.id_client = id_client
-        self.id_client_int = id_client
         self.name = name
         self.surname = surname
         self.email = email
@@ -43,9 +53,9 @@ class Client:
         Get the client's unique identifier.
 
         Returns:
-            int: The client's id.
+            str: The client's id.
         """
-        return self.__id_client
+        return f'C{self.__id_client}'  # Format id with 'C' prefix
 
     @id_client.setter
     def id_client(self, id_client: int):
@@ -60,7 +70,7 @@ class Client:
         """
         if not isinstance(id_client, int) or id_client <= 0:
             raise InvalidIdError("id_client must be a positive integer.")
-        self.__id_client = f'C{id_client}'  # Format id with 'C' prefix
+        self.__id_client = id_client
         
     @property
     def id_client_int(self):
@@ -68,9 +78,9 @@ class Client:
         Get the client's unique identifier.
 
         Returns:
-            str: The client's id.
+            int: The client's id.
         """
-        return self.__id_client_int
+        return self.__id_client
     
     @id_client_int.setter
     def id_client_int(self, id_client: int):
@@ -85,7 +95,7 @@ class Client:
         """
         if not isinstance(id_client, int) or id_client <= 0:
             raise InvalidIdError("id_client must be a positive integer.")
-        self.__id_client_int = id_client
+        self.__id_client = id_client
 
     @property
     def name(self) -> str:
@@ -187,6 +197,147 @@ class Client:
             raise InvalidAddressError("address must be an Address object.")
         self.__address = address
 
+    # ----- Bulk Construction -----
+
+    @classmethod
+    def from_dataframe(cls, df, valid_domains: Optional[List[str]] = None,
+                       policy: Optional[EmailPolicy] = None) -> Tuple[List['Client'], 'pd.DataFrame']:
+        """
+        Build Client objects from the Clients sheet, validating the whole sheet column-wise.
+
+        The columns 'id_client' ('C001' or already parsed integers), 'name', 'surname', 'email',
+        'city' and 'state' are checked with the same rules as the property setters, then objects
+        are built only for the rows that passed every rule. Addresses are interned, so clients of
+        the same city share one immutable Address.
+
+        Args:
+            df (DataFrame): The Clients sheet.
+            valid_domains (Optional[List[str]]): List of valid email domains. Defaults to common providers.
+            policy (Optional[EmailPolicy]): Shared email domain policy, used instead of valid_domains when given.
+
+        Returns:
+            Tuple[List[Client], DataFrame]: The clients of the valid rows, in row order, and the report of
+            every violation with the columns 'row', 'field', 'rule' and 'value'.
+        """
+        import numpy as np
+        policy = policy if policy is not None else EmailPolicy.for_domains(valid_domains)
+        with stage('validate', 'Clients') as validating:
+            ids, checks = cls.__checks(df, policy)
+            valid = ~np.logical_or.reduce([failed for _, _, failed, _ in checks])
+            validating.add_rows(len(df))
+            _columns.record_failures(validating, checks)
+        with stage('construct', 'Clients') as constructing:
+            # Intern one Address per distinct (city, state) pair of the valid rows
+            city_codes, cities = df['city'][valid].astype(object).factorize()
+            state_codes, states = df['state'][valid].astype(object).factorize()
+            pairs, pair_codes = np.unique(city_codes * len(states) + state_codes, return_inverse=True)
+            interned = [Address.intern(cities[pair // len(states)], states[pair % len(states)]) for pair in pairs.tolist()]
+            # Build objects of the valid rows only, without running the setters again
+            rows = zip(ids[valid].tolist(), df['name'][valid].tolist(), df['surname'][valid].tolist(),
+                       df['email'][valid].tolist(), pair_codes.tolist())
+            with _columns.bulk_allocation():
+                clients = [
+                    cls._from_valid(id_client, name.strip(), surname.strip(),
+                                    Email._from_valid(email, policy), interned[pair])
+                    for id_client, name, surname, email, pair in rows
+                ]
+            constructing.add_rows(len(clients))
+        return clients, _columns.report(df.index, checks)
+
+    # ----- Validation -----
+
+    @staticmethod
+    def validate(record: Mapping, valid_domains: Optional[List[str]] = None,
+                 policy: Optional[EmailPolicy] = None) -> List[ValidationIssue]:
+        """
+        Check a row of the Clients sheet against the rules of the setters without raising.
+
+        Args:
+            record (Mapping): Values of the columns 'id_client', 'name', 'surname', 'email', 'city' and 'state'.
+            valid_domains (Optional[List[str]]): List of valid email domains. Defaults to common providers.
+            policy (Optional[EmailPolicy]): Shared email domain policy, used instead of valid_domains when given.
+
+        Returns:
+            List[ValidationIssue]: Every broken rule, in the order the setters check them. Empty when valid.
+        """
+        issues = []
+        raw_id = record.get('id_client')
+        id_client = _rules.parse_id(raw_id, 'C')
+        if id_client is None:
+            issues.append(ValidationIssue('id_client', 'format', raw_id))
+        elif id_client <= 0:
+            issues.append(ValidationIssue('id_client', 'positive', raw_id))
+        for field in ('name', 'surname'):
+            if not _rules.filled(record.get(field)):
+                issues.append(ValidationIssue(field, 'non_empty_string', record.get(field)))
+        issues += Email.validate(record.get('email'), valid_domains, policy)
+        issues += Address.validate(record.get('city'), record.get('state'))
+        return issues
+
+    @classmethod
+    def validate_dataframe(cls, df, valid_domains: Optional[List[str]] = None,
+                           policy: Optional[EmailPolicy] = None) -> 'pd.DataFrame':
+        """
+        Check the whole Clients sheet column-wise without building any object.
+
+        Args:
+            df (DataFrame): The Clients sheet.
+            valid_domains (Optional[List[str]]): List of valid email domains. Defaults to common providers.
+            policy (Optional[EmailPolicy]): Shared email domain policy, used instead of valid_domains when given.
+
+        Returns:
+            DataFrame: The report of every violation with the columns 'row', 'field', 'rule' and 'value'.
+        """
+        policy = policy if policy is not None else EmailPolicy.for_domains(valid_domains)
+        with stage('validate', 'Clients') as validating:
+            _, checks = cls.__checks(df, policy)
+            validating.add_rows(len(df))
+            _columns.record_failures(validating, checks)
+        return _columns.report(df.index, checks)
+
+    @staticmethod
+    def __checks(df, policy: EmailPolicy):
+        """Return the parsed ids of the Clients sheet and the (field, rule, failure mask, values) of every rule."""
+        ids, parsed = _columns.parse_ids(df['id_client'], 'C')
+        parsed = parsed.to_numpy()
+        email_filled = _columns.check(df['email'], _columns.filled)
+        state_filled = _columns.check(df['state'], _columns.filled)
+        # Failure masks, one per rule, in the order the setters check them
+        return ids, [
+            ('id_client', 'format', ~parsed, df['id_client']),
+            ('id_client', 'positive', parsed & ~ids.gt(0).fillna(False).to_numpy(dtype=bool), df['id_client']),
+            ('name', 'non_empty_string', ~_columns.check(df['name'], _columns.filled), df['name']),
+            ('surname', 'non_empty_string', ~_columns.check(df['surname'], _columns.filled), df['surname']),
+            ('email', 'non_empty_string', ~email_filled, df['email']),
+            ('email', 'pattern', email_filled & ~Email._valid_mask(df['email'], policy), df['email']),
+            ('city', 'non_empty_string', ~_columns.check(df['city'], _columns.filled), df['city']),
+            ('state', 'non_empty_string', ~state_filled, df['state']),
+            ('state', 'valid_state', state_filled & ~_columns.check(df['state'], lambda text: text.str.upper().isin(list(BRAZILIAN_STATES))), df['state']),
+        ]
+
+    @classmethod
+    def _from_valid(cls, id_client: int, name: str, surname: str, email: Email, address: Address) -> 'Client':
+        """
+        Build a Client from values already validated, skipping the setters.
+
+        Args:
+            id_client (int): The validated positive id.
+            name (str): The validated, stripped first name.
+            surname (str): The validated, stripped surname.
+            email (Email): The email object.
+            address (Address): The address object.
+
+        Returns:
+            Client: The new Client object.
+        """
+        obj = cls.__new__(cls)
+        obj.__id_client = id_client
+        obj.__name = name
+        obj.__surname = surname
+        obj.__email = email
+        obj.__address = address
+        return obj
+
     # ----- Dunder Methods -----
 
     def __str__(self) -> str:
@@ -227,4 +378,17 @@ class Client:
             self.surname == other.surname and
             self.email == other.email and
             self.address == other.address
-        )
\ No newline at end of file
+        )
+
+    def __hash__(self) -> int:
+        """
+        Return the hash of the Client, consistent with __eq__.
+
+        Only the id is hashed: equal clients have equal ids, and the hash does not change
+        when the other attributes are set. The id itself can still be set: do not set it while
+        the client is in a set or a dict key, where it would be left in the wrong bucket.
+
+        Returns:
+            int: The hash of the id.
+        """
+        return hash(self.__id_client)
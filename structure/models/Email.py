@@ -1,32 +1,38 @@
 # Import custom classes
+from .CacheInfo import CacheInfo
+from .EmailPolicy import EmailPolicy, DEFAULT_EMAIL_POLICY
+from .ValidationIssue import ValidationIssue
+from . import _columns, _rules
 from ..exceptions.InvalidEmailError import InvalidEmailError
 
 # Import libs
-import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import FrozenSet, List, Optional
 
 # Class implementation
 class Email:
     """
     Represents an email address with validation and domain restrictions.
+
+    Emails returned by Email.cached are shared between callers and therefore immutable.
     """
-    def __init__(self, email: str, valid_domains: Optional[List[str]] = None):
+    __slots__ = ('__frozen', '__policy', '__email', '__username', '__domain')
+
+    def __init__(self, email: str, valid_domains: Optional[List[str]] = None, policy: Optional[EmailPolicy] = None):
         """
         Initialize an Email object.
 
         Args:
             email (str): The email address to validate and store.
             valid_domains (Optional[List[str]]): List of valid domains. Defaults to common providers.
+            policy (Optional[EmailPolicy]): Shared domain policy, used instead of valid_domains when given.
 
         Raises:
             InvalidEmailError: If the email does not match the required pattern or domain.
         """
-        # List of domains valid
-        self.__domains = valid_domains if valid_domains is not None else [
-            'gmail.com',
-            'outlook.com',
-            'hotmail.com'
-        ]
+        self.__frozen = False
+        # Shared policy of the valid domains
+        self.__policy = policy if policy is not None else EmailPolicy.for_domains(valid_domains)
         # Set email with validate
         self.email = email
 
@@ -51,26 +57,203 @@ class Email:
             email (str): The email address to set.
 
         Raises:
+            AttributeError: If the Email is a cached one.
             InvalidEmailError: If the email does not match the required pattern or domain.
         """
-        # Pattern before '@'
-        local_pattern = r'[a-zA-Z0-9._%+-]+'
-        # Pattern after '@'. It uses join to merge all domains with '|'Friendly 'email' presentation
-        # and uses re.escape to ensure that '.' will interpreted correctly
-        domain_pattern = '|'.join(map(re.escape, self.__domains))
-        # It merges localPattern with domainPattern before and after '@'.
-        # It use anchors '^' and '$' to ensure your positions
-        full_pattern = rf'^{local_pattern}@({domain_pattern})$'
+        if self.__frozen:
+            raise AttributeError('Cached Email objects are immutable.')
         # Verify if email is a non-empty string
         if not isinstance(email, str) or not email.strip():
             # Custom class for error
             raise InvalidEmailError("email must be a non-empty string.")
         # Performs verification to validate email. If doesn't match, it raises error
-        if not re.fullmatch(full_pattern, email):
+        if not self.__policy.regex.fullmatch(email):
             # Custom class for error
             raise InvalidEmailError("email don't match with pattern.")
-        # Save email
+        # Save email and its parts before and after '@'
+        parts = email.split('@')
         self.__email = email
+        self.__username = parts[0]
+        self.__domain = parts[1]
+
+    @property
+    def policy(self) -> EmailPolicy:
+        """
+        Get the domain policy the email was validated against.
+
+        Returns:
+            EmailPolicy: The shared domain policy.
+        """
+        return self.__policy
+
+    @staticmethod
+    def validate_series(series, valid_domains: Optional[List[str]] = None,
+                        policy: Optional[EmailPolicy] = None) -> 'pd.DataFrame':
+        """
+        Validate a whole column of email addresses with the same rules as the email setter.
+
+        The local part and domains are checked once per distinct value with the compiled
+        pattern of the policy, so the result matches building one Email per row exactly.
+
+        Args:
+            series (Series): Column of email addresses. Values that are not strings are invalid.
+            valid_domains (Optional[List[str]]): List of valid domains. Defaults to common providers.
+            policy (Optional[EmailPolicy]): Shared domain policy, used instead of valid_domains when given.
+
+        Returns:
+            DataFrame: Indexed like series, with the boolean column 'valid' and the 'username' and
+            'domain' parts of the valid addresses (missing for the invalid ones).
+        """
+        import pandas as pd
+        policy = policy if policy is not None else EmailPolicy.for_domains(valid_domains)
+        valid = Email._valid_mask(series, policy)
+        parts = _columns.text(series).where(valid).str.split('@')
+        return pd.DataFrame({
+            'valid': valid,
+            'username': parts.str[0],
+            'domain': parts.str[1]
+        }, index=series.index)
+
+    @staticmethod
+    def validate(email, valid_domains: Optional[List[str]] = None, policy: Optional[EmailPolicy] = None,
+                 field: str = 'email') -> List[ValidationIssue]:
+        """
+        Check an email against the rules of the setter without raising.
+
+        Args:
+            email (Any): The value to check.
+            valid_domains (Optional[List[str]]): List of valid domains. Defaults to common providers.
+            policy (Optional[EmailPolicy]): Shared domain policy, used instead of valid_domains when given.
+            field (str): Name of the field reported in the issues.
+
+        Returns:
+            List[ValidationIssue]: The broken rules ('non_empty_string' or 'pattern'), empty when valid.
+        """
+        if not _rules.filled(email):
+            return [ValidationIssue(field, 'non_empty_string', email)]
+        policy = policy if policy is not None else EmailPolicy.for_domains(valid_domains)
+        if not policy.regex.fullmatch(email):
+            return [ValidationIssue(field, 'pattern', email)]
+        return []
+
+    @staticmethod
+    def _valid_mask(series, policy: EmailPolicy):
+        """
+        Return the boolean mask of the values of series accepted by the email setter under policy.
+
+        Args:
+            series (Series): Column of email addresses.
+            policy (EmailPolicy): The domain policy to validate against.
+
+        Returns:
+            ndarray: Boolean mask aligned with the rows of series.
+        """
+        return _columns.check(series, lambda text: _columns.filled(text) & text.str.fullmatch(policy.regex))
+
+    @classmethod
+    def _from_valid(cls, email: str, policy: EmailPolicy) -> 'Email':
+        """
+        Build an Email from an address already validated against policy, skipping the setter.
+
+        Args:
+            email (str): The validated email address.
+            policy (EmailPolicy): The domain policy used for the validation.
+
+        Returns:
+            Email: The new Email object.
+        """
+        obj = cls.__new__(cls)
+        parts = email.split('@')
+        obj.__frozen = False
+        obj.__policy = policy
+        obj.__email = email
+        obj.__username = parts[0]
+        obj.__domain = parts[1]
+        return obj
+
+    # ----- Caching -----
+
+    @staticmethod
+    def cached(email: str, policy: Optional[EmailPolicy] = None) -> 'Email':
+        """
+        Get the shared, immutable Email of an address validated against a policy.
+
+        Results are kept in a bounded cache of the most recently used (email, policy domains)
+        pairs, invalid addresses included: a repeated address returns the same Email object, and
+        a repeated invalid one raises again without being matched against the pattern. The cache
+        is thread-safe; threads racing on the first lookup of an address may each validate it.
+
+        Args:
+            email (str): The email address to validate.
+            policy (Optional[EmailPolicy]): Shared domain policy. Defaults to the common providers.
+
+        Returns:
+            Email: The cached Email.
+
+        Raises:
+            InvalidEmailError: If the email does not match the required pattern or domain.
+        """
+        policy = policy if policy is not None else DEFAULT_EMAIL_POLICY
+        if not isinstance(email, str):
+            # Unhashable or wrongly typed values raise the usual validation error
+            return Email(email, policy=policy)
+        # The frozenset of domains caches its hash, unlike EmailPolicy
+        entry = _cached(email, policy.domains)
+        if isinstance(entry, InvalidEmailError):
+            raise InvalidEmailError(*entry.args)
+        return entry
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """
+        Get the statistics of the cache of Email.cached.
+
+        Every miss stores one entry, so evictions are the misses no longer in the cache. They are
+        overcounted by one for each race of threads on the first lookup of an address.
+
+        Returns:
+            CacheInfo: Hits, misses, evictions, maximum size and current size of the cache.
+        """
+        info = _cached.cache_info()
+        return CacheInfo(info.hits, info.misses, info.misses - info.currsize, info.maxsize, info.currsize)
+
+    @staticmethod
+    def cache_clear(maxsize: Optional[int] = None):
+        """
+        Empty the cache of Email.cached and reset its statistics, optionally changing its size limit.
+
+        Args:
+            maxsize (Optional[int]): New largest number of cached addresses.
+
+        Raises:
+            ValueError: If maxsize is not a positive integer.
+        """
+        global _cached
+        if maxsize is None:
+            _cached.cache_clear()
+            return
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        _cached = lru_cache(maxsize=maxsize)(_validate)
+
+    @classmethod
+    def _frozen(cls, email: str, policy: EmailPolicy) -> 'Email':
+        """
+        Build a validated Email that rejects any later change.
+
+        Args:
+            email (str): The email address to validate.
+            policy (EmailPolicy): The domain policy to validate against.
+
+        Returns:
+            Email: The new immutable Email object.
+
+        Raises:
+            InvalidEmailError: If the email does not match the required pattern or domain.
+        """
+        obj = cls(email, policy=policy)
+        obj.__frozen = True
+        return obj
 
     @property
     def username(self) -> str:
@@ -81,7 +264,7 @@ class Email:
             str: The part before the '@' symbol.
         """
         # Returns part before '@'
-        return self.email.split('@')[0]
+        return self.__username
     
     @property
     def domain(self) -> str:
@@ -92,7 +275,7 @@ class Email:
             str: The part after the '@' symbol.
         """
         # Returns part after '@'
-        return self.email.split('@')[1]
+        return self.__domain
 
     # ------ Dunder Methods ----- 
 
@@ -116,5 +299,15 @@ class Email:
         return NotImplemented
     
     def __hash__(self) -> int:
-        """Return the hash of the email address. """
-        return hash(self.email)
\ No newline at end of file
+        """Return the hash of the email address, which must not be set while the Email is in a set or a dict key."""
+        return hash(self.email)
+
+def _validate(email: str, domains: FrozenSet[str]) -> Email | InvalidEmailError:
+    """Build the immutable Email of an address, or return its validation error so that it is cached too."""
+    try:
+        return Email._frozen(email, EmailPolicy.for_domains(domains))
+    except InvalidEmailError as e:
+        return e
+
+# Emails returned by Email.cached, and the errors of the invalid addresses, by (email, policy domains)
+_cached = lru_cache(maxsize=65536)(_validate)
@@ -0,0 +1,119 @@
+# Import libs
+import re
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional
+
+# Class implementation
+class EmailPolicy:
+    """
+    Immutable set of accepted email domains with its precompiled validation regex.
+
+    Policies are shared by every Email validated against them: the default policy is a
+    module-level singleton and custom domain lists are interned by EmailPolicy.for_domains.
+    """
+    __slots__ = ('__domains', '__pattern', '__regex')
+
+    def __init__(self, domains: Iterable[str]):
+        """
+        Initialize an EmailPolicy object.
+
+        Args:
+            domains (Iterable[str]): Domains accepted after the '@'.
+        """
+        self.__domains = frozenset(domains)
+        # Pattern before '@'
+        local_pattern = r'[a-zA-Z0-9._%+-]+'
+        # Pattern after '@'. It uses join to merge all domains with '|'
+        # and uses re.escape to ensure that '.' will interpreted correctly
+        domain_pattern = '|'.join(map(re.escape, sorted(self.__domains)))
+        # It merges localPattern with domainPattern before and after '@'.
+        # It use anchors '^' and '$' to ensure your positions
+        self.__pattern = rf'^{local_pattern}@({domain_pattern})$'
+        self.__regex = re.compile(self.__pattern)
+
+    # ----- Properties -----
+
+    @property
+    def domains(self) -> FrozenSet[str]:
+        """
+        Get the accepted domains.
+
+        Returns:
+            FrozenSet[str]: The domains accepted after the '@'.
+        """
+        return self.__domains
+
+    @property
+    def pattern(self) -> str:
+        """
+        Get the pattern that a valid email must fully match.
+
+        Returns:
+            str: The regular expression as text.
+        """
+        return self.__pattern
+
+    @property
+    def regex(self):
+        """
+        Get the compiled pattern.
+
+        Returns:
+            re.Pattern: The compiled regular expression.
+        """
+        return self.__regex
+
+    # ----- Methods -----
+
+    def matches(self, email: str) -> bool:
+        """
+        Check whether an email fully matches the policy.
+
+        Args:
+            email (str): The email address to check.
+
+        Returns:
+            bool: True if the email matches, False otherwise.
+        """
+        return self.__regex.fullmatch(email) is not None
+
+    @staticmethod
+    def for_domains(valid_domains: Optional[Iterable[str]] = None) -> 'EmailPolicy':
+        """
+        Get the shared policy of a list of domains.
+
+        Args:
+            valid_domains (Optional[Iterable[str]]): List of valid domains. Defaults to common providers.
+
+        Returns:
+            EmailPolicy: The default policy, or the interned policy of the given domains.
+        """
+        if valid_domains is None:
+            return DEFAULT_EMAIL_POLICY
+        return _intern(frozenset(valid_domains))
+
+    # ----- Dunder Methods -----
+
+    def __repr__(self) -> str:
+        """Return the official string representation of the EmailPolicy object."""
+        return f'EmailPolicy({sorted(self.__domains)})'
+
+    def __eq__(self, other) -> bool:
+        """Compare this EmailPolicy with another by their domains."""
+        if not isinstance(other, EmailPolicy):
+            return NotImplemented
+        return self.__domains == other.__domains
+
+    def __hash__(self) -> int:
+        """Return the hash of the domains."""
+        return hash(self.__domains)
+
+@lru_cache(maxsize=256)
+def _intern(domains: FrozenSet[str]) -> EmailPolicy:
+    """Return the single EmailPolicy of a set of domains, keeping the most recently used ones."""
+    if domains == DEFAULT_EMAIL_POLICY.domains:
+        return DEFAULT_EMAIL_POLICY
+    return EmailPolicy(domains)
+
+# Policy used when no domain list is given
+DEFAULT_EMAIL_POLICY = EmailPolicy(('gmail.com', 'outlook.com', 'hotmail.com'))
@@ -1,12 +1,40 @@
 # Import custom classes
+from .ValidationIssue import ValidationIssue
 from ..exceptions.InvalidPriceError import InvalidPriceError
 
 # Import libs
-from decimal import Decimal, InvalidOperation
+from decimal import Context, Decimal, InvalidOperation, ROUND_HALF_EVEN
+from typing import List
+import sys
+
+# Modulus of Python's numeric hash, shared by int, Fraction and Decimal, and the inverse of 10 modulo it
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INVERSE_10 = pow(10, _HASH_MODULUS - 2, _HASH_MODULUS)
+# Decimal's default context, which rounds results to 28 significant digits half to even
+_CONTEXT = Context(prec=28, rounding=ROUND_HALF_EVEN)
+_COEFFICIENT_LIMIT = 10 ** _CONTEXT.prec
+# Largest exponent magnitude handled with integers; prices beyond it go through Decimal,
+# so that one extreme value ('1E+50000000') cannot make an operation build huge powers of 10
+_EXPONENT_LIMIT = 64
 
 # Class implementation
 class Price:
-    """Class to represent and validate a price value."""
+    """
+    Class to represent and validate a price value.
+
+    The price is kept in fixed point: an integer count of units and the decimal exponent
+    they are scaled by (Decimal('19.99') is 1999 units at exponent -2). Arithmetic,
+    comparison and hashing work on integers; the Decimal is only rebuilt on access.
+    Results of arithmetic are rounded to 28 significant digits half to even, as Decimal's
+    default context does, and prices with an exponent beyond +/-64 are handled by Decimal.
+
+    A Price also equals the exact text of its value (Price('19.99') == '19.99', but not
+    '19.990'). Its hash is the hash of the Decimal, not of that text, so a Price and an equal
+    string are not interchangeable as set members or dict keys. As for every model, the price
+    must not be set while the Price is in a set or a dict key.
+    """
+    __slots__ = ('__units', '__exponent')
+
     def __init__(self, price: str):
         """
         Constructor method.
@@ -14,7 +42,7 @@ class Price:
         Args:
             price (str): Price as a string for processing.
         Raises:
-            InvalidPriceError: If the input is not a valid, positive decimal string.
+            InvalidPriceError: If the input is not a valid, positive, finite decimal string.
             InvalidOperation: if string passed is not a decimal number
         """
         self.price = price
@@ -29,7 +57,7 @@ class Price:
         Returns:
             Decimal: The validated price value.
         """
-        return self.__price
+        return Decimal(f'{self.__units}E{self.__exponent}')
     
     @price.setter
     def price(self, price: str):
@@ -40,7 +68,7 @@ class Price:
             price (str): Price as a string.
 
         Raises:
-            InvalidPriceError: If the input is not a valid, positive decimal string.
+            InvalidPriceError: If the input is not a valid, positive, finite decimal string.
             InvalidOperation: if string passed is not a decimal number
         """
         # Check if input is valid
@@ -54,61 +82,294 @@ class Price:
         # Check if input is positive
         if value <= 0:
             raise InvalidPriceError('Value must be a positive decimal number.')
-        self.__price = value
-        
+        # Check if input can be held in fixed point
+        if not value.is_finite():
+            raise InvalidPriceError('Value must be a finite decimal number.')
+        self.__units, self.__exponent = Price.__split(value)
+
+    @property
+    def exponent(self) -> int:
+        """
+        Get the decimal exponent the units are scaled by.
+
+        Returns:
+            int: The exponent (-2 for a price given in cents).
+        """
+        return self.__exponent
+
+    @property
+    def units(self) -> int:
+        """
+        Get the integer count of units of the price.
+
+        Returns:
+            int: The units, so that price == units * 10 ** exponent.
+        """
+        return self.__units
+
+    # ----- Methods -----
+
+    @staticmethod
+    def validate(price, field: str = 'price') -> List[ValidationIssue]:
+        """
+        Check a price string against the rules of the setter without raising.
+
+        Args:
+            price (Any): The value to check.
+            field (str): Name of the field reported in the issues.
+
+        Returns:
+            List[ValidationIssue]: The broken rule ('non_empty_string', 'numeric' or 'positive'), empty when valid.
+        """
+        if not isinstance(price, str) or not price.strip():
+            return [ValidationIssue(field, 'non_empty_string', price)]
+        try:
+            value = Decimal(price)
+        except InvalidOperation:
+            return [ValidationIssue(field, 'numeric', price)]
+        if value.is_nan():
+            return [ValidationIssue(field, 'numeric', price)]
+        if value <= 0:
+            return [ValidationIssue(field, 'positive', price)]
+        if not value.is_finite():
+            return [ValidationIssue(field, 'numeric', price)]
+        return []
+
+    def to_minor_units(self, scale: int = 2) -> int:
+        """
+        Get the price as an integer count of minor units, rounding half to even.
+
+        Args:
+            scale (int): Number of decimal places of a minor unit (2 for cents).
+
+        Returns:
+            int: The rounded count of minor units (1999 for 19.99 at scale 2).
+        """
+        return Price.__rescale(self.__units, self.__exponent, -scale)
+
+    @classmethod
+    def from_minor_units(cls, units: int, scale: int = 2) -> 'Price':
+        """
+        Build a Price from an integer count of minor units.
+
+        Args:
+            units (int): Count of minor units (1999 cents for 19.99).
+            scale (int): Number of decimal places of a minor unit (2 for cents).
+
+        Returns:
+            Price: The new Price object.
+
+        Raises:
+            InvalidPriceError: If units is not a positive integer or scale is not an integer.
+        """
+        if not isinstance(units, int) or isinstance(units, bool) or units <= 0:
+            raise InvalidPriceError('units must be a positive integer.')
+        if not isinstance(scale, int) or isinstance(scale, bool):
+            raise InvalidPriceError('scale must be an integer.')
+        return cls._from_units(units, -scale)
+
+    @classmethod
+    def from_float(cls, value: float, scale: int = 2, rounding: str = ROUND_HALF_EVEN) -> 'Price':
+        """
+        Build a Price from a float, rounded to a fixed number of decimal places.
+
+        The exact binary value of the float is rounded, so the rounding mode decides
+        ties explicitly instead of leaving them to the float representation.
+
+        Args:
+            value (float): The price as a float (an int is also accepted).
+            scale (int): Number of decimal places kept (2 for cents).
+            rounding (str): A rounding mode of the decimal module (default is ROUND_HALF_EVEN).
+
+        Returns:
+            Price: The new Price object.
+
+        Raises:
+            InvalidPriceError: If value is not a finite number, has more than 28 digits or is not
+                positive after rounding.
+        """
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise InvalidPriceError('value must be a float.')
+        exact = Decimal(value)
+        if not exact.is_finite():
+            raise InvalidPriceError('Value must be a finite decimal number.')
+        try:
+            rounded = exact.quantize(Decimal(1).scaleb(-scale), rounding=rounding, context=_CONTEXT)
+        except InvalidOperation:
+            raise InvalidPriceError(f'Value must have at most 28 digits once rounded to {scale} decimal places.')
+        if rounded <= 0:
+            raise InvalidPriceError('Value must be a positive decimal number.')
+        return cls._from_units(*Price.__split(rounded))
+
+    @classmethod
+    def _from_valid(cls, price: Decimal) -> 'Price':
+        """
+        Build a Price from a Decimal already validated as positive and finite, skipping the setter.
+
+        Args:
+            price (Decimal): The validated price value.
+
+        Returns:
+            Price: The new Price object.
+        """
+        return cls._from_units(*Price.__split(price))
+
+    @classmethod
+    def _from_units(cls, units: int, exponent: int) -> 'Price':
+        """
+        Build a Price from positive units and their exponent, skipping the setter.
+
+        Args:
+            units (int): The positive count of units.
+            exponent (int): The decimal exponent of the units.
+
+        Returns:
+            Price: The new Price object.
+        """
+        obj = cls.__new__(cls)
+        obj.__units = units
+        obj.__exponent = exponent
+        return obj
+
+    # ----- Private Methods -----
+
+    @staticmethod
+    def __split(value: Decimal):
+        """Return the (units, exponent) pair of a finite Decimal."""
+        sign, digits, exponent = value.as_tuple()
+        units = int(''.join(map(str, digits)))
+        return -units if sign else units, exponent
+
+    @staticmethod
+    def __rescale(units: int, exponent: int, target: int) -> int:
+        """Return units expressed at the target exponent, rounding half to even."""
+        if exponent >= target:
+            return units * 10 ** (exponent - target)
+        if target - exponent > _EXPONENT_LIMIT and target - exponent > len(str(abs(units))):
+            # Less than half a unit of the target exponent, without building 10 ** (target - exponent)
+            return 0
+        quotient, remainder = divmod(units, 10 ** (target - exponent))
+        twice = 2 * remainder
+        half = 10 ** (target - exponent)
+        if twice > half or (twice == half and quotient % 2):
+            quotient += 1
+        return quotient
+
+    def __aligned(self, other: 'Price'):
+        """
+        Return the units of both prices at their common exponent, and that exponent, or both
+        Decimal values and None when an exponent is beyond the integer range.
+        """
+        if not (-_EXPONENT_LIMIT <= self.__exponent <= _EXPONENT_LIMIT
+                and -_EXPONENT_LIMIT <= other.__exponent <= _EXPONENT_LIMIT):
+            return self.price, other.price, None
+        if self.__exponent == other.__exponent:
+            return self.__units, other.__units, self.__exponent
+        exponent = min(self.__exponent, other.__exponent)
+        return (self.__units * 10 ** (self.__exponent - exponent),
+                other.__units * 10 ** (other.__exponent - exponent), exponent)
+
+    @staticmethod
+    def __rounded(units: int, exponent: int) -> 'Price':
+        """Build the Price of an exact positive result, rounded to the precision of Decimal's default context."""
+        if units >= _COEFFICIENT_LIMIT:
+            dropped = len(str(units)) - _CONTEXT.prec
+            units = Price.__rescale(units, exponent, exponent + dropped)
+            exponent += dropped
+            # Rounding 99...9.5 up carries into one more digit
+            if units == _COEFFICIENT_LIMIT:
+                units //= 10
+                exponent += 1
+        return Price._from_units(units, exponent)
+
     # ----- Dunder Methods -----
         
     def __str__(self):
         """Return the string representation of the price."""
-        return f"{self.__price:.2f}"
+        if self.__exponent > _EXPONENT_LIMIT:
+            return f"{self.price:.2f}"
+        cents = Price.__rescale(self.__units, self.__exponent, -2)
+        return f"{cents // 100}.{cents % 100:02d}"
 
     def __repr__(self):
         """Return the official string representation of the Price object."""
-        return f"Price('{str(self.__price)}')"
+        return f"Price('{str(self.price)}')"
 
     def __eq__(self, other):
-        """Check if two Price objects are equal."""
+        """Check if two Price objects are equal, or if a Price is written exactly as a string."""
         if isinstance(other, Price):
-            return self.__price == other.__price
+            left, right, _ = self.__aligned(other)
+            return left == right
         if isinstance(other, str) and other.strip():
-            return str(self.__price) == other
+            return str(self.price) == other
         return NotImplemented
 
+    def __hash__(self):
+        """Return the hash of the numeric value, equal to the hash of the same Decimal."""
+        if self.__exponent >= 0:
+            value = self.__units * pow(10, self.__exponent, _HASH_MODULUS) % _HASH_MODULUS
+        else:
+            value = self.__units * pow(_HASH_INVERSE_10, -self.__exponent, _HASH_MODULUS) % _HASH_MODULUS
+        # A positive value reduced modulo the modulus is never -1, the only hash Decimal remaps
+        return value
+
     def __lt__(self, other):
         """Check if this Price is less than another."""
         if isinstance(other, Price):
-            return self.__price < other.__price
+            if self.__exponent == other.__exponent:
+                return self.__units < other.__units
+            left, right, _ = self.__aligned(other)
+            return left < right
         return NotImplemented
 
     def __le__(self, other):
         """Check if this Price is less than or equal to another."""
         if isinstance(other, Price):
-            return self.__price <= other.__price
+            if self.__exponent == other.__exponent:
+                return self.__units <= other.__units
+            left, right, _ = self.__aligned(other)
+            return left <= right
         return NotImplemented
 
     def __gt__(self, other):
         """Check if this Price is greater than another."""
         if isinstance(other, Price):
-            return self.__price > other.__price
+            if self.__exponent == other.__exponent:
+                return self.__units > other.__units
+            left, right, _ = self.__aligned(other)
+            return left > right
         return NotImplemented
 
     def __ge__(self, other):
         """Check if this Price is greater than or equal to another."""
         if isinstance(other, Price):
-            return self.__price >= other.__price
+            if self.__exponent == other.__exponent:
+                return self.__units >= other.__units
+            left, right, _ = self.__aligned(other)
+            return left >= right
         return NotImplemented
 
     def __add__(self, other):
         """Add two Price objects."""
         if isinstance(other, Price):
-            return Price(str(self.__price + other.__price))
+            # Common case of a running total: same exponent and no rounding
+            if self.__exponent == other.__exponent and -_EXPONENT_LIMIT <= self.__exponent <= _EXPONENT_LIMIT:
+                units = self.__units + other.__units
+                if units < _COEFFICIENT_LIMIT:
+                    return Price._from_units(units, self.__exponent)
+            left, right, exponent = self.__aligned(other)
+            if exponent is None:
+                return Price._from_valid(_CONTEXT.add(left, right))
+            return Price.__rounded(left + right, exponent)
         return NotImplemented
 
     def __sub__(self, other):
         """Subtract one Price from another."""
         if isinstance(other, Price):
-            result = self.__price - other.__price
-            if result <= 0:
+            left, right, exponent = self.__aligned(other)
+            if left <= right:
                 raise InvalidPriceError('Resulting price must be positive.')
-            return Price(str(result))
-        return NotImplemented
\ No newline at end of file
+            if exponent is None:
+                return Price._from_valid(_CONTEXT.subtract(left, right))
+            return Price.__rounded(left - right, exponent)
+        return NotImplemented
@@ -0,0 +1,402 @@
+# Import custom classes
+from ..exceptions.InvalidPriceError import InvalidPriceError
+from ..exceptions.InvalidQuantityError import InvalidQuantityError
+from .Price import Price
+
+# Import libs
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Dict, Iterable, List
+import numpy as np
+
+# Largest count of cents an element can hold
+_INT64_MAX = np.iinfo(np.int64).max
+
+# Class implementation
+class PriceArray:
+    """
+    Column of prices backed by an int64 array of cents.
+
+    Every element keeps the invariant of Price (strictly positive), checked on the whole array
+    at once. Arithmetic and aggregation run on integers, so totals never drift like float sums.
+    Elementwise results beyond int64 raise OverflowError, and totals beyond it are taken exactly
+    with Python integers instead of wrapping around.
+    """
+    __slots__ = ('__cents',)
+
+    def __init__(self, cents: Iterable[int]):
+        """
+        Initialize a PriceArray from counts of cents.
+
+        Args:
+            cents (Iterable[int]): Integer number of cents of each price (1999 for 19.99).
+
+        Raises:
+            InvalidPriceError: If the values are not integers or any of them is not positive.
+        """
+        values = np.asarray(cents)
+        if values.size == 0:
+            values = values.astype(np.int64)
+        if values.ndim != 1 or values.dtype.kind not in 'iu':
+            raise InvalidPriceError('cents must be a one-dimensional sequence of integers.')
+        self.__cents = PriceArray.__checked(values.astype(np.int64))
+
+    # ----- Properties -----
+
+    @property
+    def cents(self):
+        """
+        Get the read-only array of cents.
+
+        Returns:
+            ndarray: The int64 count of cents of each price.
+        """
+        return self.__cents
+
+    # ----- Methods -----
+
+    @classmethod
+    def from_prices(cls, prices: Iterable[Price]) -> 'PriceArray':
+        """
+        Build a PriceArray from Price objects, rounding each to cents half to even.
+
+        Args:
+            prices (Iterable[Price]): The prices.
+
+        Returns:
+            PriceArray: The new PriceArray.
+
+        Raises:
+            InvalidPriceError: If an element is not a Price or rounds to zero cents.
+        """
+        cents = []
+        for price in prices:
+            if not isinstance(price, Price):
+                raise InvalidPriceError('Every element must be a Price object.')
+            cents.append(price.to_minor_units())
+        return cls._from_cents(PriceArray.__checked(np.array(cents, dtype=np.int64)))
+
+    @classmethod
+    def from_series(cls, series) -> 'PriceArray':
+        """
+        Build a PriceArray from a pandas column of prices in currency units.
+
+        Every value is rounded to cents half to even from its exact decimal form, as Price(str(value))
+        and Product.from_dataframe do: floats through their shortest repr, so 2.675 gives 268 cents
+        even though the nearest double is slightly below 2.675. Numeric columns are converted at
+        once, except for the floats lying on a half cent, which are converted like the other
+        columns (strings, Decimals): exactly, once per distinct value.
+
+        Args:
+            series (Series): Column of prices such as 'unit_price' or 'total_sales_value'.
+
+        Returns:
+            PriceArray: The new PriceArray.
+
+        Raises:
+            InvalidPriceError: If a value is missing, not numeric, not finite or not positive.
+            OverflowError: If a price has more cents than int64 can hold.
+        """
+        return cls._from_cents(PriceArray.__checked(PriceArray._to_cents(series)))
+
+    def to_prices(self) -> List[Price]:
+        """
+        Convert the array back to Price objects.
+
+        Returns:
+            List[Price]: One Price per element, with two decimal places.
+        """
+        return [Price._from_units(cents, -2) for cents in self.__cents.tolist()]
+
+    def to_series(self, index=None, name=None):
+        """
+        Convert the array to a pandas column of prices in currency units.
+
+        Args:
+            index (Optional[Index]): Index of the column (default is a RangeIndex).
+            name (Optional[str]): Name of the column.
+
+        Returns:
+            Series: float64 column, for display and interoperability. Totals should be taken on the PriceArray.
+        """
+        import pandas as pd
+        return pd.Series(self.__cents / 100, index=index, name=name)
+
+    def sum(self) -> Price:
+        """
+        Get the exact total of the prices.
+
+        Returns:
+            Price: The total.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        return Price._from_units(self.__total(), -2)
+
+    def mean(self) -> Price:
+        """
+        Get the mean of the prices, rounded to cents half to even.
+
+        Returns:
+            Price: The mean price.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        quotient, remainder = divmod(self.__total(), len(self))
+        if 2 * remainder > len(self) or (2 * remainder == len(self) and quotient % 2):
+            quotient += 1
+        return Price._from_units(quotient, -2)
+
+    def min(self) -> Price:
+        """
+        Get the lowest price.
+
+        Returns:
+            Price: The lowest price.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        self.__require_values()
+        return Price._from_units(int(self.__cents.min()), -2)
+
+    def max(self) -> Price:
+        """
+        Get the highest price.
+
+        Returns:
+            Price: The highest price.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        self.__require_values()
+        return Price._from_units(int(self.__cents.max()), -2)
+
+    def argsort(self):
+        """
+        Get the positions that sort the prices, keeping the order of equal prices.
+
+        Returns:
+            ndarray: Indexes of the elements from the lowest to the highest price.
+        """
+        return np.argsort(self.__cents, kind='stable')
+
+    def sum_by(self, keys) -> Dict[object, Price]:
+        """
+        Get the exact total of the prices of each group.
+
+        Args:
+            keys (ArrayLike): Group of each element (state, category, client id...), same length as the array.
+
+        Returns:
+            dict: Mapping of each group, in order of first appearance, to its total.
+
+        Raises:
+            ValueError: If keys does not have one value per element or has missing values.
+        """
+        import pandas as pd
+        codes, uniques = pd.factorize(np.asarray(keys, dtype=object))
+        if len(codes) != len(self):
+            raise ValueError('keys must have one value per price.')
+        if (codes < 0).any():
+            raise ValueError('keys must not have missing values.')
+        # Totals that could wrap around int64 are kept as Python ints
+        wide = len(self) and int(self.__cents.max()) > _INT64_MAX // len(self)
+        totals = np.zeros(len(uniques), dtype=object if wide else np.int64)
+        np.add.at(totals, codes, self.__cents.astype(object) if wide else self.__cents)
+        return {key: Price._from_units(total, -2) for key, total in zip(uniques.tolist(), totals.tolist())}
+
+    @staticmethod
+    def _to_cents(series):
+        """
+        Convert a pandas column of amounts in currency units to int64 cents, without checking their sign.
+
+        Rounding is the one of from_series, which checks the result is positive; callers holding
+        zero or negative amounts, such as SalesLedger, use this conversion directly.
+
+        Args:
+            series (Series): Column of amounts without missing values.
+
+        Returns:
+            ndarray: The cents of every amount, rounded half to even from its exact decimal form.
+
+        Raises:
+            InvalidPriceError: If a value is missing, not numeric or not finite.
+            OverflowError: If an amount has more cents than int64 can hold.
+        """
+        if series.dtype.kind in 'iu':
+            values = series.to_numpy()
+            if ((values > _INT64_MAX // 100) | (values < -(_INT64_MAX // 100))).any():
+                raise OverflowError('Prices must fit in int64 cents.')
+            return values.astype(np.int64) * 100
+        if series.dtype.kind == 'f':
+            values = series.to_numpy(dtype=np.float64)
+            if not np.isfinite(values).all():
+                raise InvalidPriceError('Every price must be a finite number.')
+            scaled = values * 100
+            if (np.abs(scaled) >= 2.0 ** 63).any():
+                raise OverflowError('Prices must fit in int64 cents.')
+            cents = np.rint(scaled).astype(np.int64)
+            # Only values within rounding error of a half cent can round differently from their repr
+            ties = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) <= 1e-9 * np.maximum(1.0, np.abs(scaled))
+            if ties.any():
+                cents[ties] = PriceArray.__exact_cents(series[ties])
+            return cents
+        return PriceArray.__exact_cents(series)
+
+    @classmethod
+    def _from_cents(cls, cents) -> 'PriceArray':
+        """
+        Build a PriceArray from a read-only int64 array already checked as positive, skipping validation.
+
+        Args:
+            cents (ndarray): The checked array of cents.
+
+        Returns:
+            PriceArray: The new PriceArray.
+        """
+        obj = cls.__new__(cls)
+        obj.__cents = cents
+        return obj
+
+    # ----- Private Methods -----
+
+    @staticmethod
+    def __checked(cents):
+        """Return a read-only copy of an int64 array of cents, raising if any of them is not positive."""
+        if not (cents > 0).all():
+            raise InvalidPriceError('Every price must be a positive decimal number.')
+        cents = np.array(cents, dtype=np.int64)
+        cents.setflags(write=False)
+        return cents
+
+    @staticmethod
+    def __exact_cents(series):
+        """Return the int64 cents of a column, converting each distinct value exactly and rounding half to even."""
+        codes, uniques = series.factorize()
+        if (codes < 0).any():
+            raise InvalidPriceError('Every price must be a finite number.')
+        cents = []
+        for value in uniques:
+            try:
+                number = Decimal(value) if isinstance(value, (str, Decimal)) else Decimal(str(value))
+                cents.append(int(number.scaleb(2).to_integral_value(rounding=ROUND_HALF_EVEN)))
+            except Exception:
+                raise InvalidPriceError(f'Value {value!r} is not a valid decimal number.')
+        if any(abs(value) > _INT64_MAX for value in cents):
+            raise OverflowError('Prices must fit in int64 cents.')
+        return np.array(cents, dtype=np.int64)[codes]
+
+    def __require_values(self):
+        """Raise ValueError when the array is empty."""
+        if len(self.__cents) == 0:
+            raise ValueError('The PriceArray is empty.')
+
+    def __total(self) -> int:
+        """Return the exact total of the cents as a Python int."""
+        self.__require_values()
+        if int(self.__cents.max()) > _INT64_MAX // len(self.__cents):
+            # The int64 sum could wrap around
+            return sum(self.__cents.tolist())
+        return int(self.__cents.sum())
+
+    def __operand(self, other):
+        """Return the cents of a PriceArray or Price operand (rounded to cents), or None when unsupported."""
+        if isinstance(other, PriceArray):
+            if len(other) != len(self):
+                raise ValueError('PriceArrays must have the same length.')
+            return other.__cents
+        if isinstance(other, Price):
+            return other.to_minor_units()
+        return None
+
+    # ----- Dunder Methods -----
+
+    def __len__(self) -> int:
+        """Return the number of prices."""
+        return len(self.__cents)
+
+    def __iter__(self):
+        """Iterate over the elements as Price objects."""
+        return iter(self.to_prices())
+
+    def __getitem__(self, key):
+        """Return the Price at an index, or a PriceArray for a slice, mask or list of indexes."""
+        if isinstance(key, (int, np.integer)):
+            return Price._from_units(int(self.__cents[key]), -2)
+        selected = self.__cents[key]
+        selected.setflags(write=False)
+        return PriceArray._from_cents(selected)
+
+    def __repr__(self) -> str:
+        """Return the official string representation of the PriceArray object."""
+        return f"PriceArray({self.__cents.tolist()!r})"
+
+    def __add__(self, other):
+        """Add a PriceArray or a Price to every element."""
+        cents = self.__operand(other)
+        if cents is None:
+            return NotImplemented
+        if np.any(self.__cents > _INT64_MAX - cents):
+            raise OverflowError('Resulting prices must fit in int64 cents.')
+        return PriceArray._from_cents(PriceArray.__checked(self.__cents + cents))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Subtract a PriceArray or a Price from every element, keeping every result positive."""
+        cents = self.__operand(other)
+        if cents is None:
+            return NotImplemented
+        if not (self.__cents > cents).all():
+            raise InvalidPriceError('Resulting price must be positive.')
+        return PriceArray._from_cents(PriceArray.__checked(self.__cents - cents))
+
+    def __mul__(self, quantity):
+        """Multiply every element by a positive integer quantity or by an array of quantities."""
+        quantities = np.asarray(quantity)
+        if quantities.dtype.kind not in 'iu' or quantities.ndim > 1:
+            return NotImplemented
+        if quantities.ndim == 1 and len(quantities) != len(self):
+            raise ValueError('quantities must have one value per price.')
+        if not (quantities > 0).all():
+            raise InvalidQuantityError('Quantities must be positive integers.')
+        if np.any(self.__cents > _INT64_MAX // quantities):
+            raise OverflowError('Resulting prices must fit in int64 cents.')
+        return PriceArray._from_cents(PriceArray.__checked(self.__cents * quantities.astype(np.int64)))
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        """Return the mask of elements equal to a PriceArray or a Price."""
+        cents = self.__operand(other)
+        return NotImplemented if cents is None else self.__cents == cents
+
+    def __ne__(self, other):
+        """Return the mask of elements different from a PriceArray or a Price."""
+        cents = self.__operand(other)
+        return NotImplemented if cents is None else self.__cents != cents
+
+    def __lt__(self, other):
+        """Return the mask of elements lower than a PriceArray or a Price."""
+        cents = self.__operand(other)
+        return NotImplemented if cents is None else self.__cents < cents
+
+    def __le__(self, other):
+        """Return the mask of elements lower than or equal to a PriceArray or a Price."""
+        cents = self.__operand(other)
+        return NotImplemented if cents is None else self.__cents <= cents
+
+    def __gt__(self, other):
+        """Return the mask of elements greater than a PriceArray or a Price."""
+        cents = self.__operand(other)
+        return NotImplemented if cents is None else self.__cents > cents
+
+    def __ge__(self, other):
+        """Return the mask of elements greater than or equal to a PriceArray or a Price."""
+        cents = self.__operand(other)
+        return NotImplemented if cents is None else self.__cents >= cents
+
+    __hash__ = None
@@ -1,16 +1,25 @@
 # Import custom classes
 from .Price import Price
+from .ValidationIssue import ValidationIssue
+from . import _columns, _rules
 from ..exceptions.InvalidIdError import InvalidIdError
+from ..instrumentation.Instrumentation import stage
 from ..exceptions.InvalidNameError import InvalidNameError
 from ..exceptions.InvalidPriceError import InvalidPriceError
 from ..exceptions.InvalidCategoryError import InvalidCategoryError
 from ..exceptions.InvalidQuantityError import InvalidQuantityError
 
+# Import libs
+from typing import List, Mapping, Tuple
+
 # Class implementation
 class Product:
     """
     Class to represent a product with id, name, category, price, and quantity.
+
+    The id is stored once as an integer; its 'P'-prefixed form is derived on access.
     """
+    __slots__ = ('__id_product', '__name', '__category', '__price', '__quantity')
 
     def __init__(self, id_product: int, name: str, category: str, price: Price, quantity: int):
         """
@@ -31,7 +40,6 @@ class Product:
             InvalidQuantityError: If value is not a non-negative integer.
         """
         self.id_product = id_product
-        self.id_product_int = id_product
         self.name = name
         self.category = category
         self.price = price
@@ -47,7 +55,7 @@ class Product:
         Returns:
             str: The product's id.
         """
-        return self.__id_product
+        return f'P{self.__id_product}'  # Format id with 'P' prefix
 
     @id_product.setter
     def id_product(self, id_product: int):
@@ -62,7 +70,7 @@ class Product:
         """
         if not isinstance(id_product, int) or id_product <= 0:
             raise InvalidIdError("id_product must be a positive integer.")
-        self.__id_product = f'P{id_product}' # Format id with 'P' prefix 
+        self.__id_product = id_product
         
     @property
     def id_product_int(self):
@@ -70,9 +78,9 @@ class Product:
         Get the product's unique identifier.
 
         Returns:
-            str: The product's id.
+            int: The product's id.
         """
-        return self.__id_product_int
+        return self.__id_product
     
     @id_product_int.setter
     def id_product_int(self, id_product: int):
@@ -87,7 +95,7 @@ class Product:
         """
         if not isinstance(id_product, int) or id_product <= 0:
             raise InvalidIdError("id_product must be a positive integer.")
-        self.__id_product_int = id_product
+        self.__id_product = id_product
 
     @property
     def name(self) -> str:
@@ -189,6 +197,139 @@ class Product:
             raise InvalidQuantityError("quantity must be a non-negative integer.")
         self.__quantity = quantity
         
+    # ----- Bulk Construction -----
+
+    @classmethod
+    def from_dataframe(cls, df) -> Tuple[List['Product'], 'pd.DataFrame']:
+        """
+        Build Product objects from the Products sheet, validating the whole sheet column-wise.
+
+        The columns 'id_product' ('P001' or already parsed integers), 'name_product', 'category',
+        'unit_price' and 'stock' are checked with the same rules as the property setters. Prices
+        are converted to exact Decimals once per distinct value, as Price(str(unit_price)) would,
+        and objects are built only for the rows that passed every rule.
+
+        Args:
+            df (DataFrame): The Products sheet.
+
+        Returns:
+            Tuple[List[Product], DataFrame]: The products of the valid rows, in row order, and the report of
+            every violation with the columns 'row', 'field', 'rule' and 'value'.
+        """
+        import numpy as np
+        with stage('validate', 'Products') as validating:
+            ids, prices, stock, checks = cls.__checks(df)
+            valid = ~np.logical_or.reduce([failed for _, _, failed, _ in checks])
+            validating.add_rows(len(df))
+            _columns.record_failures(validating, checks)
+        with stage('construct', 'Products') as constructing:
+            # Build objects of the valid rows only, without running the setters again
+            rows = zip(ids[valid].tolist(), df['name_product'][valid].tolist(), df['category'][valid].tolist(),
+                       prices[valid].tolist(), stock[valid].tolist())
+            with _columns.bulk_allocation():
+                products = [
+                    cls._from_valid(id_product, name.strip(), category.strip(), Price._from_valid(price), quantity)
+                    for id_product, name, category, price, quantity in rows
+                ]
+            constructing.add_rows(len(products))
+        return products, _columns.report(df.index, checks)
+
+    # ----- Validation -----
+
+    @staticmethod
+    def validate(record: Mapping) -> List[ValidationIssue]:
+        """
+        Check a row of the Products sheet against the rules of the setters without raising.
+
+        Args:
+            record (Mapping): Values of the columns 'id_product', 'name_product', 'category', 'unit_price' and 'stock'.
+
+        Returns:
+            List[ValidationIssue]: Every broken rule, in the order the setters check them. Empty when valid.
+        """
+        issues = []
+        raw_id = record.get('id_product')
+        id_product = _rules.parse_id(raw_id, 'P')
+        if id_product is None:
+            issues.append(ValidationIssue('id_product', 'format', raw_id))
+        elif id_product <= 0:
+            issues.append(ValidationIssue('id_product', 'positive', raw_id))
+        for field in ('name_product', 'category'):
+            if not _rules.filled(record.get(field)):
+                issues.append(ValidationIssue(field, 'non_empty_string', record.get(field)))
+        price = _rules.decimal(record.get('unit_price'))
+        if price is None:
+            issues.append(ValidationIssue('unit_price', 'numeric', record.get('unit_price')))
+        elif price <= 0:
+            issues.append(ValidationIssue('unit_price', 'positive', record.get('unit_price')))
+        stock = _rules.integer(record.get('stock'))
+        if stock is None:
+            issues.append(ValidationIssue('stock', 'integer', record.get('stock')))
+        elif stock < 0:
+            issues.append(ValidationIssue('stock', 'non_negative', record.get('stock')))
+        return issues
+
+    @classmethod
+    def validate_dataframe(cls, df) -> 'pd.DataFrame':
+        """
+        Check the whole Products sheet column-wise without building any object.
+
+        Args:
+            df (DataFrame): The Products sheet.
+
+        Returns:
+            DataFrame: The report of every violation with the columns 'row', 'field', 'rule' and 'value'.
+        """
+        with stage('validate', 'Products') as validating:
+            *_, checks = cls.__checks(df)
+            validating.add_rows(len(df))
+            _columns.record_failures(validating, checks)
+        return _columns.report(df.index, checks)
+
+    @staticmethod
+    def __checks(df):
+        """Return the parsed ids, prices and stock of the Products sheet and the (field, rule, failure mask, values) of every rule."""
+        import numpy as np
+        ids, parsed = _columns.parse_ids(df['id_product'], 'P')
+        parsed = parsed.to_numpy()
+        prices, numeric = _columns.decimals(df['unit_price'])
+        stock, integral = _columns.integers(df['stock'])
+        integral = integral.to_numpy()
+        # Failure masks, one per rule, in the order the setters check them
+        return ids, prices, stock, [
+            ('id_product', 'format', ~parsed, df['id_product']),
+            ('id_product', 'positive', parsed & ~ids.gt(0).fillna(False).to_numpy(dtype=bool), df['id_product']),
+            ('name_product', 'non_empty_string', ~_columns.check(df['name_product'], _columns.filled), df['name_product']),
+            ('category', 'non_empty_string', ~_columns.check(df['category'], _columns.filled), df['category']),
+            ('unit_price', 'numeric', ~numeric, df['unit_price']),
+            ('unit_price', 'positive', numeric & ~np.greater(np.where(numeric, prices, 0), 0).astype(bool), df['unit_price']),
+            ('stock', 'integer', ~integral, df['stock']),
+            ('stock', 'non_negative', integral & ~stock.ge(0).fillna(False).to_numpy(dtype=bool), df['stock']),
+        ]
+
+    @classmethod
+    def _from_valid(cls, id_product: int, name: str, category: str, price: Price, quantity: int) -> 'Product':
+        """
+        Build a Product from values already validated, skipping the setters.
+
+        Args:
+            id_product (int): The validated positive id.
+            name (str): The validated, stripped name.
+            category (str): The validated, stripped category.
+            price (Price): The price object.
+            quantity (int): The validated non-negative quantity.
+
+        Returns:
+            Product: The new Product object.
+        """
+        obj = cls.__new__(cls)
+        obj.__id_product = id_product
+        obj.__name = name
+        obj.__category = category
+        obj.__price = price
+        obj.__quantity = quantity
+        return obj
+
     # ----- Dunder Methods -----
 
     def __str__(self) -> str:
@@ -229,4 +370,17 @@ class Product:
             self.category == other.category and
             self.price == other.price and
             self.quantity == other.quantity
-        )
\ No newline at end of file
+        )
+
+    def __hash__(self) -> int:
+        """
+        Return the hash of the Product, consistent with __eq__.
+
+        Only the id is hashed: equal products have equal ids, and the hash does not change
+        when the other attributes are set. The id itself can still be set: do not set it while
+        the product is in a set or a dict key, where it would be left in the wrong bucket.
+
+        Returns:
+            int: The hash of the id.
+        """
+        return hash(self.__id_product)
@@ -0,0 +1,19 @@
+# Import libs
+from typing import Any, NamedTuple
+
+# Class implementation
+class ValidationIssue(NamedTuple):
+    """
+    One rule broken by a value, as reported by the validate methods of the models.
+
+    The rule codes are those of the bulk constructors' reports: 'format', 'positive',
+    'non_empty_string', 'pattern', 'valid_state', 'numeric', 'integer' and 'non_negative'.
+
+    Attributes:
+        field (str): Name of the field or sheet column.
+        rule (str): Code of the broken rule.
+        value (Any): The rejected value.
+    """
+    field: str
+    rule: str
+    value: Any
@@ -1,15 +1,38 @@
 # Import all model classes
 from .Address import Address
+from .CacheInfo import CacheInfo
 from .Product import Product
 from .Client import Client
 from .Email import Email
+from .EmailPolicy import EmailPolicy, DEFAULT_EMAIL_POLICY
 from .Price import Price
+from .ValidationIssue import ValidationIssue
+
+# Import necessary libraries
+import importlib
 
 # Define the __all__ variable to control what gets imported with 'from models import *'
 __all__ = [
     'Address',
+    'CacheInfo',
     'Product',
     'Client',
     'Email',
-    'Price'
-]
\ No newline at end of file
+    'EmailPolicy',
+    'DEFAULT_EMAIL_POLICY',
+    'Price',
+    'PriceArray',
+    'ValidationIssue'
+]
+
+def __getattr__(name: str):
+    """Import PriceArray, which needs numpy, on first access instead of with the models."""
+    if name != 'PriceArray':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module('.PriceArray', __name__).PriceArray
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """List the exported names with the attributes already loaded."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,170 @@
+# Column-wise helpers shared by the bulk constructors of the models.
+# pandas is only needed by the caller's DataFrame, so it is never imported at module level.
+
+# Import custom modules
+from . import _rules
+
+# Import libs
+from contextlib import contextmanager
+import gc
+
+def text(series):
+    """
+    Return the series as a nullable string column where every non-string value is missing.
+
+    Args:
+        series (Series): Any pandas Series (object, categorical, numeric...).
+
+    Returns:
+        Series: Column of dtype 'string' with <NA> for values that are not str.
+    """
+    values = series.astype(object) if series.dtype == 'category' else series
+    return values.where(values.map(type).eq(str)).astype('string')
+
+def filled(text_series):
+    """
+    Return a boolean mask of strings that are not empty after stripping whitespace.
+
+    Args:
+        text_series (Series): Column returned by text().
+
+    Returns:
+        Series: Boolean mask, False for missing values.
+    """
+    return text_series.str.strip().str.len().gt(0).fillna(False).astype(bool)
+
+def check(series, rule):
+    """
+    Evaluate a column-wise rule once per distinct value and broadcast the result to every row.
+
+    Repeated values (states, cities, categories, common names) are therefore checked only once.
+    Values that are not strings are seen by the rule as missing.
+
+    Args:
+        series (Series): Raw column to check.
+        rule (Callable[[Series], Series]): Function mapping a column returned by text() to a boolean mask.
+
+    Returns:
+        ndarray: Boolean mask aligned with the rows of series, False for missing values.
+    """
+    import numpy as np
+    values = series.astype(object) if series.dtype == 'category' else series
+    codes, uniques = values.factorize()
+    mask = rule(text(type(values)(uniques, dtype=object))).fillna(False).to_numpy(dtype=bool)
+    # Missing values get the code -1, which takes the False appended at the end
+    return np.append(mask, False)[codes]
+
+def parse_ids(series, prefix: str):
+    """
+    Parse identifiers written as '<prefix><digits>' (e.g. 'C001') or already given as integers.
+
+    Args:
+        series (Series): Raw identifier column.
+        prefix (str): Expected prefix of textual identifiers.
+
+    Returns:
+        Tuple[Series, Series]: Nullable Int64 identifiers and a mask of values that could be parsed.
+    """
+    if series.dtype.kind in 'iuf' or str(series.dtype) in ('Int8', 'Int16', 'Int32', 'Int64'):
+        return integers(series)
+    else:
+        values = series.astype(object) if series.dtype == 'category' else series
+        # Integers mixed in an object column are accepted as they are
+        mixed = values.map(type).eq(int)
+        digits = text(values).str.extract(rf'^{prefix}([0-9]{{1,18}})$', expand=False)
+        ids = digits.astype('Int64')
+        ids[mixed] = values[mixed].astype('Int64')
+    parsed = ids.notna().astype(bool)
+    return ids, parsed
+
+def integers(series):
+    """
+    Parse a column of integers, accepting float columns holding integral values.
+
+    Args:
+        series (Series): Raw numeric or object column.
+
+    Returns:
+        Tuple[Series, Series]: Nullable Int64 values and a mask of values that are integers.
+    """
+    if series.dtype.kind in 'iu' or str(series.dtype) in ('Int8', 'Int16', 'Int32', 'Int64'):
+        values = series.astype('Int64')
+    elif series.dtype.kind == 'f':
+        integral = series.notna() & series.eq(series.round())
+        values = series.where(integral).astype('Int64')
+    else:
+        objects = series.astype(object)
+        values = objects.where(objects.map(type).eq(int)).astype('Int64')
+    return values, values.notna().astype(bool)
+
+def decimals(series):
+    """
+    Convert a price column to exact Decimals, once per distinct value.
+
+    Each distinct value is converted by _rules.decimal, so numbers go through their shortest
+    repr exactly as Price(str(value)) does, and values that are not finite numbers are rejected.
+
+    Args:
+        series (Series): Raw price column.
+
+    Returns:
+        Tuple[ndarray, ndarray]: Object array of Decimals (None when not numeric) and the numeric mask.
+    """
+    import numpy as np
+    codes, uniques = series.factorize()
+    converted = [_rules.decimal(value) for value in uniques]
+    # Missing values get the code -1, which takes the None appended at the end
+    values = np.array(converted + [None], dtype=object)[codes]
+    return values, np.not_equal(values, None)
+
+def report(index, checks):
+    """
+    Build the report of rejected values of a DataFrame.
+
+    Args:
+        index (Index): Index of the validated DataFrame.
+        checks (List[Tuple[str, str, ndarray, Series]]): (field, rule, failure mask, values) of every rule.
+
+    Returns:
+        DataFrame: One line per violation with the columns 'row', 'field', 'rule' and 'value', ordered by row.
+    """
+    import pandas as pd
+    frames = []
+    for field, rule, failed, values in checks:
+        if failed.any():
+            frames.append(pd.DataFrame({
+                'row': index[failed],
+                'field': field,
+                'rule': rule,
+                'value': values.to_numpy(dtype=object)[failed]
+            }))
+    if not frames:
+        return pd.DataFrame(columns=['row', 'field', 'rule', 'value'])
+    return pd.concat(frames, ignore_index=True).sort_values('row', kind='stable', ignore_index=True)
+
+def record_failures(stage, checks):
+    """
+    Count the rows failing each rule on an instrumentation stage, when instrumentation is enabled.
+
+    Args:
+        stage (Stage): Stage returned by instrumentation.stage().
+        checks (List[Tuple[str, str, ndarray, Series]]): (field, rule, failure mask, values) of every rule.
+    """
+    if stage.enabled:
+        stage.add_failures({f'{field}.{rule}': int(failed.sum()) for field, rule, failed, _ in checks if failed.any()})
+
+@contextmanager
+def bulk_allocation():
+    """
+    Pause the cyclic garbage collector while many objects are built at once.
+
+    The objects built by the bulk constructors hold no reference cycles, so collecting while
+    they are allocated only costs time. The previous state of the collector is restored.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
@@ -0,0 +1,88 @@
+# Scalar versions of the rules checked by the property setters and by the column-wise helpers.
+# They never raise: a value breaking a rule is reported as None or False.
+
+# Import libs
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Optional
+import numbers
+import re
+
+def filled(value) -> bool:
+    """
+    Check that a value is a string that is not empty after stripping whitespace.
+
+    Args:
+        value (Any): The value to check.
+
+    Returns:
+        bool: True for a non-empty string.
+    """
+    return isinstance(value, str) and bool(value.strip())
+
+def parse_id(value, prefix: str) -> Optional[int]:
+    """
+    Parse an identifier written as '<prefix><digits>' (e.g. 'C001') or already given as an integer.
+
+    Args:
+        value (Any): Raw identifier.
+        prefix (str): Expected prefix of textual identifiers.
+
+    Returns:
+        Optional[int]: The numeric identifier, or None when the value is malformed.
+    """
+    if isinstance(value, str):
+        match = _id_pattern(prefix).fullmatch(value)
+        return int(match.group(1)) if match else None
+    return integer(value)
+
+@lru_cache(maxsize=None)
+def _id_pattern(prefix: str):
+    """Return the compiled pattern of the identifiers of a prefix."""
+    return re.compile(rf'{re.escape(prefix)}([0-9]{{1,18}})')
+
+def integer(value) -> Optional[int]:
+    """
+    Parse an integer, accepting floats holding integral values.
+
+    Any integral or real number type is accepted, so the NumPy scalars of a DataFrame row
+    (np.int64(50), np.float64(3.0)) are parsed like Python numbers. Booleans are not integers.
+
+    Args:
+        value (Any): Raw number.
+
+    Returns:
+        Optional[int]: The integer, or None when the value is not an integer.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real) and float(value).is_integer():
+        return int(value)
+    return None
+
+def decimal(value) -> Optional[Decimal]:
+    """
+    Convert a price to an exact Decimal.
+
+    Numbers, NumPy scalars included, are converted through their shortest repr (2999.9 ->
+    Decimal('2999.9')), exactly as Price(str(value)) does. Strings are parsed as they are;
+    anything else is not numeric.
+
+    Args:
+        value (Any): Raw price.
+
+    Returns:
+        Optional[Decimal]: The finite Decimal, or None when the value is not a finite number.
+    """
+    try:
+        if isinstance(value, str):
+            number = Decimal(value)
+        elif isinstance(value, numbers.Real) and not isinstance(value, bool):
+            number = Decimal(str(value))
+        else:
+            return None
+    except (InvalidOperation, ValueError):
+        return None
+    return number if number.is_finite() else None
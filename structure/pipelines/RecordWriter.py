@@ -0,0 +1,173 @@
+# Import necessary libraries
+from typing import Dict, List
+import os
+import pandas as pd
+
+# Define the RecordWriter class
+class RecordWriter:
+    """
+    Appends DataFrames of records to a CSV, JSON Lines or Parquet file, one chunk at a time.
+
+    Only the chunk being written is held in memory. Records go to a temporary file next to the
+    target, which replaces the target on close, so an interrupted run never leaves a truncated
+    file behind. Parquet files need pyarrow, which is only imported by Parquet writers.
+
+    Columns given with their types are written to Parquet with that schema. Otherwise the schema
+    is inferred from the first chunk, whose empty or fully missing columns have no usable type.
+    """
+    # Supported formats and the extension of their files
+    FORMATS = {'csv': '.csv', 'jsonl': '.jsonl', 'parquet': '.parquet'}
+    # Column types accepted with the columns
+    TYPES = ('int64', 'string', 'timestamp')
+
+    def __init__(self, file_path: str, columns: List[str] | Dict[str, str], format: str = 'csv'):
+        """
+        Initializes a RecordWriter instance and opens its temporary file.
+
+        Args:
+            file_path (str): Path of the file to write.
+            columns (List[str]|Dict[str, str]): Columns written, in order, also used for the header of
+                empty files. A dict also gives the type of each column, one of TYPES.
+            format (str): One of 'csv', 'jsonl' or 'parquet'.
+
+        Raises:
+            ValueError: If format or a column type is not supported.
+            ImportError: If format is 'parquet' and pyarrow is not installed.
+        """
+        if format not in RecordWriter.FORMATS:
+            raise ValueError(f"format must be one of {list(RecordWriter.FORMATS)}.")
+        types = dict(columns) if isinstance(columns, dict) else None
+        if types is not None and not set(types.values()) <= set(RecordWriter.TYPES):
+            raise ValueError(f"Column types must be among {list(RecordWriter.TYPES)}.")
+        if format == 'parquet':
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                raise ImportError("Writing Parquet files requires pyarrow: pip install pyarrow") from None
+        self.__file_path = file_path
+        self.__columns = list(columns)
+        self.__types = types
+        self.__format = format
+        self.__rows = 0
+        self.__header = False
+        self.__temp_path = f'{file_path}.tmp'
+        self.__writer = None
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        # Parquet files are opened with the schema of their columns, or of their first chunk
+        self.__file = None if format == 'parquet' else open(self.__temp_path, 'w', encoding='utf-8', newline='')
+
+    # ----- Properties -----
+
+    @property
+    def file_path(self) -> str:
+        """
+        Gets the path of the written file.
+
+        Returns:
+            str: The target path.
+        """
+        return self.__file_path
+
+    @property
+    def format(self) -> str:
+        """
+        Gets the format of the written file.
+
+        Returns:
+            str: 'csv', 'jsonl' or 'parquet'.
+        """
+        return self.__format
+
+    @property
+    def rows(self) -> int:
+        """
+        Gets the number of records written so far.
+
+        Returns:
+            int: The number of records.
+        """
+        return self.__rows
+
+    # ----- Methods -----
+
+    def write(self, df: pd.DataFrame):
+        """
+        Appends the records of a DataFrame.
+
+        Args:
+            df (DataFrame): Records holding at least the columns of the writer. Its index is not written.
+        """
+        df = df.reindex(columns=self.__columns)
+        if self.__format == 'csv':
+            df.to_csv(self.__file, header=not self.__header, index=False)
+            self.__header = True
+        elif self.__format == 'jsonl':
+            # Empty chunks would be written as an empty line
+            if len(df):
+                df.to_json(self.__file, orient='records', lines=True, date_format='iso', force_ascii=False)
+        else:
+            self.__write_parquet(df)
+        self.__rows += len(df)
+
+    def close(self):
+        """
+        Finishes the file and moves it to its path. Files without records still get the header (CSV and Parquet).
+        """
+        if self.__format == 'csv' and not self.__header:
+            self.write(pd.DataFrame(columns=self.__columns))
+        if self.__format == 'parquet' and self.__writer is None:
+            self.__write_parquet(pd.DataFrame(columns=self.__columns))
+        self.__release()
+        os.replace(self.__temp_path, self.__file_path)
+
+    def discard(self):
+        """
+        Closes the writer and deletes its temporary file, leaving any previous file at the path untouched.
+        """
+        self.__release()
+        if os.path.exists(self.__temp_path):
+            os.remove(self.__temp_path)
+
+    # ----- Private Methods -----
+
+    def __write_parquet(self, df: pd.DataFrame):
+        """Append a DataFrame as a row group, converting it to the schema of the columns or of the first one."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if self.__writer is None:
+            if self.__types is not None:
+                types = {'int64': pa.int64(), 'string': pa.string(), 'timestamp': pa.timestamp('ns')}
+                schema = pa.schema([(column, types[self.__types[column]]) for column in self.__columns])
+            else:
+                schema = pa.Table.from_pandas(df, preserve_index=False).schema
+            self.__writer = pq.ParquetWriter(self.__temp_path, schema)
+        table = pa.Table.from_pandas(df, schema=self.__writer.schema, preserve_index=False)
+        self.__writer.write_table(table)
+
+    def __release(self):
+        """Close the open file or Parquet writer."""
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+
+    # ----- Dunder Methods -----
+
+    def __enter__(self) -> 'RecordWriter':
+        """Return the writer for the code of the block."""
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        """Close the writer, or discard its file when the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+        return False
+
+    def __repr__(self) -> str:
+        """Return the official string representation of the RecordWriter object."""
+        return f"RecordWriter('{self.__file_path}', format='{self.__format}', rows={self.__rows})"
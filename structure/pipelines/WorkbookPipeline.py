@@ -0,0 +1,321 @@
+# Import custom classes
+from ..instrumentation.Instrumentation import stage
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..loaders.ParallelExcelLoader import ParallelExcelLoader
+from ..models.Client import Client
+from ..models.EmailPolicy import EmailPolicy
+from ..models.Product import Product
+from ..models import _columns
+from .RecordWriter import RecordWriter
+
+# Import necessary libraries
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import os
+import pandas as pd
+
+def _process_workbook(options: dict, file_path: str) -> dict:
+    """Run the pipeline on one workbook inside a worker process."""
+    return WorkbookPipeline(**options).process(file_path)
+
+# Define the WorkbookPipeline class
+class WorkbookPipeline:
+    """
+    Streams the sheets of sales workbooks through validation into output files.
+
+    Each sheet is read in chunks with ExcelDataFrameLoader.iter_chunks. Clients and Products
+    chunks are validated and built into domain objects with from_dataframe, and the objects are
+    written as records. Identifiers are written as integers in every file ('C001' becomes 1),
+    and amounts as exact decimal text. Sales chunks are checked against the ids of the valid clients and
+    products and the unit price of each product: a sale referencing an id missing from its sheet is
+    an 'orphan', and one referencing a client or product rejected by validation an 'invalid_reference'. Valid records of each sheet and the rejected
+    rows of every sheet go to separate files, written chunk by chunk.
+
+    Memory therefore grows with the chunk size and the number of clients and products only,
+    never with the number of sales. Several workbooks are processed in parallel, one per worker
+    process. Rejected rows are reported with the columns 'sheet', 'row' (position in the sheet),
+    'field', 'rule' and 'value'.
+    """
+    # Sheets in the order they are processed, with the columns of their output files and their types
+    SHEETS: Dict[str, Dict[str, str]] = {
+        'Clients': {'id_client': 'int64', 'name': 'string', 'surname': 'string', 'email': 'string',
+                    'city': 'string', 'state': 'string'},
+        'Products': {'id_product': 'int64', 'name_product': 'string', 'category': 'string',
+                     'unit_price': 'string', 'stock': 'int64'},
+        'Sales': {'id_sale': 'int64', 'sale_date': 'timestamp', 'id_client': 'int64', 'id_product': 'int64',
+                  'quantity': 'int64', 'total_sales_value': 'string'},
+    }
+    # Columns of the error files and their types
+    ERROR_COLUMNS: Dict[str, str] = {'sheet': 'string', 'row': 'int64', 'field': 'string', 'rule': 'string',
+                                     'value': 'string'}
+
+    def __init__(self, output_dir: str, format: str = 'csv', chunksize: int = 10000, workers: int = 1,
+                 valid_domains: Optional[List[str]] = None):
+        """
+        Initializes a WorkbookPipeline instance.
+
+        Args:
+            output_dir (str): Directory receiving one subdirectory of output files per workbook.
+            format (str): Format of the output files: 'csv', 'jsonl' or 'parquet'.
+            chunksize (int): Maximum number of rows read and validated at once.
+            workers (int): Number of workbooks processed in parallel.
+            valid_domains (Optional[List[str]]): List of valid email domains. Defaults to common providers.
+
+        Raises:
+            ValueError: If format is not supported, or chunksize or workers is not a positive integer.
+        """
+        if format not in RecordWriter.FORMATS:
+            raise ValueError(f"format must be one of {list(RecordWriter.FORMATS)}.")
+        for name, value in (('chunksize', chunksize), ('workers', workers)):
+            if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+                raise ValueError(f"{name} must be a positive integer.")
+        self.__output_dir = output_dir
+        self.__format = format
+        self.__chunksize = chunksize
+        self.__workers = workers
+        self.__valid_domains = None if valid_domains is None else list(valid_domains)
+        self.__policy = EmailPolicy.for_domains(valid_domains)
+
+    # ----- Properties -----
+
+    @property
+    def output_dir(self) -> str:
+        """
+        Gets the directory receiving the output files.
+
+        Returns:
+            str: The output directory.
+        """
+        return self.__output_dir
+
+    @property
+    def format(self) -> str:
+        """
+        Gets the format of the output files.
+
+        Returns:
+            str: 'csv', 'jsonl' or 'parquet'.
+        """
+        return self.__format
+
+    @property
+    def chunksize(self) -> int:
+        """
+        Gets the maximum number of rows read and validated at once.
+
+        Returns:
+            int: The chunk size.
+        """
+        return self.__chunksize
+
+    @property
+    def workers(self) -> int:
+        """
+        Gets the number of workbooks processed in parallel.
+
+        Returns:
+            int: The number of workers.
+        """
+        return self.__workers
+
+    # ----- Methods -----
+
+    def run(self, source: str | Iterable[str]) -> List[dict]:
+        """
+        Processes every workbook of a source, in parallel when there are several workers.
+
+        Stages are only recorded by an enabled Instrumentation for the workbooks processed in this
+        process, that is when a single workbook or worker is used.
+
+        Args:
+            source (str|Iterable[str]): Workbook path, directory, glob pattern or list of paths.
+
+        Returns:
+            List[dict]: The summary of each workbook, as returned by process, in the sorted order of the paths.
+
+        Raises:
+            InvalidPathError: If no workbook is found or a sheet cannot be read.
+        """
+        file_paths = ParallelExcelLoader.resolve(source)
+        if self.__workers == 1 or len(file_paths) == 1:
+            return [self.process(file_path) for file_path in file_paths]
+        options = {'output_dir': self.__output_dir, 'format': self.__format, 'chunksize': self.__chunksize,
+                   'valid_domains': self.__valid_domains}
+        with ProcessPoolExecutor(max_workers=min(self.__workers, len(file_paths))) as executor:
+            return list(executor.map(_process_workbook, [options] * len(file_paths), file_paths))
+
+    def process(self, file_path: str) -> dict:
+        """
+        Streams the Clients, Products and Sales sheets of a workbook into its output files.
+
+        The files are written to '<output_dir>/<workbook name>/': 'clients', 'products', 'sales' and
+        'errors', with the extension of the format. They replace the files of a previous run only
+        once the whole workbook was processed.
+
+        Args:
+            file_path (str): Path to the Excel file.
+
+        Returns:
+            dict: 'workbook' (the path), 'outputs' (path of each file, by sheet and 'errors') and 'sheets'
+                (by sheet: 'rows' read, 'valid' rows written and 'rejected' rows).
+
+        Raises:
+            InvalidPathError: If a sheet cannot be read.
+        """
+        directory = os.path.join(self.__output_dir, os.path.splitext(os.path.basename(file_path))[0])
+        extension = RecordWriter.FORMATS[self.__format]
+        writers = {
+            sheet: RecordWriter(os.path.join(directory, sheet.lower() + extension), columns, self.__format)
+            for sheet, columns in WorkbookPipeline.SHEETS.items()
+        }
+        writers['errors'] = RecordWriter(os.path.join(directory, 'errors' + extension),
+                                         WorkbookPipeline.ERROR_COLUMNS, self.__format)
+        sheets = {sheet: {'rows': 0, 'valid': 0, 'rejected': 0} for sheet in WorkbookPipeline.SHEETS}
+        try:
+            clients = self.__stream(file_path, 'Clients', writers, sheets['Clients'], self.__clients)
+            products = self.__stream(file_path, 'Products', writers, sheets['Products'], self.__products)
+            # Ids repeated across chunks keep their first row, so each id is looked up once
+            unit_cents = pd.concat([cents for cents, _ in products]) if products else pd.Series(dtype=np.int64)
+            reference = (WorkbookPipeline.__index([valid for valid, _ in clients]),
+                         unit_cents[~unit_cents.index.duplicated()],
+                         WorkbookPipeline.__index([listed for _, listed in clients]),
+                         WorkbookPipeline.__index([listed for _, listed in products]))
+            self.__stream(file_path, 'Sales', writers, sheets['Sales'], lambda chunk: self.__sales(chunk, *reference))
+        except BaseException:
+            for writer in writers.values():
+                writer.discard()
+            raise
+        for writer in writers.values():
+            writer.close()
+        return {'workbook': file_path, 'outputs': {name: writer.file_path for name, writer in writers.items()},
+                'sheets': sheets}
+
+    @staticmethod
+    def summary(results: List[dict]) -> str:
+        """
+        Formats the summaries returned by run as a human-readable table.
+
+        Args:
+            results (List[dict]): Summaries of the processed workbooks.
+
+        Returns:
+            str: One line per sheet of each workbook, with its rows read, written and rejected.
+        """
+        lines = [f"{'workbook':<32}{'sheet':<12}{'rows':>11}{'valid':>11}{'rejected':>11}"]
+        for result in results:
+            name = os.path.basename(result['workbook'])
+            for sheet, counts in result['sheets'].items():
+                lines.append(f"{name:<32}{sheet:<12}{counts['rows']:>11}{counts['valid']:>11}{counts['rejected']:>11}")
+        return '\n'.join(lines)
+
+    # ----- Private Methods -----
+
+    def __stream(self, file_path: str, sheet: str, writers: Dict[str, RecordWriter], counts: dict, transform) -> list:
+        """Validate each chunk of a sheet with transform, write its records and errors, and collect its references."""
+        references = []
+        for chunk in ExcelDataFrameLoader.iter_chunks(file_path, sheet, chunksize=self.__chunksize):
+            records, report, reference = transform(chunk)
+            with stage('write', sheet) as writing:
+                writers[sheet].write(records)
+                report.insert(0, 'sheet', sheet)
+                # Values of any type are written as text, so every error file has the same column types
+                report['value'] = [None if value is None or value != value else str(value) for value in report['value']]
+                writers['errors'].write(report)
+                writing.add_rows(len(records))
+            counts['rows'] += len(chunk)
+            counts['valid'] += len(records)
+            counts['rejected'] += report['row'].nunique()
+            if reference is not None:
+                references.append(reference)
+        return references
+
+    def __clients(self, chunk: pd.DataFrame) -> tuple:
+        """Build the clients of a chunk, returning their records, the report, and their ids with the ids of every row."""
+        clients, report = Client.from_dataframe(chunk, policy=self.__policy)
+        records = pd.DataFrame({
+            'id_client': [client.id_client_int for client in clients],
+            'name': [client.name for client in clients],
+            'surname': [client.surname for client in clients],
+            'email': [client.email.email for client in clients],
+            'city': [client.address.city for client in clients],
+            'state': [client.address.state for client in clients],
+        })
+        valid = np.array([client.id_client_int for client in clients], dtype=np.int64)
+        return records, report, (valid, WorkbookPipeline.__listed(chunk['id_client'], 'C'))
+
+    def __products(self, chunk: pd.DataFrame) -> tuple:
+        """Build the products of a chunk, returning their records, the report, and their unit prices in cents by id with the ids of every row."""
+        products, report = Product.from_dataframe(chunk)
+        records = pd.DataFrame({
+            'id_product': [product.id_product_int for product in products],
+            'name_product': [product.name for product in products],
+            'category': [product.category for product in products],
+            'unit_price': [str(product.price) for product in products],
+            'stock': [product.quantity for product in products],
+        })
+        cents = pd.Series([product.price.to_minor_units() for product in products],
+                          index=[product.id_product_int for product in products], dtype=np.int64)
+        return records, report, (cents, WorkbookPipeline.__listed(chunk['id_product'], 'P'))
+
+    @staticmethod
+    def __listed(series: pd.Series, prefix: str):
+        """Return the well-formed ids of a column, valid or not, as int64."""
+        ids, parsed = _columns.parse_ids(series, prefix)
+        return ids[parsed].to_numpy(dtype=np.int64)
+
+    @staticmethod
+    def __index(ids: List[np.ndarray]) -> pd.Index:
+        """Return the unique ids of several chunks as an index."""
+        return pd.Index(np.unique(np.concatenate(ids or [np.empty(0, dtype=np.int64)])))
+
+    @staticmethod
+    def __sales(chunk: pd.DataFrame, client_ids: pd.Index, unit_cents: pd.Series,
+                listed_clients: pd.Index, listed_products: pd.Index) -> tuple:
+        """Check a chunk of sales against the valid and listed clients and products, returning its valid rows and the report."""
+        with stage('validate', 'Sales') as validating:
+            sale_ids, sale_parsed = _columns.parse_ids(chunk['id_sale'], 'V')
+            clients, client_parsed = _columns.parse_ids(chunk['id_client'], 'C')
+            products, product_parsed = _columns.parse_ids(chunk['id_product'], 'P')
+            quantity, integral = _columns.integers(chunk['quantity'])
+            totals, numeric = _columns.decimals(chunk['total_sales_value'])
+            sale_parsed, client_parsed = sale_parsed.to_numpy(), client_parsed.to_numpy()
+            product_parsed, integral = product_parsed.to_numpy(), integral.to_numpy()
+            client_keys = clients.fillna(-1).to_numpy(dtype=np.int64)
+            product_keys = products.fillna(-1).to_numpy(dtype=np.int64)
+            known_client = client_parsed & (client_ids.get_indexer(client_keys) >= 0)
+            listed_client = client_parsed & (listed_clients.get_indexer(client_keys) >= 0)
+            product_rows = unit_cents.index.get_indexer(product_keys)
+            known_product = product_parsed & (product_rows >= 0)
+            listed_product = product_parsed & (listed_products.get_indexer(product_keys) >= 0)
+            # Totals are compared in exact cents, only when the product and the quantity are known
+            comparable = known_product & integral & numeric
+            expected = np.where(comparable, unit_cents.to_numpy()[np.maximum(product_rows, 0)] if len(unit_cents) else 0, 0)
+            expected = expected * quantity.fillna(0).to_numpy(dtype=np.int64)
+            cents = np.array([round(total * 100) if total is not None else 0 for total in totals], dtype=np.int64)
+            checks = [
+                ('id_sale', 'format', ~sale_parsed, chunk['id_sale']),
+                ('id_sale', 'positive', sale_parsed & ~sale_ids.gt(0).fillna(False).to_numpy(dtype=bool), chunk['id_sale']),
+                ('id_client', 'format', ~client_parsed, chunk['id_client']),
+                ('id_client', 'orphan', client_parsed & ~listed_client, chunk['id_client']),
+                ('id_client', 'invalid_reference', listed_client & ~known_client, chunk['id_client']),
+                ('id_product', 'format', ~product_parsed, chunk['id_product']),
+                ('id_product', 'orphan', product_parsed & ~listed_product, chunk['id_product']),
+                ('id_product', 'invalid_reference', listed_product & ~known_product, chunk['id_product']),
+                ('quantity', 'integer', ~integral, chunk['quantity']),
+                ('quantity', 'positive', integral & ~quantity.gt(0).fillna(False).to_numpy(dtype=bool), chunk['quantity']),
+                ('total_sales_value', 'numeric', ~numeric, chunk['total_sales_value']),
+                ('total_sales_value', 'total_mismatch', comparable & (cents != expected), chunk['total_sales_value']),
+            ]
+            valid = ~np.logical_or.reduce([failed for _, _, failed, _ in checks])
+            validating.add_rows(len(chunk))
+            _columns.record_failures(validating, checks)
+        records = pd.DataFrame({
+            'id_sale': sale_ids[valid].to_numpy(),
+            'sale_date': chunk['sale_date'][valid].to_numpy(),
+            'id_client': clients[valid].to_numpy(),
+            'id_product': products[valid].to_numpy(),
+            'quantity': quantity[valid].to_numpy(),
+            'total_sales_value': [f'{total:.2f}' for total in totals[valid]],
+        })
+        return records, _columns.report(chunk.index, checks), None
@@ -0,0 +1,9 @@
+# Import all pipeline classes
+from .RecordWriter import RecordWriter
+from .WorkbookPipeline import WorkbookPipeline
+
+# Define the __all__ variable to control what gets imported with 'from pipelines import *'
+__all__ = [
+    'RecordWriter',
+    'WorkbookPipeline'
+]
@@ -0,0 +1,230 @@
+# Import custom classes
+from ..exceptions.DuplicateRecordError import DuplicateRecordError
+from ..models.Client import Client
+from ..models.Email import Email
+from ..models import _columns
+
+# Import necessary libraries
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Define the ClientRepository class
+class ClientRepository:
+    """
+    In-memory store of Client objects with a primary index and secondary indexes.
+
+    Clients are indexed by id_client_int (primary, unique), by email address (unique, hashed
+    as Email hashes it) and by state and city (multi-indexes). Lookups by id or email are O(1)
+    and lookups by state or city are O(k) in the number of matching clients.
+
+    Clients are indexed by the values they had when stored, which are kept with them. A stored
+    client whose email or address was changed in place is reindexed by storing it again with
+    upsert; to change its id, build the new Client, delete the old one and store the new one.
+    """
+
+    def __init__(self, clients: Optional[Iterable[Client]] = None):
+        """
+        Initializes a ClientRepository, optionally with a first batch of clients.
+
+        Args:
+            clients (Optional[Iterable[Client]]): Clients to store, as with add_many.
+
+        Raises:
+            TypeError: If an element is not a Client object.
+            DuplicateRecordError: If two clients share an id or an email.
+        """
+        self.__by_id: Dict[int, Client] = {}
+        self.__by_email: Dict[str, int] = {}
+        self.__by_state: Dict[str, Dict[int, Client]] = {}
+        self.__by_city: Dict[str, Dict[int, Client]] = {}
+        # Email, state and city of each stored client when it was indexed
+        self.__keys: Dict[int, Tuple[str, str, str]] = {}
+        if clients is not None:
+            self.add_many(clients)
+
+    # ----- Methods -----
+
+    def add(self, client: Client):
+        """
+        Stores a new client.
+
+        Args:
+            client (Client): The client to store.
+
+        Raises:
+            TypeError: If client is not a Client object.
+            DuplicateRecordError: If a stored client has the same id or email.
+        """
+        self.add_many([client])
+
+    def add_many(self, clients: Iterable[Client]):
+        """
+        Stores a batch of new clients.
+
+        The whole batch is checked before anything is stored, so a rejected batch leaves the
+        repository unchanged.
+
+        Args:
+            clients (Iterable[Client]): The clients to store.
+
+        Raises:
+            TypeError: If an element is not a Client object.
+            DuplicateRecordError: If a client repeats the id or email of a stored client or of another client of the batch.
+        """
+        clients = list(clients)
+        if not all(isinstance(client, Client) for client in clients):
+            raise TypeError("Every element must be a Client object.")
+        ids = [client.id_client_int for client in clients]
+        emails = [client.email.email for client in clients]
+        # Only look for the offending client once a constraint is known to be broken
+        if len(set(ids)) != len(ids) or not self.__by_id.keys().isdisjoint(ids):
+            seen = set(self.__by_id)
+            duplicate = next(id_client for id_client in ids if id_client in seen or seen.add(id_client))
+            raise DuplicateRecordError(f"A client with id C{duplicate} already exists.")
+        if len(set(emails)) != len(emails) or not self.__by_email.keys().isdisjoint(emails):
+            seen = set(self.__by_email)
+            duplicate = next(email for email in emails if email in seen or seen.add(email))
+            raise DuplicateRecordError(f"A client with email {duplicate} already exists.")
+        with _columns.bulk_allocation():
+            for client, id_client, email in zip(clients, ids, emails):
+                self.__index(client, id_client, email)
+
+    def upsert(self, client: Client) -> Optional[Client]:
+        """
+        Stores a client, replacing the stored client with the same id.
+
+        The replaced client is removed from the indexes under the values it was stored with, so
+        a stored client changed in place is reindexed by upserting it. Every check is made before
+        the indexes change, so a rejected client leaves the repository unchanged.
+
+        Args:
+            client (Client): The client to store.
+
+        Returns:
+            Optional[Client]: The replaced client, or None if the id was new.
+
+        Raises:
+            TypeError: If client is not a Client object.
+            DuplicateRecordError: If another stored client has the same email.
+        """
+        if not isinstance(client, Client):
+            raise TypeError("client must be a Client object.")
+        id_client = client.id_client_int
+        email = client.email.email
+        owner = self.__by_email.get(email)
+        if owner is not None and owner != id_client:
+            raise DuplicateRecordError(f"A client with email {email} already exists.")
+        replaced = self.__by_id.get(id_client)
+        if replaced is not None:
+            self.__unindex(id_client)
+        self.__index(client, id_client, email)
+        return replaced
+
+    def delete(self, id_client: int) -> Client:
+        """
+        Removes a client and its entries in every index.
+
+        Args:
+            id_client (int): The numeric id of the client.
+
+        Returns:
+            Client: The removed client.
+
+        Raises:
+            KeyError: If no client has this id.
+        """
+        client = self.__by_id[id_client]
+        self.__unindex(id_client)
+        return client
+
+    def get(self, id_client: int) -> Optional[Client]:
+        """
+        Finds a client by its numeric id.
+
+        Args:
+            id_client (int): The numeric id of the client.
+
+        Returns:
+            Optional[Client]: The client, or None if not found.
+        """
+        return self.__by_id.get(id_client)
+
+    def find_by_email(self, email: Email | str) -> Optional[Client]:
+        """
+        Finds a client by its email.
+
+        Args:
+            email (Email|str): The email, as an Email object or as text.
+
+        Returns:
+            Optional[Client]: The client, or None if not found.
+        """
+        id_client = self.__by_email.get(email.email if isinstance(email, Email) else email)
+        return None if id_client is None else self.__by_id[id_client]
+
+    def find_by_state(self, state: str) -> List[Client]:
+        """
+        Finds the clients of a state.
+
+        Args:
+            state (str): Abbreviation of the state (case-insensitive).
+
+        Returns:
+            List[Client]: The clients of the state, in insertion order.
+        """
+        return list(self.__by_state.get(state.upper(), {}).values())
+
+    def find_by_city(self, city: str, state: Optional[str] = None) -> List[Client]:
+        """
+        Finds the clients of a city.
+
+        Args:
+            city (str): Name of the city.
+            state (Optional[str]): Abbreviation of the state, to tell apart cities with the same name.
+
+        Returns:
+            List[Client]: The clients of the city, in insertion order.
+        """
+        clients = self.__by_city.get(city, {})
+        if state is None:
+            return list(clients.values())
+        return [client for id_client, client in clients.items() if self.__keys[id_client][1] == state.upper()]
+
+    # ----- Private Methods -----
+
+    def __index(self, client: Client, id_client: int, email: str):
+        """Add a client to every index and record the keys it was indexed under."""
+        address = client.address
+        self.__by_id[id_client] = client
+        self.__by_email[email] = id_client
+        self.__by_state.setdefault(address.state, {})[id_client] = client
+        self.__by_city.setdefault(address.city, {})[id_client] = client
+        self.__keys[id_client] = (email, address.state, address.city)
+
+    def __unindex(self, id_client: int):
+        """Remove a client from every index under its recorded keys, dropping emptied buckets."""
+        email, state, city = self.__keys.pop(id_client)
+        del self.__by_id[id_client]
+        del self.__by_email[email]
+        for index, key in ((self.__by_state, state), (self.__by_city, city)):
+            bucket = index[key]
+            del bucket[id_client]
+            if not bucket:
+                del index[key]
+
+    # ----- Dunder Methods -----
+
+    def __len__(self) -> int:
+        """Return the number of stored clients."""
+        return len(self.__by_id)
+
+    def __contains__(self, id_client: int) -> bool:
+        """Check whether a client with this numeric id is stored."""
+        return id_client in self.__by_id
+
+    def __iter__(self) -> Iterator[Client]:
+        """Iterate over the stored clients in insertion order."""
+        return iter(self.__by_id.values())
+
+    def __repr__(self) -> str:
+        """Return the official string representation of the ClientRepository object."""
+        return f"ClientRepository({len(self)} clients)"
@@ -0,0 +1,171 @@
+# Import custom classes
+from ..models.Client import Client
+from ..models.Product import Product
+
+# Import necessary libraries
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Define the Duplicate class
+@dataclass(frozen=True)
+class Duplicate:
+    """
+    A record repeating the id of an earlier record of the same type.
+
+    Attributes:
+        record (Client|Product): The repeated record.
+        position (int): Position of the record in the stream, from 0.
+        first (Client|Product): The earlier record it was compared with: the equal one for exact
+            duplicates, the first one with the id for conflicts.
+        first_position (int): Position of the earlier record in the stream.
+        fields (Tuple[str, ...]): Fields whose values differ from the earlier record, empty for exact duplicates.
+    """
+    record: object
+    position: int
+    first: object
+    first_position: int
+    fields: Tuple[str, ...] = ()
+
+    @property
+    def exact(self) -> bool:
+        """
+        Gets whether the record is equal to the earlier record.
+
+        Returns:
+            bool: True for exact duplicates, False for conflicts.
+        """
+        return not self.fields
+
+# Define the Deduplicator class
+class Deduplicator:
+    """
+    Finds exact duplicates and same-id conflicts in a stream of Clients and Products, in a single pass.
+
+    The first record of each id is kept. Every later record with the same id is compared with the
+    distinct records already seen for that id, with the __eq__ of the models: an equal one makes
+    it an exact duplicate, otherwise it conflicts with the first record and the differing fields
+    are reported. Clients and Products have separate ids, so both can be mixed in one stream.
+    """
+    # Integer id of each model
+    IDS: Dict[type, str] = {Client: 'id_client_int', Product: 'id_product_int'}
+    # Fields compared for each model, besides the id
+    FIELDS: Dict[type, Tuple[str, ...]] = {
+        Client: ('name', 'surname', 'email', 'address'),
+        Product: ('name', 'category', 'price', 'quantity'),
+    }
+
+    def __init__(self):
+        """
+        Initializes an empty Deduplicator.
+        """
+        # Distinct records of each (type, id) with their first position, the kept one first
+        self.__seen: Dict[Tuple[type, int], List[Tuple[object, int]]] = {}
+        self.__duplicates: List[Duplicate] = []
+        self.__conflicts: List[Duplicate] = []
+        self.__position = 0
+
+    # ----- Properties -----
+
+    @property
+    def duplicates(self) -> List[Duplicate]:
+        """
+        Gets the exact duplicates found so far.
+
+        Returns:
+            List[Duplicate]: The records equal to an earlier record, in stream order.
+        """
+        return list(self.__duplicates)
+
+    @property
+    def conflicts(self) -> List[Duplicate]:
+        """
+        Gets the same-id conflicts found so far.
+
+        Returns:
+            List[Duplicate]: The records sharing the id of an earlier, different record, in stream order.
+        """
+        return list(self.__conflicts)
+
+    # ----- Methods -----
+
+    def add(self, record: Client | Product) -> Optional[Duplicate]:
+        """
+        Checks the next record of the stream.
+
+        Args:
+            record (Client|Product): The record.
+
+        Returns:
+            Optional[Duplicate]: None when the record is the first with its id, otherwise the exact
+                duplicate or conflict it makes.
+
+        Raises:
+            TypeError: If record is not a Client or Product object.
+        """
+        fields = Deduplicator.FIELDS.get(type(record))
+        if fields is None:
+            raise TypeError("record must be a Client or Product object.")
+        position = self.__position
+        self.__position += 1
+        key = (type(record), getattr(record, Deduplicator.IDS[type(record)]))
+        seen = self.__seen.get(key)
+        if seen is None:
+            self.__seen[key] = [(record, position)]
+            return None
+        for earlier, earlier_position in seen:
+            if earlier == record:
+                duplicate = Duplicate(record, position, earlier, earlier_position)
+                self.__duplicates.append(duplicate)
+                return duplicate
+        first, first_position = seen[0]
+        differing = tuple(field for field in fields if getattr(first, field) != getattr(record, field))
+        seen.append((record, position))
+        conflict = Duplicate(record, position, first, first_position, differing)
+        self.__conflicts.append(conflict)
+        return conflict
+
+    def unique(self, records: Iterable[Client | Product]) -> Iterator[Client | Product]:
+        """
+        Checks a stream of records, yielding the first record of each id as it goes.
+
+        Args:
+            records (Iterable[Client|Product]): The records.
+
+        Yields:
+            Client|Product: The records kept, in stream order.
+
+        Raises:
+            TypeError: If a record is not a Client or Product object.
+        """
+        for record in records:
+            if self.add(record) is None:
+                yield record
+
+    def report(self) -> List[dict]:
+        """
+        Builds the report of the duplicates and conflicts found so far.
+
+        Returns:
+            List[dict]: One dict per repeated record, in stream order, with the keys 'type', 'id',
+                'position', 'first_position', 'kind' ('duplicate' or 'conflict') and 'fields'.
+        """
+        rows = sorted(self.__duplicates + self.__conflicts, key=lambda duplicate: duplicate.position)
+        return [{
+            'type': type(row.record).__name__,
+            'id': getattr(row.record, Deduplicator.IDS[type(row.record)]),
+            'position': row.position,
+            'first_position': row.first_position,
+            'kind': 'duplicate' if row.exact else 'conflict',
+            'fields': list(row.fields),
+        } for row in rows]
+
+    # ----- Dunder Methods -----
+
+    def __len__(self) -> int:
+        """Return the number of records checked."""
+        return self.__position
+
+    def __repr__(self) -> str:
+        """Return the official string representation of the Deduplicator object."""
+        return (f"Deduplicator({self.__position} records, {len(self.__duplicates)} duplicates, "
+                f"{len(self.__conflicts)} conflicts)")
@@ -0,0 +1,322 @@
+# Import custom classes
+from ..exceptions.DuplicateRecordError import DuplicateRecordError
+from ..models.Price import Price
+from ..models.Product import Product
+from ..models import _columns
+
+# Import necessary libraries
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Define the ProductCatalog class
+class ProductCatalog:
+    """
+    In-memory catalog of Product objects with category buckets and sorted price indexes.
+
+    Products are indexed by id_product_int (unique) and, per category, by a list of
+    (price, id) entries kept sorted with bisect. Entries hold the Decimal value of the price,
+    which has the ordering of Price but is compared natively. A second sorted index per
+    category holds only the products in stock. Price range and cheapest-N queries are
+    therefore logarithmic plus the size of the answer.
+
+    Prices and quantities of stored products are changed through update_price and
+    update_quantity, which move the product in the indexes. Each product is indexed under the
+    category, price and stock it had when indexed, which are kept with it, so a product
+    changed directly is still removed correctly; reindex puts it back in step with the indexes.
+    """
+
+    def __init__(self, products: Optional[Iterable[Product]] = None):
+        """
+        Initializes a ProductCatalog, optionally with a first batch of products.
+
+        Args:
+            products (Optional[Iterable[Product]]): Products to store, as with add_many.
+
+        Raises:
+            TypeError: If an element is not a Product object.
+            DuplicateRecordError: If two products share an id.
+        """
+        self.__by_id: Dict[int, Product] = {}
+        self.__by_price: Dict[str, List[Tuple[Decimal, int]]] = {}
+        self.__in_stock: Dict[str, List[Tuple[Decimal, int]]] = {}
+        # Category, price entry and stock state of each stored product when it was indexed
+        self.__keys: Dict[int, Tuple[str, Tuple[Decimal, int], bool]] = {}
+        if products is not None:
+            self.add_many(products)
+
+    # ----- Methods -----
+
+    def add(self, product: Product):
+        """
+        Stores a new product.
+
+        Args:
+            product (Product): The product to store.
+
+        Raises:
+            TypeError: If product is not a Product object.
+            DuplicateRecordError: If a stored product has the same id.
+        """
+        self.add_many([product])
+
+    def add_many(self, products: Iterable[Product]):
+        """
+        Stores a batch of new products.
+
+        The whole batch is checked before anything is stored, and the price indexes of each
+        category are sorted once instead of inserting every product with bisect.
+
+        Args:
+            products (Iterable[Product]): The products to store.
+
+        Raises:
+            TypeError: If an element is not a Product object.
+            DuplicateRecordError: If a product repeats the id of a stored product or of another product of the batch.
+        """
+        products = list(products)
+        if not all(isinstance(product, Product) for product in products):
+            raise TypeError("Every element must be a Product object.")
+        ids = [product.id_product_int for product in products]
+        if len(set(ids)) != len(ids) or not self.__by_id.keys().isdisjoint(ids):
+            seen = set(self.__by_id)
+            duplicate = next(id_product for id_product in ids if id_product in seen or seen.add(id_product))
+            raise DuplicateRecordError(f"A product with id P{duplicate} already exists.")
+        touched = set()
+        with _columns.bulk_allocation():
+            for product, id_product in zip(products, ids):
+                self.__by_id[id_product] = product
+                entry = (product.price.price, id_product)
+                in_stock = product.quantity > 0
+                self.__by_price.setdefault(product.category, []).append(entry)
+                if in_stock:
+                    self.__in_stock.setdefault(product.category, []).append(entry)
+                self.__keys[id_product] = (product.category, entry, in_stock)
+                touched.add(product.category)
+            for category in touched:
+                self.__by_price[category].sort()
+                if category in self.__in_stock:
+                    self.__in_stock[category].sort()
+
+    def remove(self, id_product: int) -> Product:
+        """
+        Removes a product and its entries in every index.
+
+        Args:
+            id_product (int): The numeric id of the product.
+
+        Returns:
+            Product: The removed product.
+
+        Raises:
+            KeyError: If no product has this id.
+        """
+        product = self.__by_id[id_product]
+        self.__unindex(id_product)
+        del self.__by_id[id_product]
+        return product
+
+    def update_price(self, id_product: int, price: Price) -> Product:
+        """
+        Changes the price of a stored product and moves it in the price indexes.
+
+        Args:
+            id_product (int): The numeric id of the product.
+            price (Price): The new price.
+
+        Returns:
+            Product: The updated product.
+
+        Raises:
+            KeyError: If no product has this id.
+            InvalidPriceError: If price is not a Price object. The product is left unchanged.
+        """
+        product = self.__by_id[id_product]
+        category, old, in_stock = self.__keys[id_product]
+        product.price = price
+        if category != product.category or in_stock != (product.quantity > 0):
+            # The product was also changed directly
+            return self.reindex(id_product)
+        new = (price.price, id_product)
+        self.__move(self.__by_price, category, old, new)
+        if in_stock:
+            self.__move(self.__in_stock, category, old, new)
+        self.__keys[id_product] = (category, new, in_stock)
+        return product
+
+    def update_quantity(self, id_product: int, quantity: int) -> Product:
+        """
+        Changes the quantity of a stored product, adding it to or removing it from the in-stock index.
+
+        Args:
+            id_product (int): The numeric id of the product.
+            quantity (int): The new quantity in stock.
+
+        Returns:
+            Product: The updated product.
+
+        Raises:
+            KeyError: If no product has this id.
+            InvalidQuantityError: If quantity is not a non-negative integer. The product is left unchanged.
+        """
+        product = self.__by_id[id_product]
+        category, entry, was_in_stock = self.__keys[id_product]
+        product.quantity = quantity
+        if category != product.category or entry != (product.price.price, id_product):
+            # The product was also changed directly
+            return self.reindex(id_product)
+        if was_in_stock and quantity == 0:
+            self.__discard(self.__in_stock, category, entry)
+        elif not was_in_stock and quantity > 0:
+            insort(self.__in_stock.setdefault(category, []), entry)
+        self.__keys[id_product] = (category, entry, quantity > 0)
+        return product
+
+    def reindex(self, id_product: int) -> Product:
+        """
+        Moves a stored product in the indexes after its category, price or quantity was changed directly.
+
+        Args:
+            id_product (int): The numeric id of the product.
+
+        Returns:
+            Product: The reindexed product.
+
+        Raises:
+            KeyError: If no product has this id.
+        """
+        product = self.__by_id[id_product]
+        self.__unindex(id_product)
+        entry = (product.price.price, id_product)
+        in_stock = product.quantity > 0
+        insort(self.__by_price.setdefault(product.category, []), entry)
+        if in_stock:
+            insort(self.__in_stock.setdefault(product.category, []), entry)
+        self.__keys[id_product] = (product.category, entry, in_stock)
+        return product
+
+    def get(self, id_product: int) -> Optional[Product]:
+        """
+        Finds a product by its numeric id.
+
+        Args:
+            id_product (int): The numeric id of the product.
+
+        Returns:
+            Optional[Product]: The product, or None if not found.
+        """
+        return self.__by_id.get(id_product)
+
+    def categories(self) -> List[str]:
+        """
+        Gets the categories with at least one product.
+
+        Returns:
+            List[str]: The categories, sorted by name.
+        """
+        return sorted(self.__by_price)
+
+    def find_by_category(self, category: str, in_stock: bool = False) -> List[Product]:
+        """
+        Finds the products of a category.
+
+        Args:
+            category (str): The category.
+            in_stock (bool): Whether to keep only products with a positive quantity.
+
+        Returns:
+            List[Product]: The products, from the cheapest to the most expensive.
+        """
+        return self.__products(self.__index(category, in_stock))
+
+    def price_range(self, category: str, low: Optional[Price] = None, high: Optional[Price] = None,
+                    in_stock: bool = False) -> List[Product]:
+        """
+        Finds the products of a category priced between two bounds.
+
+        Args:
+            category (str): The category.
+            low (Optional[Price]): Lowest price accepted, inclusive (default is no lower bound).
+            high (Optional[Price]): Highest price accepted, inclusive (default is no upper bound).
+            in_stock (bool): Whether to keep only products with a positive quantity.
+
+        Returns:
+            List[Product]: The matching products, from the cheapest to the most expensive.
+        """
+        entries = self.__index(category, in_stock)
+        start = 0 if low is None else bisect_left(entries, (low.price,))
+        stop = len(entries) if high is None else bisect_right(entries, (high.price, float('inf')))
+        return self.__products(entries[start:stop])
+
+    def cheapest(self, category: str, n: int, in_stock: bool = False) -> List[Product]:
+        """
+        Finds the n cheapest products of a category.
+
+        Args:
+            category (str): The category.
+            n (int): Maximum number of products returned.
+            in_stock (bool): Whether to keep only products with a positive quantity.
+
+        Returns:
+            List[Product]: Up to n products, from the cheapest. Ties are ordered by id.
+        """
+        return self.__products(islice(self.__index(category, in_stock), max(n, 0)))
+
+    # ----- Private Methods -----
+
+    def __index(self, category: str, in_stock: bool) -> List[Tuple[Decimal, int]]:
+        """Return the sorted price index of a category."""
+        return (self.__in_stock if in_stock else self.__by_price).get(category, [])
+
+    def __products(self, entries: Iterable[Tuple[Decimal, int]]) -> List[Product]:
+        """Return the products of index entries."""
+        return [self.__by_id[id_product] for _, id_product in entries]
+
+    def __unindex(self, id_product: int):
+        """Remove a product from the price indexes under its recorded keys."""
+        category, entry, in_stock = self.__keys.pop(id_product)
+        self.__discard(self.__by_price, category, entry)
+        if in_stock:
+            self.__discard(self.__in_stock, category, entry)
+
+    @staticmethod
+    def __position(entries: List[Tuple[Decimal, int]], entry: tuple) -> int:
+        """Return the position of an entry in a sorted price index, raising KeyError when it is missing."""
+        position = bisect_left(entries, entry)
+        if position == len(entries) or entries[position] != entry:
+            raise KeyError(f"Product P{entry[1]} is not in the price index at {entry[0]}.")
+        return position
+
+    @staticmethod
+    def __discard(index: Dict[str, List[Tuple[Decimal, int]]], category: str, entry: tuple):
+        """Remove an entry from a sorted price index, dropping emptied categories."""
+        entries = index[category]
+        del entries[ProductCatalog.__position(entries, entry)]
+        if not entries:
+            del index[category]
+
+    @staticmethod
+    def __move(index: Dict[str, List[Tuple[Decimal, int]]], category: str, old: tuple, new: tuple):
+        """Replace an entry of a sorted price index, keeping the index sorted."""
+        entries = index[category]
+        del entries[ProductCatalog.__position(entries, old)]
+        insort(entries, new)
+
+    # ----- Dunder Methods -----
+
+    def __len__(self) -> int:
+        """Return the number of stored products."""
+        return len(self.__by_id)
+
+    def __contains__(self, id_product: int) -> bool:
+        """Check whether a product with this numeric id is stored."""
+        return id_product in self.__by_id
+
+    def __iter__(self) -> Iterator[Product]:
+        """Iterate over the stored products in insertion order."""
+        return iter(self.__by_id.values())
+
+    def __repr__(self) -> str:
+        """Return the official string representation of the ProductCatalog object."""
+        return f"ProductCatalog({len(self)} products, {len(self.__by_price)} categories)"
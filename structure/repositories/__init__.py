@@ -0,0 +1,12 @@
+# Import all repository classes
+from .ClientRepository import ClientRepository
+from .Deduplicator import Deduplicator, Duplicate
+from .ProductCatalog import ProductCatalog
+
+# Define the __all__ variable to control what gets imported with 'from repositories import *'
+__all__ = [
+    'ClientRepository',
+    'Deduplicator',
+    'Duplicate',
+    'ProductCatalog'
+]
@@ -1,5 +1,5 @@
 # Import custom classes
-from ..models.Address import Address
+from ..models.Address import Address, BRAZILIAN_STATES
 from ..exceptions.InvalidCityError import InvalidCityError
 from ..exceptions.InvalidStateError import InvalidStateError
 
@@ -62,4 +62,55 @@ def test_create_invalid_address_object(city: str, state: str, expected_exception
     }
     # Act & Assert: Check that creating an Address object raises the expected exception
     with pytest.raises(expected_exception):
-        Address(**invalid_address)
\ No newline at end of file
+        Address(**invalid_address)
+
+def test_intern_returns_shared_immutable_instance():
+    """
+    Test that interning the same pair returns one shared, immutable Address.
+    """
+    # Act: Intern the same pair twice, with different state cases
+    first = Address.intern("Recife", "PE")
+    second = Address.intern("Recife", "pe")
+    # Assert: Check identity, equality with a regular Address and immutability
+    assert first is second
+    assert first == Address("Recife", "PE")
+    with pytest.raises(AttributeError):
+        first.city = "Olinda"
+    assert first.city == "Recife"
+
+def test_hash_consistent_with_equality():
+    """
+    Test that equal addresses have equal hashes and can be used in sets.
+    """
+    # Act: Build equal addresses in different ways
+    addresses = {Address("Campinas", "SP"), Address("Campinas", "sp"), Address.intern("Campinas", "SP")}
+    # Assert: Check that they collapse into one element
+    assert len(addresses) == 1
+    assert hash(Address("Campinas", "SP")) == hash(Address.intern("Campinas", "SP"))
+
+@pytest.mark.parametrize(
+    "city, state, expected_exception",
+    [
+        # Test 1: Invalid city
+        ("", "SP", InvalidCityError),
+        # Test 2: Invalid state
+        ("Campinas", "XX", InvalidStateError),
+        # Test 3: Unhashable state
+        ("Campinas", ["SP"], InvalidStateError),
+    ]
+)
+def test_intern_invalid_address(city, state, expected_exception):
+    """
+    Test that interning invalid values raises the usual validation errors.
+    """
+    # Act & Assert: Attempt to intern and expect an exception
+    with pytest.raises(expected_exception):
+        Address.intern(city, state)
+
+def test_state_table_is_read_only():
+    """
+    Test that the shared state table cannot be modified.
+    """
+    # Act & Assert: Attempt to add a state and expect an exception
+    with pytest.raises(TypeError):
+        BRAZILIAN_STATES['XX'] = 'Nowhere'
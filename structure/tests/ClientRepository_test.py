@@ -0,0 +1,106 @@
+# Import custom classes
+from ..models.Email import Email
+from ..models.Client import Client
+from ..models.Address import Address
+from ..repositories.ClientRepository import ClientRepository
+from ..exceptions.DuplicateRecordError import DuplicateRecordError
+
+# Import necessary libraries
+import pytest
+
+def make_client(id_client: int, email: str, city: str = 'Recife', state: str = 'PE') -> Client:
+    """
+    Build a valid client with the given id, email and address.
+    """
+    return Client(id_client, 'John', 'Doe', Email(email), Address(city, state))
+
+# Test function for the "happy path" scenario
+def test_repository_lookups():
+    """
+    Test lookups by id, email, state and city.
+    """
+    # Arrange: Clients in two states
+    clients = [make_client(1, 'a@gmail.com'), make_client(2, 'b@gmail.com', 'Olinda'),
+               make_client(3, 'c@gmail.com', 'Recife', 'SP')]
+    # Act: Store the clients
+    repository = ClientRepository(clients)
+    # Assert: Check every index
+    assert len(repository) == 3 and 2 in repository and list(repository) == clients
+    assert repository.get(2) is clients[1] and repository.get(9) is None
+    assert repository.find_by_email('c@gmail.com') is clients[2]
+    assert repository.find_by_email(Email('a@gmail.com')) is clients[0]
+    assert repository.find_by_state('pe') == clients[:2]
+    assert repository.find_by_city('Recife') == [clients[0], clients[2]]
+    assert repository.find_by_city('Recife', 'SP') == [clients[2]]
+
+def test_repository_upsert_and_delete_maintain_indexes():
+    """
+    Test that replacing and removing clients updates every index.
+    """
+    # Arrange: A stored client
+    repository = ClientRepository([make_client(1, 'a@gmail.com')])
+    # Act: Replace the client with a new email and address, then add and remove another one
+    replaced = repository.upsert(make_client(1, 'new@gmail.com', 'Salvador', 'BA'))
+    repository.add(make_client(2, 'b@gmail.com'))
+    removed = repository.delete(2)
+    # Assert: Check that no index keeps stale entries
+    assert replaced.email == 'a@gmail.com' and removed.id_client_int == 2
+    assert repository.find_by_email('a@gmail.com') is None
+    assert repository.find_by_email('new@gmail.com').address == Address('Salvador', 'BA')
+    assert repository.find_by_state('PE') == [] and repository.find_by_city('Recife') == []
+    assert len(repository.find_by_state('BA')) == 1 and len(repository) == 1
+
+def test_repository_upsert_reindexes_client_changed_in_place():
+    """
+    Test that a stored client whose email and address were changed in place is reindexed by upsert.
+    """
+    # Arrange: A stored client changed in place
+    client = make_client(1, 'a@gmail.com')
+    repository = ClientRepository([client, make_client(2, 'b@gmail.com')])
+    client.email = Email('z@gmail.com')
+    client.address = Address('Salvador', 'BA')
+    # Act: Store the changed client again
+    replaced = repository.upsert(client)
+    # Assert: Check that the old keys are gone and the new ones point to the client
+    assert replaced is client and len(repository) == 2
+    assert repository.find_by_email('a@gmail.com') is None and repository.find_by_email('z@gmail.com') is client
+    assert repository.find_by_state('PE') == [repository.get(2)] and repository.find_by_state('BA') == [client]
+    assert repository.find_by_city('Salvador', 'BA') == [client]
+    assert repository.delete(1) is client and repository.find_by_email('z@gmail.com') is None
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize(
+    "batch",
+    [
+        # Test 1: Id of a stored client
+        [make_client(1, 'x@gmail.com')],
+        # Test 2: Email of a stored client
+        [make_client(5, 'a@gmail.com')],
+        # Test 3: Id repeated inside the batch
+        [make_client(5, 'x@gmail.com'), make_client(5, 'y@gmail.com')],
+        # Test 4: Email repeated inside the batch
+        [make_client(5, 'x@gmail.com'), make_client(6, 'x@gmail.com')],
+    ]
+)
+def test_repository_rejects_duplicates(batch: list):
+    """
+    Test that uniqueness of ids and emails is enforced and a rejected batch stores nothing.
+    """
+    # Arrange: A stored client
+    repository = ClientRepository([make_client(1, 'a@gmail.com')])
+    # Act & Assert: Attempt to store the batch and expect an exception
+    with pytest.raises(DuplicateRecordError):
+        repository.add_many(batch)
+    assert len(repository) == 1 and repository.find_by_email('x@gmail.com') is None
+
+def test_repository_upsert_rejects_email_of_another_client():
+    """
+    Test that upsert does not let two clients share an email.
+    """
+    # Arrange: Two stored clients
+    repository = ClientRepository([make_client(1, 'a@gmail.com'), make_client(2, 'b@gmail.com')])
+    # Act & Assert: Attempt to give client 2 the email of client 1
+    with pytest.raises(DuplicateRecordError):
+        repository.upsert(make_client(2, 'a@gmail.com'))
+    with pytest.raises(KeyError):
+        repository.delete(3)
@@ -9,6 +9,7 @@ from ..exceptions.InvalidAddressError import InvalidAddressError
 
 # Import necessary libraries
 import pytest
+import pandas as pd
 
 # Test function for the "happy path" scenario
 @pytest.mark.parametrize(
@@ -80,4 +81,127 @@ def test_create_invalid_client_object(id_client: int, name: str, surname: str, e
     }
     # Act & Assert: Attempt to create a Client object and expect an exception
     with pytest.raises(expected_exception):
-        Client(**invalid_client)
\ No newline at end of file
+        Client(**invalid_client)
+
+# Dirty Clients sheet mixing valid rows with every kind of rejected value
+dirty_clients = pd.DataFrame({
+    'id_client': ['C001', 'C002', 'X003', 'C000', None, 'C006', 'C007', 'C008', 'C009', 'C010', 'C011', 'C012'],
+    'name': ['Ana', ' Bruno ', 'Carla', 'Daniel', 'Eduarda', '   ', None, 'Helena', 'Igor', 'Julia', 'Kaio', 'Lara'],
+    'surname': ['Silva', 'Costa', 'Melo', 'Almeida', 'Ferreira', 'Gomes', 'Lima', 42, 'Souza', 'Rocha', 'Dias', 'Pinto'],
+    'email': ['ana@gmail.com', 'bruno@outlook.com', 'carla@gmail.com', 'daniel@gmail.com', 'eduarda@gmail.com',
+              'f@gmail.com', 'g@gmail.com', 'helena@gmail.com', 'igor@email.com', '', 'kaio@gmail.com', 'lara@gmail.com'],
+    'city': ['São Paulo', 'Niterói', 'Recife', 'Salvador', 'Manaus', 'Belém', 'Natal', 'Palmas', 'Maceió', 'Olinda', ' ', 'Santos'],
+    'state': ['SP', 'rj', 'PE', 'BA', 'AM', 'PA', 'RN', 'TO', 'AL', 'PE', 'SP', 'XX'],
+})
+
+def build_client_row(row) -> Client:
+    """
+    Build a Client from one row of the sheet with the scalar constructors.
+    """
+    id_client = row['id_client']
+    if isinstance(id_client, str) and id_client[:1] == 'C' and id_client[1:].isdigit():
+        id_client = int(id_client[1:])
+    return Client(id_client, row['name'], row['surname'], Email(row['email']), Address(row['city'], row['state']))
+
+def test_from_dataframe_matches_scalar_constructors():
+    """
+    Test that bulk construction accepts and rejects exactly the rows the setters accept and reject.
+    """
+    # Arrange: Decisions of the scalar constructors
+    expected = []
+    for _, row in dirty_clients.iterrows():
+        try:
+            expected.append(build_client_row(row))
+        except Exception:
+            pass
+    # Act: Build the clients column-wise
+    clients, report = Client.from_dataframe(dirty_clients)
+    # Assert: Check the built objects and the rejected rows
+    assert clients == expected
+    assert [client.id_client_int for client in clients] == [1, 2]
+    assert set(report['row']) == set(range(2, 12))
+    assert list(report.columns) == ['row', 'field', 'rule', 'value']
+    assert ('surname', 'non_empty_string') in set(zip(report['field'], report['rule']))
+
+def test_from_dataframe_reports_every_violation_of_a_row():
+    """
+    Test that every violation of a row is reported, not only the first one.
+    """
+    # Arrange: A row with an invalid id, name and state
+    df = pd.DataFrame({'id_client': ['C000'], 'name': [''], 'surname': ['Doe'],
+                       'email': ['a@gmail.com'], 'city': ['Recife'], 'state': ['ZZ']})
+    # Act: Build the clients column-wise
+    clients, report = Client.from_dataframe(df)
+    # Assert: Check the reported rules
+    assert clients == []
+    assert list(zip(report['field'], report['rule'])) == [
+        ('id_client', 'positive'), ('name', 'non_empty_string'), ('state', 'valid_state')]
+
+def test_from_dataframe_shares_one_address_per_city_and_state():
+    """
+    Test that a large sheet is built completely, with one shared Address per (city, state) pair.
+    """
+    # Arrange: A larger sheet of valid rows
+    df = pd.concat([dirty_clients.iloc[:2]] * 5000, ignore_index=True)
+    # Act: Build the clients column-wise
+    clients, report = Client.from_dataframe(df)
+    # Assert: Check the built objects and the shared addresses
+    assert report.empty
+    assert clients[:2] == [build_client_row(row) for _, row in df.iloc[:2].iterrows()]
+    assert len(clients) == len(df)
+    assert len({id(client.address) for client in clients}) == 2
+
+def test_client_is_slotted_and_stores_id_once():
+    """
+    Test that clients have no instance dictionary and both id views share one value.
+    """
+    # Arrange: A valid client
+    client = Client(7, 'John', 'Doe', Email('john@gmail.com'), Address('Recife', 'PE'))
+    # Act: Change the id through the integer view
+    client.id_client_int = 42
+    # Assert: Check the slots and the derived id
+    assert not hasattr(client, '__dict__')
+    assert (client.id_client, client.id_client_int) == ('C42', 42)
+
+def test_validate_matches_dataframe_report():
+    """
+    Test that record validation reports every violation the column-wise report has, row by row, without raising.
+    """
+    # Act: Validate each row as a record and the whole sheet as a batch
+    issues = [(row, *issue) for row, record in zip(dirty_clients.index, dirty_clients.to_dict('records'))
+              for issue in Client.validate(record)]
+    report = Client.validate_dataframe(dirty_clients)
+    # Assert: Check both validations and the rows accepted by the constructors
+    assert issues == list(report.itertuples(index=False, name=None))
+    for _, row in dirty_clients.iterrows():
+        try:
+            build_client_row(row)
+            built = True
+        except Exception:
+            built = False
+        assert built == (Client.validate(row.to_dict()) == [])
+
+def test_validate_collects_every_violation_of_a_record():
+    """
+    Test that one record breaking several rules gets one issue per rule.
+    """
+    # Act: Validate a record with an invalid id, name, email and state
+    issues = Client.validate({'id_client': 'C000', 'name': '', 'surname': 'Doe',
+                              'email': 'john@email.com', 'city': 'Recife', 'state': 'ZZ'})
+    # Assert: Check the reported rules
+    assert [(issue.field, issue.rule) for issue in issues] == [
+        ('id_client', 'positive'), ('name', 'non_empty_string'), ('email', 'pattern'), ('state', 'valid_state')]
+
+def test_equal_clients_have_equal_hashes():
+    """
+    Test that clients are hashable consistently with __eq__ and that their hash survives setting a name.
+    """
+    # Arrange: Two equal clients
+    first = Client(7, "Ana", "Silva", Email("ana.silva@gmail.com"), Address("Recife", "PE"))
+    second = Client(7, "Ana", "Silva", Email("ana.silva@gmail.com"), Address.intern("Recife", "PE"))
+    # Act: Hash them, then change a name
+    equal_hashes = hash(first) == hash(second)
+    second.name = "Anna"
+    # Assert: Check the hashes, equality and set membership
+    assert equal_hashes and hash(first) == hash(second) and first != second
+    assert len({first, second}) == 2 and first in {first}
@@ -0,0 +1,83 @@
+# Import custom classes
+from ..repositories.Deduplicator import Deduplicator
+from ..models.Address import Address
+from ..models.Client import Client
+from ..models.Email import Email
+from ..models.Price import Price
+from ..models.Product import Product
+
+# Import necessary libraries
+import pytest
+
+def make_client(id_client: int, name: str = 'Ana', email: str = 'ana.silva@gmail.com', city: str = 'Recife') -> Client:
+    """Build a client of Pernambuco."""
+    return Client(id_client, name, 'Silva', Email(email), Address(city, 'PE'))
+
+def make_product(id_product: int, price: str = '19.90', quantity: int = 5) -> Product:
+    """Build a smartphone product."""
+    return Product(id_product, 'Smartphone Alpha', 'Celulares', Price(price), quantity)
+
+# Test function for the "happy path" scenario
+def test_unique_keeps_the_first_record_of_each_id():
+    """
+    Test that a mixed stream keeps one record per id and type and classifies the others.
+    """
+    # Arrange: A stream of clients and products sharing numeric ids
+    stream = [make_client(1), make_product(1), make_client(2), make_client(1),
+              make_product(1, price='19.9'), make_client(2, name='Bruna'), make_product(2)]
+    deduplicator = Deduplicator()
+    # Act: Deduplicate the stream
+    kept = list(deduplicator.unique(stream))
+    # Assert: Check the kept records, duplicates and conflicts
+    assert kept == [stream[0], stream[1], stream[2], stream[6]]
+    assert [(duplicate.position, duplicate.first_position) for duplicate in deduplicator.duplicates] == [(3, 0), (4, 1)]
+    assert [(conflict.position, conflict.fields) for conflict in deduplicator.conflicts] == [(5, ('name',))]
+    assert len(deduplicator) == len(stream)
+
+def test_conflicts_report_every_differing_field():
+    """
+    Test that a conflict lists every field whose value differs from the first record.
+    """
+    # Arrange: Records conflicting on several fields
+    deduplicator = Deduplicator()
+    deduplicator.add(make_client(3))
+    deduplicator.add(make_product(4))
+    # Act: Add the conflicting records
+    client = deduplicator.add(make_client(3, name='Ana Maria', email='ana@gmail.com', city='Olinda'))
+    product = deduplicator.add(make_product(4, price='21.00', quantity=0))
+    # Assert: Check the differing fields and the report
+    assert client.fields == ('name', 'email', 'address') and not client.exact
+    assert product.fields == ('price', 'quantity')
+    assert deduplicator.report() == [
+        {'type': 'Client', 'id': 3, 'position': 2, 'first_position': 0, 'kind': 'conflict',
+         'fields': ['name', 'email', 'address']},
+        {'type': 'Product', 'id': 4, 'position': 3, 'first_position': 1, 'kind': 'conflict',
+         'fields': ['price', 'quantity']},
+    ]
+
+def test_repeated_conflicting_record_is_an_exact_duplicate():
+    """
+    Test that a record equal to an earlier conflicting record is reported as its exact duplicate.
+    """
+    # Arrange: A record, a conflicting record and a copy of the conflicting one
+    deduplicator = Deduplicator()
+    records = [make_client(5), make_client(5, name='Beatriz'), make_client(5, name='Beatriz')]
+    # Act: Check the records
+    results = [deduplicator.add(record) for record in records]
+    # Assert: Check the result of each record
+    assert results[0] is None
+    assert results[1].fields == ('name',) and results[1].first is records[0]
+    assert results[2].exact and results[2].first is records[1] and results[2].first_position == 1
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize('record', [None, 'C001', Address('Recife', 'PE'), Price('1.00')])
+def test_other_records_raise_type_error(record):
+    """
+    Test that only Clients and Products are accepted.
+    """
+    # Arrange: An empty deduplicator
+    deduplicator = Deduplicator()
+    # Act & Assert: Check that the record is rejected and not counted
+    with pytest.raises(TypeError):
+        deduplicator.add(record)
+    assert len(deduplicator) == 0
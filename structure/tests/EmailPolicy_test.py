@@ -0,0 +1,68 @@
+# Import custom classes
+from ..models.Email import Email
+from ..models.EmailPolicy import EmailPolicy, DEFAULT_EMAIL_POLICY
+
+# Import necessary libraries
+import pytest
+
+# Test function for the "happy path" scenario
+def test_default_policy_is_shared():
+    """
+    Test that emails without custom domains share the default policy.
+    """
+    # Act: Create two emails with the default domains
+    first = Email("first@gmail.com")
+    second = Email("second@outlook.com")
+    # Assert: Check that both use the module-level singleton
+    assert first.policy is DEFAULT_EMAIL_POLICY
+    assert second.policy is DEFAULT_EMAIL_POLICY
+    assert EmailPolicy.for_domains(["hotmail.com", "gmail.com", "outlook.com"]) is DEFAULT_EMAIL_POLICY
+
+def test_custom_domains_are_interned():
+    """
+    Test that equal domain lists resolve to the same policy, whatever their order.
+    """
+    # Act: Create emails with the same domains in different orders
+    first = Email("first@a.com", ["a.com", "b.com"])
+    second = Email("second@b.com", ["b.com", "a.com", "a.com"])
+    # Assert: Check that the policy object is shared
+    assert first.policy is second.policy
+    assert first.policy.domains == frozenset({"a.com", "b.com"})
+
+@pytest.mark.parametrize(
+    "email, username, domain",
+    [
+        # Test 1: Simple address
+        ("ana.silva@gmail.com", "ana.silva", "gmail.com"),
+        # Test 2: Address with symbols in the local part
+        ("first+tag_1%x@outlook.com", "first+tag_1%x", "outlook.com"),
+    ]
+)
+def test_email_parts(email: str, username: str, domain: str):
+    """
+    Test that the username and domain are split once and kept.
+    """
+    # Act: Create the email
+    email_obj = Email(email)
+    # Assert: Check both parts
+    assert (email_obj.username, email_obj.domain) == (username, domain)
+
+@pytest.mark.parametrize(
+    "domains, email, expected",
+    [
+        # Test 1: Dots of domains are escaped
+        (["gmail.com"], "a@gmailxcom", False),
+        # Test 2: Domain must match fully
+        (["gmail.com"], "a@gmail.com.br", False),
+        # Test 3: Trailing newline is not accepted
+        (["gmail.com"], "a@gmail.com\n", False),
+        # Test 4: Valid address
+        (["gmail.com"], "a.b-c@gmail.com", True),
+    ]
+)
+def test_policy_matches(domains, email: str, expected: bool):
+    """
+    Test the matching rules of a policy.
+    """
+    # Act & Assert: Check the match result
+    assert EmailPolicy.for_domains(domains).matches(email) is expected
@@ -1,9 +1,12 @@
 # Import custom classes
 from ..models.Email import Email
+from ..models.EmailPolicy import EmailPolicy
 from ..exceptions.InvalidEmailError import InvalidEmailError
 
 # Import necessary libraries
+from concurrent.futures import ThreadPoolExecutor
 import pytest
+import pandas as pd
 from typing import List, Optional
 
 # Test function for the "happy path" scenario
@@ -61,4 +64,136 @@ def test_create_invalid_email_object(email: str, valid_domains: Optional[List[st
     }
     # Act & Assert: Attempt to create an Email object and expect an exception
     with pytest.raises(expected_exception):
-        Email(**invalid_email)
\ No newline at end of file
+        Email(**invalid_email)
+
+# Messy column of addresses covering every rule of the email setter
+messy_emails = pd.Series([
+    "ana.silva@gmail.com", "bruno@email.com", "carla@outlook.com", "", "   ", None, 42, float("nan"),
+    "no-at-sign.com", "two@@gmail.com", "bad char@gmail.com", "daniel@gmail.com\n", "eva@hotmail.com",
+    "ana.silva@gmail.com", "x@gmail.com.br", "@gmail.com"
+], index=range(100, 116))
+
+@pytest.mark.parametrize("valid_domains", [None, ["email.com"], ["gmail.com", "email.com"], []])
+def test_validate_series_matches_scalar_class(valid_domains: Optional[List[str]]):
+    """
+    Test that column-wise validation accepts exactly the addresses accepted by Email.
+    """
+    # Arrange: Decisions and parts of the scalar class
+    expected_valid, expected_parts = [], []
+    for value in messy_emails:
+        try:
+            email_obj = Email(value, valid_domains)
+            expected_valid.append(True)
+            expected_parts.append((email_obj.username, email_obj.domain))
+        except InvalidEmailError:
+            expected_valid.append(False)
+    # Act: Validate the whole column
+    result = Email.validate_series(messy_emails, valid_domains)
+    # Assert: Check the mask and the extracted parts
+    assert result.index.equals(messy_emails.index)
+    assert result['valid'].tolist() == expected_valid
+    valid_rows = result[result['valid']]
+    assert list(zip(valid_rows['username'], valid_rows['domain'])) == expected_parts
+    assert result.loc[~result['valid'], ['username', 'domain']].isna().all().all()
+
+def test_validate_series_accepts_policy():
+    """
+    Test that the sample's '@email.com' addresses are accepted through a policy.
+    """
+    # Arrange: Policy accepting the sample domain
+    policy = EmailPolicy.for_domains(["email.com"])
+    # Act: Validate the column
+    result = Email.validate_series(pd.Series(["ana.silva@email.com", "ana.silva@gmail.com"]), policy=policy)
+    # Assert: Check the mask
+    assert result['valid'].tolist() == [True, False]
+
+@pytest.fixture
+def empty_cache():
+    """Start with an empty cache of Email.cached and restore its size limit afterwards."""
+    maxsize = Email.cache_info().maxsize
+    Email.cache_clear()
+    yield
+    Email.cache_clear(maxsize)
+
+def test_cached_returns_shared_immutable_instance(empty_cache):
+    """
+    Test that caching the same address returns one shared, immutable Email per policy.
+    """
+    # Arrange: A custom policy
+    policy = EmailPolicy.for_domains(['email.com', 'gmail.com'])
+    # Act: Cache the same address twice with each policy
+    first, second = Email.cached('ana.silva@gmail.com'), Email.cached('ana.silva@gmail.com')
+    custom = Email.cached('ana.silva@gmail.com', policy)
+    # Assert: Check the shared instances, their policies and the statistics
+    assert first is second and custom is not first
+    assert first == Email('ana.silva@gmail.com') and custom.policy is policy
+    assert Email.cache_info()[:2] == (1, 2)
+    with pytest.raises(AttributeError):
+        first.email = 'bruno.costa@gmail.com'
+
+def test_cached_invalid_addresses_fail_fast(empty_cache):
+    """
+    Test that invalid addresses are cached and raise the same error every time.
+    """
+    # Act: Cache an invalid address three times
+    messages = []
+    for _ in range(3):
+        with pytest.raises(InvalidEmailError) as error:
+            Email.cached('ana.silva@unknown.com')
+        messages.append(str(error.value))
+    # Assert: Check the errors and that only the first lookup missed
+    assert messages == ["email don't match with pattern."] * 3
+    info = Email.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1) and info.hit_rate == pytest.approx(2 / 3)
+
+def test_cache_evicts_least_recently_used(empty_cache):
+    """
+    Test that a full cache drops the least recently used address and counts the evictions.
+    """
+    # Arrange: A cache of two addresses
+    Email.cache_clear(maxsize=2)
+    first = Email.cached('ana@gmail.com')
+    Email.cached('bruno@gmail.com')
+    # Act: Use the first address again, then cache a third one
+    Email.cached('ana@gmail.com')
+    Email.cached('carla@gmail.com')
+    # Assert: Check that the second address was evicted, not the first
+    assert Email.cached('ana@gmail.com') is first
+    info = Email.cache_info()
+    assert (info.evictions, info.maxsize, info.currsize) == (1, 2, 2)
+    Email.cached('bruno@gmail.com')
+    assert Email.cache_info().misses == 4
+
+def test_cached_is_thread_safe(empty_cache):
+    """
+    Test that threads caching the same addresses get their Emails and leave one cached instance per address.
+    """
+    # Arrange: Addresses repeated many times
+    addresses = [f'user{i % 50}@gmail.com' for i in range(5_000)]
+    # Act: Cache them from several threads
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        emails = list(executor.map(Email.cached, addresses))
+    # Assert: Check the Emails, the statistics and the cached instances
+    assert emails == addresses
+    info = Email.cache_info()
+    assert info.hits + info.misses == 5_000 and info.currsize == 50
+    assert len({id(Email.cached(address)) for address in addresses}) == 50
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize("email", [None, 42, ['ana@gmail.com'], ''])
+def test_cached_rejects_invalid_values(empty_cache, email):
+    """
+    Test that values that are not addresses raise the usual validation error.
+    """
+    # Act & Assert: Attempt to cache the value and expect an exception
+    with pytest.raises(InvalidEmailError):
+        Email.cached(email)
+
+@pytest.mark.parametrize("maxsize", [0, -1, 1.5, True])
+def test_invalid_cache_size_raises_value_error(empty_cache, maxsize):
+    """
+    Test that the size limit of the cache must be a positive integer.
+    """
+    # Act & Assert: Attempt to resize the cache and expect an exception
+    with pytest.raises(ValueError):
+        Email.cache_clear(maxsize)
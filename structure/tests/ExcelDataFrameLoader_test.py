@@ -0,0 +1,166 @@
+# Import custom classes
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..generators.WorkbookGenerator import WorkbookGenerator
+from ..loaders import _streaming
+from ..exceptions.InvalidPathError import InvalidPathError
+
+# Import necessary libraries
+import os
+import pytest
+import openpyxl
+import tracemalloc
+import pandas as pd
+
+# Sample workbook shipped with the project
+file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
+sheets = ['Clients', 'Products', 'Sales']
+
+# Test function for the "happy path" scenario
+def test_load_workbook_matches_load_data():
+    """
+    Test that loading every sheet at once returns the same DataFrames as separate calls.
+    """
+    # Act: Load the sheets in a single pass
+    loaded = ExcelDataFrameLoader.load_workbook(file_path, sheets)
+    # Assert: Check that each sheet matches the single sheet loader
+    assert list(loaded.keys()) == sheets
+    for sheet in sheets:
+        assert loaded[sheet].equals(ExcelDataFrameLoader.load_data(file_path, sheet))
+
+def test_load_workbook_defaults_to_every_sheet():
+    """
+    Test that every sheet is loaded when no sheet is requested.
+    """
+    # Act: Load the workbook without selecting sheets
+    loaded = ExcelDataFrameLoader.load_workbook(file_path)
+    # Assert: Check that all sheets are present
+    assert sorted(loaded.keys()) == sorted(ExcelDataFrameLoader.get_sheet_names(file_path))
+
+def test_load_workbook_opens_the_file_once(monkeypatch):
+    """
+    Test that loading every sheet at once opens the workbook once instead of once per sheet.
+    """
+    # Arrange: Count the workbooks opened by the Excel engine
+    opened = []
+    load_workbook = openpyxl.load_workbook
+    monkeypatch.setattr(openpyxl, 'load_workbook', lambda *args, **kwargs: opened.append(1) or load_workbook(*args, **kwargs))
+    # Act: Load the sheets separately, then in a single pass
+    for sheet in sheets:
+        ExcelDataFrameLoader.load_data(file_path, sheet)
+    separate = len(opened)
+    ExcelDataFrameLoader.load_workbook(file_path, sheets)
+    # Assert: Check that the single pass opened the file once
+    assert separate == len(sheets)
+    assert len(opened) - separate == 1
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize(
+    "path, requested",
+    [
+        # Test 1: Path without the '.xlsx' extension
+        ("sales_relatory.csv", None),
+        # Test 2: Path that does not exist
+        ("missing_file.xlsx", None),
+        # Test 3: Sheet that does not exist
+        (file_path, ["Missing"]),
+    ]
+)
+def test_load_workbook_invalid_input(path: str, requested):
+    """
+    Test that loading an invalid workbook or sheet raises InvalidPathError.
+    """
+    # Act & Assert: Attempt to load and expect an exception
+    with pytest.raises(InvalidPathError):
+        ExcelDataFrameLoader.load_workbook(path, requested)
+
+@pytest.mark.parametrize("chunksize", [1000, 2575, 5000])
+def test_iter_chunks_matches_load_data(chunksize: int):
+    """
+    Test that streaming a sheet in chunks yields the same rows as loading it at once.
+    """
+    # Act: Stream the biggest sheet
+    chunks = list(ExcelDataFrameLoader.iter_chunks(file_path, 'Sales', chunksize=chunksize))
+    # Assert: Check chunk sizes and the concatenated content
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    assert pd.concat(chunks).equals(ExcelDataFrameLoader.load_data(file_path, 'Sales'))
+
+def test_iter_chunks_memory_does_not_grow_with_the_sheet(tmp_path):
+    """
+    Test that streaming a sheet eight times bigger takes no more memory, rows being dropped once read.
+    """
+    # Arrange: Generated workbooks, which have no <dimension> element, with small and big Sales sheets
+    generator = WorkbookGenerator(clients=50, products=10)
+    peaks = {}
+    for sales in (2_000, 16_000):
+        path = str(tmp_path / f'sales_{sales}.xlsx')
+        generator.write(path, sales)
+        # Act: Stream the Sales sheet and record the peak memory traced
+        tracemalloc.start()
+        try:
+            rows = sum(len(chunk) for chunk in ExcelDataFrameLoader.iter_chunks(path, 'Sales', chunksize=500))
+            peaks[sales] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # Assert: Check that every row was streamed, as pandas reads them
+        assert rows == sales == len(pd.read_excel(path, sheet_name='Sales'))
+    # Assert: Check that the peak stays flat instead of growing eightfold
+    assert peaks[16_000] < 1.5 * peaks[2_000]
+
+def test_streaming_private_api_matches_openpyxl(tmp_path):
+    """
+    Test that the installed openpyxl is one whose private API the streaming helpers were checked against, and that they read what openpyxl reads.
+    """
+    # Arrange: The sample workbook, a generated one without <dimension> and one with missing rows and cells
+    generated = str(tmp_path / 'generated.xlsx')
+    WorkbookGenerator(clients=20, products=5).write(generated, 50)
+    sparse = str(tmp_path / 'sparse.xlsx')
+    book = openpyxl.Workbook()
+    book.active.append(['id', 'name', 'total'])
+    book.active['A3'], book.active['C3'], book.active['B6'] = 'C001', 1.5, 'Ana'
+    book.save(sparse)
+    # Assert: Fail loudly when openpyxl was upgraded without checking the private API again
+    assert _streaming.PRIVATE_API, (
+        f"openpyxl {openpyxl.__version__} is not in _streaming.SUPPORTED_VERSIONS: check the private API "
+        "used by structure/loaders/_streaming.py against it, then add the version.")
+    for path in (file_path, generated, sparse):
+        # Act: Read every sheet with the helpers and with openpyxl
+        workbook = _streaming.open_workbook(path)
+        reference = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            # Assert: Check the sheet classes and the rows
+            assert all(isinstance(sheet, _streaming._Worksheet) for sheet in workbook.worksheets)
+            for sheet, expected in zip(workbook.worksheets, reference.worksheets):
+                assert list(_streaming.iter_values(sheet)) == list(expected.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+            reference.close()
+
+def test_iter_chunks_falls_back_to_openpyxl_for_unchecked_versions(monkeypatch):
+    """
+    Test that with an openpyxl version the streaming helpers were not checked against, sheets are still streamed with the public API.
+    """
+    # Arrange: Pretend the installed openpyxl is not supported
+    monkeypatch.setattr(_streaming, 'PRIVATE_API', False)
+    # Act: Stream the biggest sheet
+    chunks = list(ExcelDataFrameLoader.iter_chunks(file_path, 'Sales', chunksize=1000))
+    # Assert: Check the content
+    assert pd.concat(chunks).equals(ExcelDataFrameLoader.load_data(file_path, 'Sales'))
+
+@pytest.mark.parametrize(
+    "path, sheet_name, chunksize",
+    [
+        # Test 1: Path that does not exist
+        ("missing_file.xlsx", 0, 10),
+        # Test 2: Sheet that does not exist
+        (file_path, "Missing", 10),
+        # Test 3: Chunk size that is not positive
+        (file_path, "Sales", 0),
+    ]
+)
+def test_iter_chunks_invalid_input(path: str, sheet_name, chunksize: int):
+    """
+    Test that streaming an invalid workbook, sheet or chunk size raises InvalidPathError.
+    """
+    # Act & Assert: Attempt to stream and expect an exception
+    with pytest.raises(InvalidPathError):
+        next(ExcelDataFrameLoader.iter_chunks(path, sheet_name, chunksize=chunksize))
@@ -0,0 +1,73 @@
+# Import necessary libraries
+import os
+import subprocess
+import sys
+import pytest
+
+# Directory containing the structure package, from which the subprocesses import it
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def run_python(code: str) -> str:
+    """Run code in a fresh interpreter, where no test has imported pandas yet, and return its output."""
+    result = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+# Test function for the "happy path" scenario
+def test_models_do_not_import_pandas():
+    """
+    Test that importing and using the models leaves pandas, numpy and openpyxl unimported.
+    """
+    # Act: Import the models and build objects in a fresh interpreter
+    output = run_python(
+        "import sys, structure.models\n"
+        "from structure.models import Address, Client, Email, Price, Product\n"
+        "Client(1, 'Ana', 'Silva', Email('ana.silva@gmail.com'), Address('São Paulo', 'SP'))\n"
+        "Product(1, 'Smartphone Alpha', 'Celulares', Price('19.99'), 50)\n"
+        "print(sorted(name for name in ('pandas', 'numpy', 'openpyxl') if name in sys.modules))"
+    )
+    # Assert: Check that none of the heavy libraries was imported
+    assert output == '[]'
+
+@pytest.mark.parametrize('access, loaded, name', [
+    ('structure.loaders.ExcelDataFrameLoader', 'pandas', 'ExcelDataFrameLoader'),
+    ('structure.analytics', 'pandas', 'structure.analytics'),
+    ('structure.models.PriceArray', 'numpy', 'PriceArray'),
+])
+def test_lazy_names_import_their_libraries_on_first_access(access, loaded, name):
+    """
+    Test that lazy names are importable and import their libraries only when accessed.
+    """
+    # Act: Access the name after importing the package in a fresh interpreter
+    output = run_python(
+        "import sys, structure\n"
+        f"before = {loaded!r} in sys.modules\n"
+        f"value = {access}\n"
+        f"print(before, {loaded!r} in sys.modules, value.__name__)"
+    )
+    # Assert: Check that the library was imported by the access only
+    assert output == f'False True {name}'
+
+def test_star_imports_keep_their_names():
+    """
+    Test that star imports still provide every exported name, lazy ones included.
+    """
+    # Act: Star import the packages in a fresh interpreter
+    output = run_python(
+        "from structure.models import *\n"
+        "from structure.loaders import *\n"
+        "print(PriceArray.__name__, ExcelDataFrameLoader.__name__, pd.__name__, SALES_SCHEMA.sheet_name)"
+    )
+    # Assert: Check the names
+    assert output == 'PriceArray ExcelDataFrameLoader pandas Sales'
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize('module', ['structure', 'structure.loaders', 'structure.models'])
+def test_unknown_names_raise_attribute_error(module):
+    """
+    Test that accessing a name the package does not export raises AttributeError.
+    """
+    # Arrange: Import the package
+    package = __import__(module, fromlist=['_'])
+    # Act & Assert: Check that an unknown attribute is rejected
+    with pytest.raises(AttributeError):
+        getattr(package, 'missing')
@@ -0,0 +1,83 @@
+# Import custom classes
+from ..loaders.IncrementalIngestor import IncrementalIngestor
+from ..loaders.SheetSchema import SALES_WORKBOOK_SCHEMAS
+from ..models.Product import Product
+from ..exceptions.DuplicateRecordError import DuplicateRecordError
+
+# Import necessary libraries
+import os
+import pytest
+import pandas as pd
+
+# Sample workbook shipped with the project
+file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
+
+def export(path: str, sheets: dict):
+    """
+    Write the sheets to a workbook, as a new export of the same report.
+    """
+    with pd.ExcelWriter(path) as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+
+@pytest.fixture
+def products() -> pd.DataFrame:
+    """
+    Products sheet of the sample workbook.
+    """
+    return pd.read_excel(file_path, sheet_name='Products')
+
+# Test function for the "happy path" scenario
+@pytest.mark.parametrize("schemas", [None, SALES_WORKBOOK_SCHEMAS])
+def test_ingest_rebuilds_only_changed_rows(tmp_path, products: pd.DataFrame, schemas):
+    """
+    Test that a second export is diffed against the first and only changed rows are rebuilt.
+    """
+    # Arrange: A first export and an ingestor with an empty state
+    workbook = os.path.join(tmp_path, 'report.xlsx')
+    export(workbook, {'Products': products})
+    ingestor = IncrementalIngestor(os.path.join(tmp_path, 'state'))
+    first = ingestor.ingest(workbook, ['Products'], schemas=schemas)['Products']
+    # Act: Re-export with one price changed, one product removed and one added
+    changed = products.copy()
+    changed.loc[0, 'unit_price'] = 2899.9
+    new_row = changed.iloc[[1]].assign(id_product='P999')
+    export(workbook, {'Products': pd.concat([changed.drop(index=2), new_row], ignore_index=True)})
+    second = ingestor.ingest(workbook, ['Products'], schemas=schemas)['Products']
+    # Assert: Check the detected changes and the rebuilt objects
+    id_of = (lambda value: value) if schemas is None else (lambda value: int(value[1:]))
+    assert len(first.inserted) == len(products) and len(first.objects) == len(products)
+    assert second.inserted == [id_of('P999')] and second.updated == [id_of('P001')]
+    assert second.deleted == [id_of('P003')] and second.unchanged == len(products) - 2
+    assert [product.id_product for product in second.objects] == ['P1', 'P999']
+    assert all(isinstance(product, Product) for product in second.objects)
+    assert IncrementalIngestor.summary({'Products': second}).loc['Products'].tolist() == [1, 1, 1, len(products) - 2, 0]
+
+def test_reset_forces_full_ingestion(tmp_path, products: pd.DataFrame):
+    """
+    Test that removing the stored fingerprints makes every row new again.
+    """
+    # Arrange: An ingested workbook
+    workbook = os.path.join(tmp_path, 'report.xlsx')
+    export(workbook, {'Products': products})
+    ingestor = IncrementalIngestor(os.path.join(tmp_path, 'state'))
+    ingestor.ingest(workbook, ['Products'])
+    # Act: Reset the state and ingest again
+    ingestor.reset(workbook)
+    changes = ingestor.ingest(workbook, ['Products'])['Products']
+    # Assert: Check that every row was rebuilt
+    assert len(changes.inserted) == len(products) and changes.unchanged == 0
+
+# Test function for the "unhappy path" scenario
+def test_ingest_rejects_duplicate_keys(tmp_path, products: pd.DataFrame):
+    """
+    Test that a sheet with a repeated key is rejected and no fingerprint is stored.
+    """
+    # Arrange: An export with a repeated product id
+    workbook = os.path.join(tmp_path, 'report.xlsx')
+    export(workbook, {'Products': pd.concat([products, products.iloc[[0]]], ignore_index=True)})
+    ingestor = IncrementalIngestor(os.path.join(tmp_path, 'state'))
+    # Act & Assert: Attempt to ingest and expect an exception
+    with pytest.raises(DuplicateRecordError):
+        ingestor.ingest(workbook, ['Products'])
+    assert os.listdir(ingestor.state_dir) == []
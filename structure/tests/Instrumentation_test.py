@@ -0,0 +1,120 @@
+# Import custom classes
+from ..instrumentation.Instrumentation import Instrumentation, current, instrumented, stage
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..loaders.SheetSchema import SALES_WORKBOOK_SCHEMAS
+from ..models.Client import Client
+
+# Import necessary libraries
+import json
+import os
+import pytest
+
+# Sample workbook shipped with the project
+file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
+sheets = ['Clients', 'Products', 'Sales']
+
+# Test function for the "happy path" scenario
+def test_stages_do_nothing_when_disabled():
+    """
+    Test that stages opened without an enabled instrumentation are shared no-ops.
+    """
+    # Act: Open two stages outside of any instrumentation
+    with stage('parse', 'Sales') as first, stage('validate') as second:
+        first.add_rows(10)
+    # Assert: Check that nothing is enabled
+    assert first is second and not first.enabled
+    assert current() is None
+
+def test_loading_records_every_stage_of_every_sheet():
+    """
+    Test that loading a workbook with schemas records opening, parsing and finalizing each sheet.
+    """
+    # Act: Load the sample workbook inside an instrumentation
+    with Instrumentation() as run:
+        loaded = ExcelDataFrameLoader.load_workbook(file_path, sheets, schemas=SALES_WORKBOOK_SCHEMAS)
+    # Assert: Check the recorded stages and their rows
+    stages = {(stats.stage, stats.sheet): stats for stats in run.stages}
+    assert stages[('open', None)].calls == 1
+    for sheet in sheets:
+        assert stages[('parse', sheet)].rows == stages[('finalize', sheet)].rows == len(loaded[sheet])
+        assert stages[('parse', sheet)].wall_seconds > 0 and stages[('parse', sheet)].rows_per_second > 0
+    assert current() is None
+
+def test_bulk_construction_records_failures_per_rule():
+    """
+    Test that validation failures are counted per field and rule, as in the report.
+    """
+    # Arrange: The Clients sheet, whose emails are rejected by the default domains
+    clients = ExcelDataFrameLoader.load_data(file_path, 'Clients')
+    # Act: Build the clients inside an instrumentation
+    with Instrumentation() as run:
+        objects, report = Client.from_dataframe(clients)
+    # Assert: Check the failures and the rows of each stage
+    expected = (report['field'] + '.' + report['rule']).value_counts().to_dict()
+    assert run.failures() == {'Clients': expected}
+    stages = {(stats.stage, stats.sheet): stats for stats in run.stages}
+    assert stages[('validate', 'Clients')].rows == len(clients)
+    assert stages[('construct', 'Clients')].rows == len(objects)
+
+def test_streaming_counts_every_row():
+    """
+    Test that streaming a sheet records one parse and one finalize per chunk.
+    """
+    # Act: Stream the Sales sheet inside an instrumentation
+    with Instrumentation() as run:
+        chunks = list(ExcelDataFrameLoader.iter_chunks(file_path, 'Sales', chunksize=1000))
+    # Assert: Check the calls and rows of each stage
+    stages = {(stats.stage, stats.sheet): stats for stats in run.stages}
+    assert stages[('parse', 'Sales')].calls == stages[('finalize', 'Sales')].calls == len(chunks)
+    assert stages[('parse', 'Sales')].rows == sum(len(chunk) for chunk in chunks)
+
+def test_memory_peaks_of_nested_stages():
+    """
+    Test that a stage reports the memory it allocated and that enclosing stages include it.
+    """
+    # Act: Allocate a large object in an inner stage, then free it
+    with Instrumentation(trace_memory=True) as run:
+        with stage('outer'):
+            with stage('inner'):
+                data = bytearray(5_000_000)
+            del data
+    # Assert: Check the peaks of both stages and of the run
+    stages = {stats.stage: stats for stats in run.stages}
+    assert stages['inner'].peak_bytes >= 5_000_000
+    assert stages['outer'].peak_bytes >= stages['inner'].peak_bytes
+    assert run.report()['peak_bytes'] >= stages['outer'].peak_bytes
+
+def test_decorator_and_reports(tmp_path):
+    """
+    Test that decorated functions are timed per call and that the run is exported as JSON and as a table.
+    """
+    # Arrange: A decorated function
+    @instrumented('transform', 'Sales')
+    def transform(rows: int) -> int:
+        return rows * 2
+    path = os.path.join(tmp_path, 'report.json')
+    # Act: Call it inside an instrumentation and export the report
+    with Instrumentation() as run:
+        results = [transform(rows) for rows in range(3)]
+    text = run.to_json(path)
+    # Assert: Check the calls, the exported files and the table
+    assert results == [0, 2, 4]
+    with open(path, encoding='utf-8') as file:
+        assert json.load(file) == json.loads(text)
+    assert json.loads(text)['stages'][0]['calls'] == 3
+    assert 'transform' in run.table() and 'total' in run.table()
+
+# Test function for the "unhappy path" scenario
+def test_failed_run_is_still_recorded():
+    """
+    Test that a stage that raises is recorded and that the instrumentation is disabled afterwards.
+    """
+    # Act: Raise inside a stage of an instrumentation
+    run = Instrumentation()
+    with pytest.raises(ValueError):
+        with run:
+            with stage('parse', 'Sales'):
+                raise ValueError('broken sheet')
+    # Assert: Check the recorded stage and the disabled instrumentation
+    assert [(stats.stage, stats.calls) for stats in run.stages] == [('parse', 1)]
+    assert current() is None and run.report()['wall_seconds'] > 0
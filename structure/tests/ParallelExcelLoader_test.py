@@ -0,0 +1,71 @@
+# Import custom classes
+from ..loaders.ParallelExcelLoader import ParallelExcelLoader
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..exceptions.InvalidPathError import InvalidPathError
+
+# Import necessary libraries
+import os
+import shutil
+import pytest
+
+# Sample workbook shipped with the project
+file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
+sheets = ['Clients', 'Products', 'Sales']
+
+# Test function for the "happy path" scenario
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_load_workbook_matches_sequential(workers: int):
+    """
+    Test that parallel loading returns the same DataFrames as the sequential loader.
+    """
+    # Act: Load the sheets with the worker pool
+    loaded = ParallelExcelLoader(workers=workers).load_workbook(file_path, sheets)
+    # Assert: Check that each sheet matches the sequential loader
+    expected = ExcelDataFrameLoader.load_workbook(file_path, sheets)
+    assert list(loaded.keys()) == sheets
+    for sheet in sheets:
+        assert loaded[sheet].equals(expected[sheet])
+
+@pytest.mark.parametrize("use_glob", [False, True])
+def test_parallel_load_many_concatenates_workbooks(tmp_path, use_glob: bool):
+    """
+    Test that monthly workbooks found in a directory or glob are concatenated in order.
+    """
+    # Arrange: Two monthly copies of the sample and an Excel lock file
+    for month in ('01', '02'):
+        shutil.copy(file_path, tmp_path / f'sales_relatory_2025{month}.xlsx')
+    (tmp_path / '~$sales_relatory_202501.xlsx').write_bytes(b'')
+    source = str(tmp_path / 'sales_relatory_*.xlsx') if use_glob else str(tmp_path)
+    # Act: Load the Clients and Sales sheets of every workbook
+    loaded = ParallelExcelLoader(workers=2).load_many(source, ['Clients', 'Sales'])
+    # Assert: Check that both workbooks were concatenated
+    sales = ExcelDataFrameLoader.load_data(file_path, 'Sales')
+    assert len(loaded['Sales']) == 2 * len(sales)
+    assert loaded['Sales'].iloc[len(sales):].reset_index(drop=True).equals(sales)
+    assert len(loaded['Clients']) == 100
+
+# Test function for the "unhappy path" scenario
+def test_parallel_error_names_failing_sheet():
+    """
+    Test that a failing sheet surfaces as InvalidPathError naming the sheet.
+    """
+    # Act & Assert: Attempt to load a missing sheet and expect an exception
+    with pytest.raises(InvalidPathError, match="'Missing'"):
+        ParallelExcelLoader(workers=2).load_workbook(file_path, ['Clients', 'Missing'])
+
+def test_parallel_no_workbook_found(tmp_path):
+    """
+    Test that an empty directory raises InvalidPathError.
+    """
+    # Act & Assert: Attempt to load an empty directory and expect an exception
+    with pytest.raises(InvalidPathError):
+        ParallelExcelLoader(workers=2).load_many(str(tmp_path), ['Sales'])
+
+@pytest.mark.parametrize("workers", [0, -2, 1.5, "4", True])
+def test_parallel_invalid_workers(workers):
+    """
+    Test that an invalid number of workers raises ValueError.
+    """
+    # Act & Assert: Attempt to create the loader and expect an exception
+    with pytest.raises(ValueError):
+        ParallelExcelLoader(workers=workers)
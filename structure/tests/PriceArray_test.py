@@ -0,0 +1,140 @@
+# Import custom classes
+from ..models.Price import Price
+from ..models.PriceArray import PriceArray
+from ..exceptions.InvalidPriceError import InvalidPriceError
+from ..exceptions.InvalidQuantityError import InvalidQuantityError
+
+# Import necessary libs
+import pytest
+import numpy as np
+import pandas as pd
+from decimal import Decimal
+
+# Test function for the "happy path" scenario
+@pytest.mark.parametrize(
+    "series, expected",
+    [
+        # Test 1: Float column with two decimal places
+        (pd.Series([19.99, 0.1, 0.2, 2999.9]), [1999, 10, 20, 299990]),
+        # Test 2: Integer column in currency units
+        (pd.Series([1, 50]), [100, 5000]),
+        # Test 3: Text column with a tie rounded half to even
+        (pd.Series(['19.99', '0.125', '0.135']), [1999, 12, 14]),
+        # Test 4: Column of Decimals
+        (pd.Series([Decimal('7.5'), Decimal('7.5')]), [750, 750]),
+    ]
+)
+def test_price_array_from_series(series: pd.Series, expected: list):
+    """
+    Test that pandas columns are converted to exact cents.
+    """
+    # Act: Build the array
+    prices = PriceArray.from_series(series)
+    # Assert: Check the cents and the round trip to pandas
+    assert prices.cents.dtype == np.int64 and prices.cents.tolist() == expected
+    assert prices.to_series().tolist() == [cents / 100 for cents in expected]
+
+def test_price_array_arithmetic_and_aggregation():
+    """
+    Test elementwise arithmetic, comparison masks and aggregations against Price objects.
+    """
+    # Arrange: Prices as objects and as an array
+    objects = [Price('0.10'), Price('0.20'), Price('19.99'), Price('0.10')]
+    prices = PriceArray.from_prices(objects)
+    # Act: Combine the array with prices and quantities
+    totals = prices * np.array([3, 1, 2, 10])
+    shifted = prices + Price('1.00')
+    # Assert: Check the results against the scalar Price operations
+    assert totals.cents.tolist() == [30, 20, 3998, 100]
+    assert shifted.to_prices() == [price + Price('1.00') for price in objects]
+    assert (prices < Price('0.15')).tolist() == [True, False, False, True]
+    assert (shifted - prices == Price('1.00')).all()
+    assert prices.sum() == Price('20.39') and str(prices.sum()) == '20.39'
+    assert prices.mean() == Price('5.10')
+    assert (prices.min(), prices.max()) == (Price('0.10'), Price('19.99'))
+    assert prices.argsort().tolist() == [0, 3, 1, 2]
+    assert prices.sum_by(['a', 'b', 'a', 'b']) == {'a': Price('20.09'), 'b': Price('0.30')}
+    assert prices[2] == Price('19.99') and len(prices[prices > Price('0.15')]) == 2
+
+def test_price_array_sum_has_no_float_drift():
+    """
+    Test that the total of many prices is exact where a float sum drifts.
+    """
+    # Arrange: A million prices of ten cents
+    prices = PriceArray.from_series(pd.Series([0.1] * 1_000_000))
+    # Act: Sum the prices
+    total = prices.sum()
+    # Assert: Check the exact total
+    assert total.price == Decimal('100000.00')
+    assert sum([0.1] * 1_000_000) != 100000.0
+
+def test_price_array_from_float_series_matches_price():
+    """
+    Test that float columns are rounded from the shortest repr of each value, as Price(str(value)) and Product.from_dataframe do.
+    """
+    # Arrange: Floats on a half cent, stored slightly below or above it
+    values = [2.675, 1.005, 0.125, 2.665, 1234567.895, 19.99]
+    # Act: Build the array from the column
+    prices = PriceArray.from_series(pd.Series(values))
+    # Assert: Check the cents against the scalar conversion
+    assert prices.cents.tolist() == [Price(str(value)).to_minor_units() for value in values]
+    assert prices.cents.tolist()[0] == 268
+
+def test_price_array_totals_beyond_int64_are_exact():
+    """
+    Test that totals which do not fit in int64 are exact instead of wrapping around.
+    """
+    # Arrange: Two prices whose total exceeds int64
+    prices = PriceArray([2 ** 62, 2 ** 62])
+    # Act: Aggregate the prices
+    total = prices.sum()
+    # Assert: Check the exact totals
+    assert total.units == 2 ** 63 and total.exponent == -2
+    assert prices.sum_by(['a', 'a']) == {'a': total}
+    assert prices.mean().units == 2 ** 62
+
+def test_price_array_is_read_only():
+    """
+    Test that the cents of a PriceArray cannot be changed in place.
+    """
+    # Arrange: An array of prices
+    prices = PriceArray([100, 200])
+    # Act & Assert: Attempt to write into the cents
+    with pytest.raises(ValueError):
+        prices.cents[0] = -1
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize(
+    "build, expected_exception",
+    [
+        # Test 1: Zero cents
+        (lambda: PriceArray([100, 0]), InvalidPriceError),
+        # Test 2: Float cents
+        (lambda: PriceArray([1.5]), InvalidPriceError),
+        # Test 3: Negative value in a column
+        (lambda: PriceArray.from_series(pd.Series([10.0, -1.0])), InvalidPriceError),
+        # Test 4: Missing value in a column
+        (lambda: PriceArray.from_series(pd.Series([10.0, np.nan])), InvalidPriceError),
+        # Test 5: Non-numeric text
+        (lambda: PriceArray.from_series(pd.Series(['abc'])), InvalidPriceError),
+        # Test 6: Subtraction with a non-positive result
+        (lambda: PriceArray([100, 200]) - Price('1.00'), InvalidPriceError),
+        # Test 7: Zero quantity
+        (lambda: PriceArray([100]) * 0, InvalidQuantityError),
+        # Test 8: Sum of an empty array
+        (lambda: PriceArray([]).sum(), ValueError),
+        # Test 9: Addition beyond int64
+        (lambda: PriceArray([2 ** 62]) + PriceArray([2 ** 62]), OverflowError),
+        # Test 10: Multiplication beyond int64
+        (lambda: PriceArray([2 ** 62]) * 2, OverflowError),
+        # Test 11: Column with more cents than int64 holds
+        (lambda: PriceArray.from_series(pd.Series([1e17])), OverflowError),
+    ]
+)
+def test_invalid_price_array(build, expected_exception: Exception):
+    """
+    Test that the positivity invariant of Price is enforced on whole arrays.
+    """
+    # Act & Assert: Attempt the operation and expect an exception
+    with pytest.raises(expected_exception):
+        build()
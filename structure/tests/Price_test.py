@@ -4,7 +4,7 @@ from ..exceptions.InvalidPriceError import InvalidPriceError
 
 # Import necessary libs
 import pytest
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 
 # Test function for the "happy path" scenario
 @pytest.mark.parametrize(
@@ -78,4 +78,153 @@ def test_create_invalid_price_object(price, expected_exception):
     }
     # Act & Assert: Attempt to create a Price object and check for the expected exception
     with pytest.raises(expected_exception):
-        Price(**invalid_price)
\ No newline at end of file
+        Price(**invalid_price)
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        # Test 1: Same number of decimal places
+        ("19.99", "0.01"),
+        # Test 2: Different number of decimal places
+        ("100.12345", "0.5"),
+        # Test 3: Exponent notation
+        ("1E+3", "2.675"),
+        # Test 4: Equal values written differently
+        ("19.9", "19.90"),
+        # Test 5: Sum rounded to 28 significant digits
+        ("1234567890123456789012345678.9", "0.01"),
+        # Test 6: Rounding carrying into one more digit
+        ("9999999999999999999999999999", "0.5"),
+        # Test 7: Exponent beyond the integer range
+        ("1E+500", "1"),
+        # Test 8: Value hashing to the modulus minus one
+        ("2305843009213693950", "1"),
+    ]
+)
+def test_price_arithmetic_matches_decimal(left: str, right: str):
+    """
+    Test that fixed-point arithmetic, comparison, hashing and formatting match Decimal.
+    """
+    # Arrange: Prices and the Decimals they stand for
+    a, b = Price(left), Price(right)
+    x, y = Decimal(left), Decimal(right)
+    # Act: Add the prices
+    result = a + b
+    # Assert: Check the value, the formatting, the comparisons and the hashes
+    assert result.price == x + y and str(result.price) == str(x + y)
+    assert str((result - b).price) == str(x + y - y)
+    assert str(result) == f"{x + y:.2f}" and repr(result) == f"Price('{x + y}')"
+    assert (a < b, a <= b, a == b, a >= b, a > b) == (x < y, x <= y, x == y, x >= y, x > y)
+    assert hash(a) == hash(x) and hash(b) == hash(y)
+
+def test_price_extreme_exponents_match_decimal():
+    """
+    Test that prices with extreme exponents are compared, hashed and formatted like Decimal, without huge powers of 10.
+    """
+    # Arrange: Extreme prices and the Decimals they stand for
+    huge, tiny, one = Price('1E+50000000'), Price('1E-50000000'), Price('1')
+    # Act & Assert: Compare, hash and format them
+    assert (huge < one, tiny < one, huge == one, huge > tiny) == (False, True, False, True)
+    assert hash(huge) == hash(Decimal('1E+50000000')) and hash(tiny) == hash(Decimal('1E-50000000'))
+    assert str(tiny) == "0.00" and tiny.to_minor_units() == 0
+    assert sorted([huge, one, tiny]) == [tiny, one, huge]
+
+def test_price_equals_its_exact_text_with_the_hash_of_its_value():
+    """
+    Test that a Price equals the exact text of its value, while hashing as the Decimal and not as the text.
+    """
+    # Arrange: A price and equal values of other types
+    price = Price('19.90')
+    # Act & Assert: Check the comparisons with strings, which are textual
+    assert price == '19.90' and '19.90' == price
+    assert price != '19.9' and price != '19.900' and price != '  '
+    # Act & Assert: Check that the hash is the one of the Decimal, shared with equal prices only
+    assert hash(price) == hash(Decimal('19.90')) == hash(Price('19.9'))
+    assert {price: 'found'}.get(Price('19.9')) == 'found'
+
+@pytest.mark.parametrize(
+    "price, expected",
+    [
+        # Test 1: Tie rounded to the even cent
+        ("0.125", "0.12"),
+        # Test 2: Tie rounded up to the even cent
+        ("0.135", "0.14"),
+        # Test 3: Above the tie
+        ("19.999", "20.00"),
+    ]
+)
+def test_price_str_rounds_half_even(price: str, expected: str):
+    """
+    Test that the string form rounds to cents half to even, like Decimal formatting.
+    """
+    # Act & Assert: Format the price
+    assert str(Price(price)) == expected == f"{Decimal(price):.2f}"
+
+def test_price_alternative_constructors():
+    """
+    Test building prices from minor units and from floats with an explicit rounding mode.
+    """
+    # Act: Build the prices
+    from_cents = Price.from_minor_units(1999)
+    from_mills = Price.from_minor_units(5, scale=3)
+    half_even = Price.from_float(2.675)
+    half_up = Price.from_float(0.125, rounding=ROUND_HALF_UP)
+    # Assert: Check the exact values
+    assert from_cents.price == Decimal("19.99") and from_cents.to_minor_units() == 1999
+    assert from_mills.price == Decimal("0.005")
+    # 2.675 is stored in binary just below the tie, so it rounds down
+    assert half_even.price == Decimal("2.67")
+    assert half_up.price == Decimal("0.13")
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        # Test 1: Zero minor units
+        lambda: Price.from_minor_units(0),
+        # Test 2: Minor units given as a float
+        lambda: Price.from_minor_units(19.99),
+        # Test 3: Float rounded to zero
+        lambda: Price.from_float(0.001),
+        # Test 4: Infinite float
+        lambda: Price.from_float(float('inf')),
+        # Test 5: Float with more than 28 digits once rounded to cents
+        lambda: Price.from_float(1e30),
+        # Test 6: Infinite string
+        lambda: Price("Infinity"),
+        # Test 7: Subtraction with a non-positive result
+        lambda: Price("1.00") - Price("1.0"),
+    ]
+)
+def test_invalid_fixed_point_prices(build):
+    """
+    Test that the fixed-point constructors and arithmetic keep prices positive and finite.
+    """
+    # Act & Assert: Attempt to build the price and expect an exception
+    with pytest.raises(InvalidPriceError):
+        build()
+
+@pytest.mark.parametrize(
+    "price, expected_rule",
+    [
+        # Test 1: Valid price
+        ("19.99", None),
+        # Test 2: Negative number
+        ("-19.99", "positive"),
+        # Test 3: Non-numeric string
+        ("abc", "numeric"),
+        # Test 4: Not a string
+        (None, "non_empty_string"),
+        # Test 5: Not a number
+        ("NaN", "numeric"),
+        # Test 6: Infinite number
+        ("Infinity", "numeric"),
+    ]
+)
+def test_validate_price_without_raising(price, expected_rule):
+    """
+    Test that validate reports the rule the setter would break instead of raising.
+    """
+    # Act: Validate the price
+    issues = Price.validate(price)
+    # Assert: Check the reported rule
+    assert [issue.rule for issue in issues] == ([] if expected_rule is None else [expected_rule])
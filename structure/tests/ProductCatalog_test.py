@@ -0,0 +1,117 @@
+# Import custom classes
+from ..models.Price import Price
+from ..models.Product import Product
+from ..repositories.ProductCatalog import ProductCatalog
+from ..exceptions.DuplicateRecordError import DuplicateRecordError
+from ..exceptions.InvalidPriceError import InvalidPriceError
+
+# Import necessary libraries
+import random
+import pytest
+
+def make_products() -> list:
+    """
+    Build products of two categories, one of them out of stock.
+    """
+    return [
+        Product(1, 'Mouse', 'Eletrônicos', Price('50.00'), 10),
+        Product(2, 'Teclado', 'Eletrônicos', Price('120.00'), 0),
+        Product(3, 'Monitor', 'Eletrônicos', Price('899.90'), 3),
+        Product(4, 'Cabo', 'Eletrônicos', Price('50.0'), 7),
+        Product(5, 'Cadeira', 'Móveis', Price('450.00'), 2),
+    ]
+
+# Test function for the "happy path" scenario
+@pytest.mark.parametrize(
+    "low, high, in_stock, expected",
+    [
+        # Test 1: Both bounds inclusive, ties ordered by id
+        (Price('50.00'), Price('120.00'), False, [1, 4, 2]),
+        # Test 2: Only products in stock
+        (Price('50.00'), Price('120.00'), True, [1, 4]),
+        # Test 3: No lower bound
+        (None, Price('49.99'), False, []),
+        # Test 4: No upper bound
+        (Price('100'), None, False, [2, 3]),
+    ]
+)
+def test_catalog_price_range(low: Price, high: Price, in_stock: bool, expected: list):
+    """
+    Test price range queries against a linear filter of the products.
+    """
+    # Arrange: A catalog of products
+    catalog = ProductCatalog(make_products())
+    # Act: Query the category
+    found = catalog.price_range('Eletrônicos', low, high, in_stock=in_stock)
+    # Assert: Check the products and their order
+    assert [product.id_product_int for product in found] == expected
+
+def test_catalog_matches_linear_scan():
+    """
+    Test range and cheapest-N queries of a random catalog against sorting and filtering every product.
+    """
+    # Arrange: Random products in three categories
+    rng = random.Random(1)
+    products = [Product(i, f'Produto {i}', rng.choice('ABC'), Price(f'{rng.randint(1, 500) / 10:.2f}'),
+                        rng.randint(0, 3)) for i in range(1, 501)]
+    catalog = ProductCatalog(products)
+    low, high = Price('10.00'), Price('30.00')
+    # Act: Query the catalog
+    found = catalog.price_range('B', low, high)
+    cheapest = catalog.cheapest('C', 5, in_stock=True)
+    # Assert: Check against the linear answers
+    ordered = sorted(products, key=lambda product: (product.price, product.id_product_int))
+    assert found == [p for p in ordered if p.category == 'B' and low <= p.price <= high]
+    assert cheapest == [p for p in ordered if p.category == 'C' and p.quantity > 0][:5]
+
+def test_catalog_updates_indexes_incrementally():
+    """
+    Test that price and quantity changes move products in the indexes.
+    """
+    # Arrange: A catalog of products
+    catalog = ProductCatalog(make_products())
+    # Act: Make the monitor cheap, restock the keyboard and sell every mouse
+    catalog.update_price(3, Price('10.00'))
+    catalog.update_quantity(2, 5)
+    catalog.update_quantity(1, 0)
+    removed = catalog.remove(5)
+    # Assert: Check the queries and the categories
+    assert [p.id_product_int for p in catalog.cheapest('Eletrônicos', 2)] == [3, 1]
+    assert [p.id_product_int for p in catalog.find_by_category('Eletrônicos', in_stock=True)] == [3, 4, 2]
+    assert catalog.get(3).price == Price('10.00') and removed.name == 'Cadeira'
+    assert catalog.categories() == ['Eletrônicos'] and len(catalog) == 4
+
+def test_catalog_handles_products_changed_directly():
+    """
+    Test that products whose price or quantity was set directly are removed under their indexed price and can be reindexed.
+    """
+    # Arrange: A catalog whose products are then changed without going through it
+    products = make_products()
+    catalog = ProductCatalog(products)
+    products[0].price = Price('900.00')
+    products[3].price = Price('1000.00')
+    products[1].quantity = 4
+    # Act: Remove one changed product, reindex another and update the last one
+    catalog.remove(1)
+    catalog.reindex(4)
+    catalog.update_price(2, Price('60.00'))
+    # Assert: Check that the other entries are intact and the indexes follow the products
+    assert [p.id_product_int for p in catalog.find_by_category('Eletrônicos')] == [2, 3, 4]
+    assert [p.id_product_int for p in catalog.find_by_category('Eletrônicos', in_stock=True)] == [2, 3, 4]
+    assert catalog.price_range('Eletrônicos', Price('1000'), Price('1000')) == [products[3]]
+
+# Test function for the "unhappy path" scenario
+def test_catalog_rejects_duplicates_and_invalid_updates():
+    """
+    Test that duplicate ids are rejected and invalid updates leave the indexes unchanged.
+    """
+    # Arrange: A catalog of products
+    catalog = ProductCatalog(make_products())
+    # Act & Assert: Attempt invalid operations and expect exceptions
+    with pytest.raises(DuplicateRecordError):
+        catalog.add(Product(1, 'Outro', 'Móveis', Price('1.00'), 1))
+    with pytest.raises(InvalidPriceError):
+        catalog.update_price(1, '10.00')
+    with pytest.raises(KeyError):
+        catalog.update_quantity(99, 1)
+    assert [p.id_product_int for p in catalog.find_by_category('Eletrônicos')] == [1, 4, 2, 3]
@@ -1,6 +1,8 @@
 # Import custom classes
 from ..models.Price import Price
 from ..models.Product import Product
+from ..loaders.SheetSchema import PRODUCTS_SCHEMA
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
 from ..exceptions.InvalidIdError import InvalidIdError
 from ..exceptions.InvalidNameError import InvalidNameError
 from ..exceptions.InvalidPriceError import InvalidPriceError
@@ -8,7 +10,13 @@ from ..exceptions.InvalidCategoryError import InvalidCategoryError
 from ..exceptions.InvalidQuantityError import InvalidQuantityError
 
 # Import necessary libs
+import os
 import pytest
+import numpy as np
+import pandas as pd
+
+# Sample workbook shipped with the project
+file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
 
 # Test function for the "happy path" scenario
 @pytest.mark.parametrize(
@@ -82,4 +90,93 @@ def test_create_invalid_product_object(id_product: int, name: str, category: str
     }
     # Act & Assert: Attempt to create a Product object and expect an exception
     with pytest.raises(expected_exception):
-        Product(**invalid_product)
\ No newline at end of file
+        Product(**invalid_product)
+
+# Dirty Products sheet mixing valid rows with every kind of rejected value
+dirty_products = pd.DataFrame({
+    'id_product': ['P001', 'P002', 'P003', 'Q004', 'P000', 'P006', 'P007', 'P008', 'P009', 'P010'],
+    'name_product': ['Smartphone Alpha', ' Notebook Pro ', 'Fone Wave', 'Mouse', 'Teclado', '', 'Monitor', 'Cabo', 'Drone', 'Tablet'],
+    'category': ['Celulares', 'Notebooks', 'Acessórios', 'Periféricos', 'Periféricos', 'Monitores', None, 'Acessórios', 'Drones', 'Tablets'],
+    'unit_price': [2999.9, 7499.0, 0.1 + 0.2, 89.9, 99.9, 899.0, 999.0, -5.0, float('nan'), 1499.0],
+    'stock': [50, 25, 0, 10, 10, 10, 10, 10, 10, -1],
+})
+
+def test_from_dataframe_matches_scalar_constructors():
+    """
+    Test that bulk construction accepts and rejects exactly the rows the setters accept and reject.
+    """
+    # Arrange: Decisions of the scalar constructors
+    expected = []
+    for _, row in dirty_products.iterrows():
+        id_product = row['id_product']
+        if id_product.startswith('P'):
+            id_product = int(id_product[1:])
+        try:
+            expected.append(Product(id_product, row['name_product'], row['category'],
+                                    Price(str(row['unit_price'])), int(row['stock'])))
+        except Exception:
+            pass
+    # Act: Build the products column-wise
+    products, report = Product.from_dataframe(dirty_products)
+    # Assert: Check the built objects, the exact prices and the rejected rows
+    assert products == expected
+    assert [str(product.price.price) for product in products] == ['2999.9', '7499.0', '0.30000000000000004']
+    assert list(zip(report['row'], report['field'], report['rule'])) == [
+        (3, 'id_product', 'format'), (4, 'id_product', 'positive'), (5, 'name_product', 'non_empty_string'),
+        (6, 'category', 'non_empty_string'), (7, 'unit_price', 'positive'), (8, 'unit_price', 'numeric'),
+        (9, 'stock', 'non_negative')]
+
+def test_from_dataframe_accepts_numeric_id_column():
+    """
+    Test that ids already loaded as numbers, as the typed sheet schemas load them, are accepted.
+    """
+    # Arrange: Integer and nullable integer id columns
+    df = dirty_products.iloc[:3].assign(id_product=[1, 2, 3])
+    typed = df.assign(id_product=df['id_product'].astype('Int64'))
+    # Act: Build the products of both columns
+    products, report = Product.from_dataframe(df)
+    typed_products, typed_report = Product.from_dataframe(typed)
+    # Assert: Check that every row was built with its id
+    assert [product.id_product_int for product in products] == [1, 2, 3]
+    assert typed_products == products
+    assert report.empty and typed_report.empty
+
+def test_validate_matches_dataframe_report():
+    """
+    Test that record validation reports every violation the column-wise report has, row by row, without raising.
+    """
+    # Act: Validate each row as a record and the whole sheet as a batch
+    issues = [(row, *issue) for row, record in zip(dirty_products.index, dirty_products.to_dict('records'))
+              for issue in Product.validate(record)]
+    report = Product.validate_dataframe(dirty_products)
+    # Assert: Check that both validations agree
+    assert [(row, field, rule) for row, field, rule, _ in issues] == list(zip(report['row'], report['field'], report['rule']))
+    assert Product.validate({'id_product': 'P1', 'name_product': 'Cabo', 'category': 'Acessórios',
+                             'unit_price': '9.90', 'stock': 3}) == []
+
+@pytest.mark.parametrize("schema", [None, PRODUCTS_SCHEMA])
+def test_validate_accepts_dataframe_rows(schema):
+    """
+    Test that rows taken from a loaded sheet with df.iloc, holding NumPy scalars, are validated like Python values.
+    """
+    # Arrange: The Products sheet of the sample workbook, raw and typed
+    df = ExcelDataFrameLoader.load_data(file_path, 'Products', schema=schema)
+    # Act: Validate every row as a record
+    issues = [Product.validate(df.iloc[i]) for i in range(len(df))]
+    # Assert: Check that the NumPy integers were accepted and nothing was flagged
+    assert isinstance(df.iloc[0]['stock'], np.integer)
+    assert issues == [[]] * len(df) and Product.validate_dataframe(df).empty
+
+def test_equal_products_have_equal_hashes():
+    """
+    Test that products are hashable consistently with __eq__, whatever the precision of their prices.
+    """
+    # Arrange: Two equal products with prices of different precision and a product with another id
+    first = Product(1, "Smartphone Alpha", "Celulares", Price("19.9"), 5)
+    second = Product(1, "Smartphone Alpha", "Celulares", Price("19.90"), 5)
+    other = Product(2, "Smartphone Alpha", "Celulares", Price("19.90"), 5)
+    # Act: Put them in a set
+    products = {first, second, other}
+    # Assert: Check the hashes and the set
+    assert first == second and hash(first) == hash(second)
+    assert products == {first, other} and len(products) == 2
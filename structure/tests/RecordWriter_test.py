@@ -0,0 +1,106 @@
+# Import custom classes
+from ..pipelines.RecordWriter import RecordWriter
+
+# Import necessary libraries
+import importlib.util
+import os
+import pandas as pd
+import pytest
+
+# Records split in two chunks
+chunks = [
+    pd.DataFrame({'id': [1, 2], 'name': ['Ana', 'Bruno']}),
+    pd.DataFrame({'id': [3], 'name': ['Carla']}, index=[2]),
+]
+
+# Test function for the "happy path" scenario
+@pytest.mark.parametrize('format, read', [
+    ('csv', pd.read_csv),
+    ('jsonl', lambda path: pd.read_json(path, lines=True)),
+])
+def test_chunks_are_appended(tmp_path, format, read):
+    """
+    Test that the chunks are appended to a single file with one header.
+    """
+    # Arrange: The path of the file
+    path = os.path.join(tmp_path, f'clients.{format}')
+    # Act: Write both chunks
+    with RecordWriter(path, ['id', 'name'], format) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    # Assert: Check the records and that the temporary file is gone
+    assert read(path).to_dict('list') == {'id': [1, 2, 3], 'name': ['Ana', 'Bruno', 'Carla']}
+    assert writer.rows == 3 and os.listdir(tmp_path) == [f'clients.{format}']
+
+def test_empty_csv_keeps_its_header(tmp_path):
+    """
+    Test that a CSV file without records still has the header.
+    """
+    # Arrange: The path of the file
+    path = os.path.join(tmp_path, 'errors.csv')
+    # Act: Close the writer without writing
+    with RecordWriter(path, ['sheet', 'row']):
+        pass
+    # Assert: Check the header
+    assert open(path, encoding='utf-8').read().strip() == 'sheet,row'
+
+def test_parquet_schema_comes_from_the_column_types(tmp_path):
+    """
+    Test that a Parquet file starting with an empty chunk still takes the records of the next ones.
+    """
+    pytest.importorskip('pyarrow')
+    # Arrange: The path of the file and typed columns
+    path = os.path.join(tmp_path, 'errors.parquet')
+    columns = {'row': 'int64', 'value': 'string', 'date': 'timestamp'}
+    # Act: Write an empty chunk, whose columns have no type of their own, then records
+    with RecordWriter(path, columns, 'parquet') as writer:
+        writer.write(pd.DataFrame(columns=list(columns)))
+        writer.write(pd.DataFrame({'row': [3], 'value': [None], 'date': pd.to_datetime(['2025-01-15'])}))
+        writer.write(pd.DataFrame({'row': [4], 'value': ['abc'], 'date': pd.to_datetime(['2025-02-01'])}))
+    # Assert: Check the records and the types
+    written = pd.read_parquet(path)
+    assert written['row'].tolist() == [3, 4] and written['value'].tolist() == [None, 'abc']
+    assert [str(dtype) for dtype in written.dtypes] == ['int64', 'object', 'datetime64[ns]']
+
+# Test function for the "unhappy path" scenario
+def test_failed_block_keeps_the_previous_file(tmp_path):
+    """
+    Test that a block that raises discards the new records instead of replacing the file.
+    """
+    # Arrange: A file written by a previous run
+    path = os.path.join(tmp_path, 'clients.csv')
+    with RecordWriter(path, ['id', 'name']) as writer:
+        writer.write(chunks[0])
+    # Act: Raise while writing again
+    with pytest.raises(RuntimeError):
+        with RecordWriter(path, ['id', 'name']) as writer:
+            writer.write(chunks[1])
+            raise RuntimeError('interrupted')
+    # Assert: Check that the previous file is intact
+    assert pd.read_csv(path)['id'].tolist() == [1, 2] and os.listdir(tmp_path) == ['clients.csv']
+
+def test_invalid_format_raises_value_error(tmp_path):
+    """
+    Test that an unsupported format is rejected.
+    """
+    # Act & Assert: Check that the writer is not created
+    with pytest.raises(ValueError):
+        RecordWriter(os.path.join(tmp_path, 'clients.xml'), ['id'], 'xml')
+
+def test_invalid_column_type_raises_value_error(tmp_path):
+    """
+    Test that an unsupported column type is rejected.
+    """
+    # Act & Assert: Check that the writer is not created
+    with pytest.raises(ValueError):
+        RecordWriter(os.path.join(tmp_path, 'clients.csv'), {'id': 'float'})
+
+@pytest.mark.skipif(importlib.util.find_spec('pyarrow') is not None, reason='pyarrow is installed')
+def test_parquet_without_pyarrow_raises_import_error(tmp_path):
+    """
+    Test that Parquet files need pyarrow and that no file is created without it.
+    """
+    # Act & Assert: Check the error and the directory
+    with pytest.raises(ImportError, match='pyarrow'):
+        RecordWriter(os.path.join(tmp_path, 'clients.parquet'), ['id'], 'parquet')
+    assert os.listdir(tmp_path) == []
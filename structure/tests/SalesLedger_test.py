@@ -0,0 +1,114 @@
+# Import custom classes
+from ..analytics.SalesLedger import SalesLedger
+from ..models.PriceArray import PriceArray
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..exceptions.DuplicateRecordError import DuplicateRecordError
+
+# Import necessary libraries
+import os
+import pytest
+import pandas as pd
+
+# Sample workbook shipped with the project
+file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
+
+# Small sheets with raw identifiers, an orphan client, an orphan product and a wrong total
+clients = pd.DataFrame({'id_client': ['C001', 'C002'], 'city': ['Recife', 'Salvador'], 'state': ['PE', 'BA']})
+products = pd.DataFrame({'id_product': ['P001', 'P002'], 'category': ['Celulares', 'Notebooks'],
+                         'unit_price': [0.1, 2999.9]})
+sales = pd.DataFrame({
+    'id_sale': ['V001', 'V002', 'V003', 'V004', 'V005'],
+    'sale_date': pd.to_datetime(['2025-01-15', '2025-01-20', '2025-02-01', '2025-02-03', '2025-02-10']),
+    'id_client': ['C001', 'C002', 'C009', 'C001', 'C002'],
+    'id_product': ['P001', 'P002', 'P001', 'P007', 'P002'],
+    'quantity': [3, 1, 1, 1, 2],
+    'total_sales_value': [0.3, 2999.9, 0.1, 10.0, 5000.0],
+})
+
+# Test function for the "happy path" scenario
+@pytest.mark.parametrize("dimension, key", [
+    ('state', 'state'), ('category', 'category'), ('client', 'id_client'), ('product', 'id_product')])
+def test_revenue_matches_merged_groupby(dimension: str, key: str):
+    """
+    Test that the aggregates of the sample workbook match a pandas merge and group-by.
+    """
+    # Arrange: The raw sheets of the workbook
+    sheets = ExcelDataFrameLoader.load_workbook(file_path, ['Sales', 'Clients', 'Products'])
+    merged = (sheets['Sales'].merge(sheets['Clients'], on='id_client')
+              .merge(sheets['Products'], on='id_product'))
+    # Act: Aggregate with the ledger built from the raw sheets
+    ledger = SalesLedger(sheets['Sales'], sheets['Clients'], sheets['Products'])
+    result = ledger.revenue_by(dimension)
+    # Assert: Check the counts and the revenue of every group
+    expected = merged.groupby(key)['total_sales_value'].agg(['size', 'sum'])
+    assert result['sales'].tolist() == expected['size'].tolist()
+    assert result['revenue'].round(2).tolist() == expected['sum'].round(2).tolist()
+    assert ledger.orphans().empty and ledger.total_mismatches().empty
+
+def test_ledger_reports_orphans_and_mismatches():
+    """
+    Test that unresolved references and wrong totals are reported and excluded from the revenue.
+    """
+    # Act: Join the small sheets
+    ledger = SalesLedger(sales, clients, products)
+    orphans = ledger.orphans()
+    mismatches = ledger.total_mismatches()
+    # Assert: Check the reports and the aggregates of the joined sales
+    assert list(zip(orphans['row'], orphans['field'], orphans['value'])) == [
+        (2, 'id_client', 'C009'), (3, 'id_product', 'P007')]
+    assert mismatches[['row', 'rule', 'value', 'expected']].values.tolist() == [[4, 'total_mismatch', 5000.0, 5999.8]]
+    assert str(ledger.total_revenue()) == '8000.20'
+    assert ledger.revenue_by('state')['revenue_cents'].to_dict() == {'BA': 799990, 'PE': 30}
+    assert ledger.revenue_by('month')['sales'].tolist() == [2, 1]
+
+@pytest.mark.parametrize("sheet", [sales.iloc[:0], sales.iloc[2:4]])
+def test_ledger_revenue_without_joined_sales_is_none(sheet: pd.DataFrame):
+    """
+    Test that the revenue of an empty sheet, or of orphan sales only, is None instead of an error or an invalid Price.
+    """
+    # Act: Join the sheet and take its revenue
+    revenue = SalesLedger(sheet, clients, products).total_revenue()
+    # Assert: Check that there is no revenue
+    assert revenue is None
+
+def test_ledger_rounds_ties_like_price_array():
+    """
+    Test that amounts on a half cent are rounded from their decimal form, as PriceArray.from_series does.
+    """
+    # Arrange: A product and a sale priced 1.015, stored as a double slightly below the tie
+    tie_products = products.assign(unit_price=[1.015, 2999.9])
+    tie_sales = sales.iloc[:1].assign(quantity=[1], total_sales_value=[1.015])
+    # Act: Join the sheets
+    ledger = SalesLedger(tie_sales, clients, tie_products)
+    # Assert: Check that 1.015 gives 102 cents on both sides, so the total matches
+    assert PriceArray.from_series(tie_sales['total_sales_value']).cents.tolist() == [102]
+    assert str(ledger.total_revenue()) == '1.02'
+    assert ledger.total_mismatches().empty
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize(
+    "dimension_tables, expected_exception",
+    [
+        # Test 1: Duplicate client id
+        ((pd.concat([clients, clients.iloc[:1]]), products), DuplicateRecordError),
+        # Test 2: Duplicate product id
+        ((clients, pd.concat([products, products.iloc[:1]])), DuplicateRecordError),
+        # Test 3: Missing column
+        ((clients.drop(columns='state'), products), ValueError),
+    ]
+)
+def test_ledger_rejects_invalid_dimension_tables(dimension_tables: tuple, expected_exception: Exception):
+    """
+    Test that ambiguous or incomplete dimension tables are rejected.
+    """
+    # Act & Assert: Attempt to build the ledger and expect an exception
+    with pytest.raises(expected_exception):
+        SalesLedger(sales, *dimension_tables)
+
+def test_ledger_rejects_unknown_dimension():
+    """
+    Test that only the documented dimensions can be aggregated.
+    """
+    # Act & Assert: Attempt to aggregate by an unknown dimension
+    with pytest.raises(ValueError):
+        SalesLedger(sales, clients, products).revenue_by('city')
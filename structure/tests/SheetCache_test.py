@@ -0,0 +1,92 @@
+# Import custom classes
+from ..loaders.SheetCache import SheetCache
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+
+# Import necessary libraries
+import os
+import shutil
+import openpyxl
+import pytest
+
+# Sample workbook shipped with the project
+sample_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
+sheets = ['Clients', 'Products', 'Sales']
+
+@pytest.fixture
+def workbook(tmp_path) -> str:
+    """
+    Copy the sample workbook to a temporary directory so it can be modified.
+    """
+    path = str(tmp_path / 'sales_relatory.xlsx')
+    shutil.copy(sample_path, path)
+    return path
+
+# Test function for the "happy path" scenario
+def test_cache_hit_skips_openpyxl(workbook: str, tmp_path, monkeypatch):
+    """
+    Test that a second load is answered by the cache without opening the workbook.
+    """
+    # Arrange: Fill the cache with a first load
+    cache = SheetCache(str(tmp_path / 'cache'))
+    first = ExcelDataFrameLoader.load_workbook(workbook, sheets, cache=cache)
+    # Act: Forbid openpyxl and load again
+    def forbidden(*args, **kwargs):
+        raise AssertionError("openpyxl must not be used on a cache hit")
+    monkeypatch.setattr(openpyxl, 'load_workbook', forbidden)
+    second = ExcelDataFrameLoader.load_workbook(workbook, sheets, cache=cache)
+    # Assert: Check the counters and the cached content
+    assert (cache.misses, cache.hits) == (3, 3)
+    for sheet in sheets:
+        assert second[sheet].equals(first[sheet])
+    assert ExcelDataFrameLoader.load_data(workbook, 'Sales', cache=cache).equals(first['Sales'])
+
+def test_cache_invalidated_when_source_changes(workbook: str, tmp_path):
+    """
+    Test that modifying the workbook makes the cache miss and replaces the stale entry.
+    """
+    # Arrange: Fill the cache and then change the workbook
+    cache = SheetCache(str(tmp_path / 'cache'))
+    ExcelDataFrameLoader.load_data(workbook, 'Clients', cache=cache)
+    book = openpyxl.load_workbook(workbook)
+    book['Clients']['B2'] = 'Changed'
+    book.save(workbook)
+    # Act: Load the sheet again
+    df = ExcelDataFrameLoader.load_data(workbook, 'Clients', cache=cache)
+    # Assert: Check the fresh content and that only one entry is kept
+    assert df.loc[0, 'name'] == 'Changed'
+    assert cache.hits == 0 and cache.misses == 2
+    assert cache.stats()['entries'] == 1
+
+def test_cache_evicts_least_recently_used(workbook: str, tmp_path):
+    """
+    Test that the cache evicts entries to stay under its size limit.
+    """
+    # Arrange: A cache too small to hold every sheet
+    cache = SheetCache(str(tmp_path / 'cache'), max_bytes=20_000)
+    # Act: Load every sheet
+    ExcelDataFrameLoader.load_workbook(workbook, sheets, cache=cache)
+    # Assert: Check that entries were evicted to respect the limit
+    assert cache.evictions > 0
+    assert cache.stats()['bytes'] <= cache.max_bytes
+
+def test_cache_invalidate(workbook: str, tmp_path):
+    """
+    Test that invalidating a workbook removes its entries.
+    """
+    # Arrange: Fill the cache
+    cache = SheetCache(str(tmp_path / 'cache'))
+    ExcelDataFrameLoader.load_workbook(workbook, sheets, cache=cache)
+    # Act: Invalidate the workbook
+    cache.invalidate(workbook)
+    # Assert: Check that the cache is empty
+    assert cache.stats()['entries'] == 0
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize("max_bytes", [0, -1, 1.5, None])
+def test_cache_invalid_size(tmp_path, max_bytes):
+    """
+    Test that an invalid size limit raises ValueError.
+    """
+    # Act & Assert: Attempt to create the cache and expect an exception
+    with pytest.raises(ValueError):
+        SheetCache(str(tmp_path / 'cache'), max_bytes=max_bytes)
@@ -0,0 +1,81 @@
+# Import custom classes
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..loaders.SheetSchema import ColumnSchema, SheetSchema, SALES_WORKBOOK_SCHEMAS, CLIENTS_SCHEMA
+from ..exceptions.InvalidPathError import InvalidPathError
+
+# Import necessary libraries
+import os
+import pytest
+import pandas as pd
+
+# Sample workbook shipped with the project
+file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
+
+# Test function for the "happy path" scenario
+@pytest.mark.parametrize("sheet", ['Clients', 'Products', 'Sales'])
+def test_schema_types_and_memory(sheet: str):
+    """
+    Test that typed loading applies the declared dtypes and uses less memory than inference.
+    """
+    # Arrange: Schema of the sheet
+    schema = SALES_WORKBOOK_SCHEMAS[sheet]
+    # Act: Load the sheet with and without schema
+    inferred = ExcelDataFrameLoader.load_data(file_path, sheet)
+    typed = ExcelDataFrameLoader.load_data(file_path, sheet, schema=schema)
+    # Assert: Check the dtypes, the parsed identifiers and the memory usage
+    for column in schema.columns:
+        expected = 'category' if column.categorical else column.dtype
+        assert str(typed[column.name].dtype) == expected
+        if column.id_prefix is not None:
+            assert typed[column.name].tolist() == [int(value[1:]) for value in inferred[column.name]]
+    assert typed.memory_usage(deep=True).sum() < inferred.memory_usage(deep=True).sum()
+
+def test_schema_applied_to_streamed_chunks():
+    """
+    Test that chunks streamed with a schema have the same content as typed loading.
+    """
+    # Act: Load the sheet typed at once and in chunks
+    typed = ExcelDataFrameLoader.load_data(file_path, 'Clients', schema=CLIENTS_SCHEMA)
+    chunks = list(ExcelDataFrameLoader.iter_chunks(file_path, 'Clients', chunksize=20, schema=CLIENTS_SCHEMA))
+    # Assert: Check that every chunk is typed and the content matches
+    assert all(str(chunk['state'].dtype) == 'category' for chunk in chunks)
+    assert pd.concat(chunks).astype({'city': object, 'state': object}).equals(
+        typed.astype({'city': object, 'state': object}))
+
+def test_schema_malformed_ids_become_missing():
+    """
+    Test that malformed identifiers are loaded as missing values in a nullable column.
+    """
+    # Arrange: Raw rows with a malformed and a missing identifier
+    raw = pd.DataFrame({'id_client': ['C001', 'X2', None], 'name': ['Ana', 'Bruno', 'Carla'],
+                        'surname': ['Silva'] * 3, 'email': ['a@email.com'] * 3,
+                        'city': ['Recife'] * 3, 'state': ['PE'] * 3})
+    # Act: Apply the schema
+    df = CLIENTS_SCHEMA.apply(raw)
+    # Assert: Check the nullable identifier column
+    assert str(df['id_client'].dtype) == 'Int32'
+    assert df['id_client'].tolist()[0] == 1 and df['id_client'].isna().tolist() == [False, True, True]
+
+@pytest.mark.parametrize("dtype, nullable", [('uint32', 'UInt32'), ('int64', 'Int64'), ('i2', 'Int16'), ('UInt8', 'UInt8')])
+def test_schema_malformed_ids_use_nullable_dtype(dtype: str, nullable: str):
+    """
+    Test that each declared identifier dtype gets its own nullable variant when an identifier is malformed.
+    """
+    # Arrange: Schema of an identifier column with the declared dtype
+    schema = SheetSchema('Sales', (ColumnSchema('id_sale', dtype, id_prefix='V'),))
+    # Act: Apply the schema to a malformed identifier
+    df = schema.apply(pd.DataFrame({'id_sale': ['V7', 'X']}))
+    # Assert: Check the nullable dtype and the values
+    assert str(df['id_sale'].dtype) == nullable
+    assert df['id_sale'].tolist()[0] == 7 and df['id_sale'].isna().tolist() == [False, True]
+
+# Test function for the "unhappy path" scenario
+def test_schema_missing_required_column():
+    """
+    Test that a missing required column raises InvalidPathError when loading.
+    """
+    # Arrange: Schema requiring a column absent from the sheet
+    schema = SheetSchema('Clients', (ColumnSchema('id_client', 'int32', id_prefix='C'), ColumnSchema('phone')))
+    # Act & Assert: Attempt to load and expect an exception
+    with pytest.raises(InvalidPathError):
+        ExcelDataFrameLoader.load_data(file_path, 'Clients', schema=schema)
@@ -0,0 +1,93 @@
+# Import custom classes
+from ..generators.WorkbookGenerator import WorkbookGenerator
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..analytics.SalesLedger import SalesLedger
+from ..models.Client import Client
+from ..models.Product import Product
+
+# Import necessary libraries
+import os
+import pytest
+
+# Test function for the "happy path" scenario
+def test_same_seed_generates_same_rows():
+    """
+    Test that the rows depend only on the seed.
+    """
+    # Arrange: Two generators with the same seed and one with another seed
+    first, second, other = (WorkbookGenerator(clients=50, products=20, seed=seed) for seed in (1, 1, 2))
+    # Act: Generate the rows of every sheet
+    rows = [(list(g.client_rows()), list(g.product_rows()), list(g.sales_rows(200))) for g in (first, second, other)]
+    # Assert: Check the rows and their layout
+    assert rows[0] == rows[1] and rows[0] != rows[2]
+    clients, products, sales = rows[0]
+    assert [len(clients), len(products), len(sales)] == [50, 20, 200]
+    assert clients[0][0] == 'C001' and products[0][0] == 'P001' and sales[0][0] == 'V001'
+
+def test_written_workbook_breaks_the_requested_rules(tmp_path):
+    """
+    Test that the workbook has the sample layout and that the validators find every corrupted row.
+    """
+    # Arrange: A generator corrupting client and product rows
+    generator = WorkbookGenerator(clients=400, products=300, seed=7, invalid={
+        'format': 0.02, 'non_empty_string': 0.03, 'pattern': 0.05, 'valid_state': 0.02,
+        'numeric': 0.02, 'positive': 0.02, 'integer': 0.02, 'non_negative': 0.02})
+    workbook = os.path.join(tmp_path, 'sales.xlsx')
+    # Act: Write the workbook and validate its sheets
+    broken = generator.write(workbook, 1_000)
+    sheets = ExcelDataFrameLoader.load_workbook(workbook)
+    _, clients_report = Client.from_dataframe(sheets['Clients'])
+    _, products_report = Product.from_dataframe(sheets['Products'])
+    # Assert: Check the layout and the rows reported for every rule
+    assert {sheet: tuple(df.columns) for sheet, df in sheets.items()} == WorkbookGenerator.HEADERS
+    assert [len(sheets['Sales']), len(sheets['Clients']), len(sheets['Products'])] == [1_000, 400, 300]
+    assert clients_report.groupby('rule')['row'].nunique().to_dict() == broken['Clients']
+    assert products_report.groupby('rule')['row'].nunique().to_dict() == broken['Products']
+    assert set(broken['Sales']) == {'format'}
+
+def test_sales_reference_generated_rows(tmp_path):
+    """
+    Test that only the corrupted sales are orphans or have a wrong total.
+    """
+    # Arrange: A generator corrupting sale rows only
+    generator = WorkbookGenerator(clients=100, products=50, seed=3, invalid={'orphan': 0.05, 'total_mismatch': 0.05})
+    workbook = os.path.join(tmp_path, 'sales.xlsx')
+    # Act: Write the workbook and join its sheets
+    broken = generator.write(workbook, 2_000)
+    ledger = SalesLedger.from_workbook(workbook)
+    # Assert: Check the orphans and mismatches found by the ledger
+    assert broken['Sales'].keys() == {'orphan', 'total_mismatch'}
+    assert len(ledger.orphans()) == broken['Sales']['orphan']
+    assert len(ledger.total_mismatches()) == broken['Sales']['total_mismatch']
+
+def test_skew_concentrates_sales_on_few_clients():
+    """
+    Test that a higher skew gives the most popular client a larger share of the sales.
+    """
+    # Act: Count the sales of the most popular client with and without skew
+    top = []
+    for skew in (0, 1.5):
+        sales = WorkbookGenerator(clients=200, seed=5, skew=skew).sales_rows(5_000)
+        counts = {}
+        for sale in sales:
+            counts[sale[2]] = counts.get(sale[2], 0) + 1
+        top.append(max(counts.values()))
+    # Assert: Check that the skewed popularity is more concentrated
+    assert top[0] < 100 < top[1]
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize("arguments", [
+    {'clients': 0},
+    {'products': -1},
+    {'skew': -0.5},
+    {'invalid': {'typo': 0.1}},
+    {'invalid': {'pattern': 1.5}},
+    {'invalid': {'pattern': 0.6, 'valid_state': 0.6}},
+])
+def test_invalid_configuration_raises_value_error(arguments: dict):
+    """
+    Test that an impossible configuration is rejected.
+    """
+    # Act & Assert: Attempt to create the generator and expect an exception
+    with pytest.raises(ValueError):
+        WorkbookGenerator(**arguments)
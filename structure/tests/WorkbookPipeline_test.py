@@ -0,0 +1,136 @@
+# Import custom classes
+from ..pipelines.WorkbookPipeline import WorkbookPipeline
+from ..generators.WorkbookGenerator import WorkbookGenerator
+from ..loaders.ExcelDataFrameLoader import ExcelDataFrameLoader
+from ..exceptions.InvalidPathError import InvalidPathError
+from ..models.Client import Client
+
+# Import necessary libraries
+import json
+import os
+import pandas as pd
+import pytest
+
+# Sample workbook shipped with the project, whose emails use the 'email.com' domain
+file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'sales_relatory.xlsx')
+
+# Test function for the "happy path" scenario
+def test_sample_workbook_is_split_into_records_and_errors(tmp_path):
+    """
+    Test that the valid rows become records and the rejected rows are reported, as with whole sheets.
+    """
+    # Arrange: The Clients sheet validated at once
+    clients, report = Client.from_dataframe(ExcelDataFrameLoader.load_data(file_path, 'Clients'), ['email.com'])
+    # Act: Stream the workbook through the pipeline
+    [result] = WorkbookPipeline(str(tmp_path), chunksize=10, valid_domains=['email.com']).run(file_path)
+    # Assert: Check the clients, the errors and the counts
+    written = pd.read_csv(result['outputs']['Clients'])
+    assert written['id_client'].tolist() == [client.id_client_int for client in clients]
+    errors = pd.read_csv(result['outputs']['errors'])
+    assert errors[errors['sheet'] == 'Clients'][['row', 'field', 'rule']].values.tolist() == \
+        report[['row', 'field', 'rule']].values.tolist()
+    sales = result['sheets']['Sales']
+    assert sales['valid'] + sales['rejected'] == sales['rows'] == 2575
+    assert len(pd.read_csv(result['outputs']['Sales'])) == sales['valid']
+    # Sales of the rejected clients reference an invalid client, not a missing one
+    assert set(errors[errors['sheet'] == 'Sales']['rule']) == {'invalid_reference'}
+
+def test_sales_of_rejected_clients_are_not_orphans(tmp_path):
+    """
+    Test that with the default domains, which reject every client of the sample workbook, no sale is reported as an orphan.
+    """
+    # Act: Stream the workbook without the 'email.com' domain
+    [result] = WorkbookPipeline(str(tmp_path)).run(file_path)
+    # Assert: Check that every sale is rejected for its invalid client
+    errors = pd.read_csv(result['outputs']['errors'])
+    sales = errors[errors['sheet'] == 'Sales']
+    assert result['sheets']['Clients']['valid'] == result['sheets']['Sales']['valid'] == 0
+    assert sales.groupby(['field', 'rule'])['row'].nunique().to_dict() == {('id_client', 'invalid_reference'): 2575}
+
+def test_outputs_do_not_depend_on_the_chunk_size(tmp_path):
+    """
+    Test that streaming in small chunks writes the same files as a single chunk.
+    """
+    # Act: Run the pipeline with two chunk sizes
+    outputs = []
+    for chunksize in (7, 10_000):
+        [result] = WorkbookPipeline(os.path.join(tmp_path, str(chunksize)), 'jsonl', chunksize,
+                                    valid_domains=['email.com']).run(file_path)
+        outputs.append({name: open(path, encoding='utf-8').read() for name, path in result['outputs'].items()})
+    # Assert: Check that every file is identical and holds JSON records
+    assert outputs[0] == outputs[1]
+    first = json.loads(outputs[0]['Sales'].splitlines()[0])
+    assert first == {'id_sale': 1, 'sale_date': '2025-01-15T00:00:00.000', 'id_client': 3, 'id_product': 1,
+                     'quantity': 1, 'total_sales_value': '2999.90'}
+
+def test_parquet_outputs_take_rows_after_an_empty_chunk(tmp_path):
+    """
+    Test that a Parquet error file starting with the empty report of valid clients still takes the sales errors.
+    """
+    pytest.importorskip('pyarrow')
+    # Arrange: A generated workbook with valid clients and products and orphan sales
+    workbook = os.path.join(tmp_path, 'generated.xlsx')
+    broken = WorkbookGenerator(clients=20, products=10, seed=3, invalid={'orphan': 0.1}).write(workbook, 200)
+    # Act: Stream the workbook to Parquet and CSV
+    [parquet] = WorkbookPipeline(os.path.join(tmp_path, 'parquet'), 'parquet', 50).run(workbook)
+    [csv] = WorkbookPipeline(os.path.join(tmp_path, 'csv'), 'csv', 50).run(workbook)
+    # Assert: Check that every file holds the records of the CSV files
+    errors = pd.read_parquet(parquet['outputs']['errors'])
+    assert errors['row'].nunique() == broken['Sales']['orphan'] > 0
+    for name, path in parquet['outputs'].items():
+        written, expected = pd.read_parquet(path), pd.read_csv(csv['outputs'][name])
+        assert written.iloc[:, 0].tolist() == expected.iloc[:, 0].tolist()
+
+def test_sales_rules_match_the_corrupted_rows(tmp_path):
+    """
+    Test that orphan sales and wrong totals of a generated workbook are rejected.
+    """
+    # Arrange: A generated workbook with orphan sales and wrong totals
+    workbook = os.path.join(tmp_path, 'generated.xlsx')
+    broken = WorkbookGenerator(clients=60, products=30, seed=3, invalid={'orphan': 0.05, 'total_mismatch': 0.05}).write(workbook, 800)
+    # Act: Stream the workbook through the pipeline
+    [result] = WorkbookPipeline(os.path.join(tmp_path, 'output'), chunksize=100).run(workbook)
+    # Assert: Check the rejected rows of every rule
+    errors = pd.read_csv(result['outputs']['errors'])
+    assert errors.groupby('rule')['row'].nunique().to_dict() == broken['Sales']
+    assert result['sheets']['Sales']['valid'] == 800 - sum(broken['Sales'].values())
+
+def test_workbooks_are_processed_in_parallel(tmp_path):
+    """
+    Test that several workbooks are processed by worker processes into one directory each.
+    """
+    # Arrange: Two generated workbooks
+    generator = WorkbookGenerator(clients=20, products=10, seed=5)
+    for name in ('north', 'south'):
+        generator.write(os.path.join(tmp_path, f'{name}.xlsx'), 100)
+    # Act: Run the pipeline with two workers on the directory
+    results = WorkbookPipeline(os.path.join(tmp_path, 'output'), workers=2).run(str(tmp_path))
+    # Assert: Check the summaries and the files
+    assert [os.path.basename(result['workbook']) for result in results] == ['north.xlsx', 'south.xlsx']
+    for result in results:
+        assert result['sheets']['Sales'] == {'rows': 100, 'valid': 100, 'rejected': 0}
+        assert all(os.path.exists(path) for path in result['outputs'].values())
+    assert 'north.xlsx' in WorkbookPipeline.summary(results)
+
+# Test function for the "unhappy path" scenario
+@pytest.mark.parametrize('options', [{'format': 'xml'}, {'chunksize': 0}, {'workers': -1}, {'chunksize': True}])
+def test_invalid_options_raise_value_error(tmp_path, options):
+    """
+    Test that unsupported formats and non-positive sizes are rejected.
+    """
+    # Act & Assert: Check that the pipeline is not created
+    with pytest.raises(ValueError):
+        WorkbookPipeline(str(tmp_path), **options)
+
+def test_failed_workbook_leaves_no_files(tmp_path):
+    """
+    Test that a workbook without the expected sheets raises and leaves no partial file.
+    """
+    # Arrange: A workbook without Sales sheet
+    workbook = os.path.join(tmp_path, 'partial.xlsx')
+    with pd.ExcelWriter(workbook) as writer:
+        pd.DataFrame({'id_client': ['C001']}).to_excel(writer, sheet_name='Other', index=False)
+    # Act & Assert: Check the error and the output directory
+    with pytest.raises(InvalidPathError):
+        WorkbookPipeline(os.path.join(tmp_path, 'output')).run(workbook)
+    assert os.listdir(os.path.join(tmp_path, 'output', 'partial')) == []